@@ -0,0 +1,174 @@
+# analytics.py - Statistiques agrégées des tâches, calculées colonne par colonne
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .models import STATUSES
+except ImportError:
+    from models import STATUSES
+
+DAY_US = 86_400_000_000  # Un jour en microsecondes
+# Bornes (jours) des classes d'âge des tâches ouvertes ; la dernière classe est illimitée
+AGE_BUCKETS_DAYS = (1, 7, 30, 90)
+# Date de création illisible dans la colonne des dates
+MISSING = -2 ** 63
+
+_CODES = {status: code for code, status in enumerate(STATUSES)}
+_DONE = _CODES["DONE"]
+_EPOCH = date(1970, 1, 1)
+
+class Columns:
+    """Colonnes des tâches : ID, code du statut (indice dans STATUSES) et date de création (µs)
+
+    L'ordre des lignes est sans importance pour les agrégats : une tâche
+    modifiée est réécrite à sa place, une tâche supprimée remplacée par la
+    dernière ligne, si bien que les colonnes se tiennent à jour en temps constant.
+    """
+
+    __slots__ = ("ids", "statuses", "created", "_positions")
+
+    def __init__(self, ids: Iterable[int] = (), statuses: Iterable[str] = (), timestamps: Iterable[Optional[int]] = ()):
+        unknown = len(STATUSES)
+        self.ids = array("q", ids)
+        self.statuses = array("b", [_CODES.get(status, unknown) for status in statuses])
+        self.created = array("q", [MISSING if timestamp is None else timestamp for timestamp in timestamps])
+        # Ligne de chaque ID, calculée à la première mise à jour
+        self._positions: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _position(self, task_id: int) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {row_id: position for position, row_id in enumerate(self.ids)}
+        return self._positions.get(task_id)
+
+    def add(self, task_id: int, status: str, timestamp: Optional[int]):
+        """Ajoute une tâche ou met à jour sa ligne"""
+        code = _CODES.get(status, len(STATUSES))
+        created = MISSING if timestamp is None else timestamp
+        position = self._position(task_id)
+        if position is None:
+            self._positions[task_id] = len(self.ids)
+            self.ids.append(task_id)
+            self.statuses.append(code)
+            self.created.append(created)
+        else:
+            self.statuses[position] = code
+            self.created[position] = created
+
+    def remove(self, task_id: int):
+        """Retire une tâche en déplaçant la dernière ligne à sa place"""
+        position = self._position(task_id)
+        if position is None:
+            return
+        del self._positions[task_id]
+        last_id = self.ids.pop()
+        last_status = self.statuses.pop()
+        last_created = self.created.pop()
+        if last_id != task_id:
+            self.ids[position] = last_id
+            self.statuses[position] = last_status
+            self.created[position] = last_created
+            self._positions[last_id] = position
+
+def load_numpy():
+    """NumPy s'il est installé, pour le calcul vectoriel (import différé : coûteux au démarrage de la CLI)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _bucket_labels() -> List[str]:
+    bounds = (0,) + AGE_BUCKETS_DAYS
+    return [f"{low}-{high}" for low, high in zip(bounds, bounds[1:])] + [f"{AGE_BUCKETS_DAYS[-1]}+"]
+
+def _day_label(day: int) -> str:
+    return (_EPOCH + timedelta(days=day)).isoformat()
+
+def _week_label(monday: int) -> str:
+    year, week, _ = (_EPOCH + timedelta(days=monday)).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _monday(day: int) -> int:
+    """Jour du lundi de la semaine (le 1er janvier 1970 était un jeudi)"""
+    return day - (day + 3) % 7
+
+def _histograms(first_day: int, day_counts: List[int]) -> Dict[str, Dict[str, int]]:
+    """Tâches créées par jour et par semaine ISO, jours et semaines vides compris"""
+    per_day = {}
+    per_week = {}
+    for offset, count in enumerate(day_counts):
+        day = first_day + offset
+        per_day[_day_label(day)] = count
+        week = _week_label(_monday(day))
+        per_week[week] = per_week.get(week, 0) + count
+    return {"created_per_day": per_day, "created_per_week": per_week}
+
+def _ages(count: int, mean: float, median: float, oldest: float, buckets: List[int]) -> Dict:
+    return {
+        "count": count,
+        "mean_days": round(mean, 2),
+        "median_days": round(median, 2),
+        "max_days": round(oldest, 2),
+        "buckets": dict(zip(_bucket_labels(), buckets))
+    }
+
+def _summarize_numpy(numpy, columns: Columns, now: int) -> Dict:
+    codes = numpy.frombuffer(columns.statuses, dtype=numpy.int8)
+    created = numpy.frombuffer(columns.created, dtype=numpy.int64)
+    status_counts = numpy.bincount(codes, minlength=len(STATUSES) + 1)
+
+    known = created != MISSING
+    days = created[known] // DAY_US
+    if len(days):
+        first_day = int(days.min())
+        histograms = _histograms(first_day, numpy.bincount(days - first_day).tolist())
+    else:
+        histograms = _histograms(0, [])
+
+    ages = (now - created[known & (codes != _DONE)]) / DAY_US
+    if len(ages):
+        buckets = numpy.bincount(numpy.searchsorted(AGE_BUCKETS_DAYS, ages, side="right"),
+                                 minlength=len(AGE_BUCKETS_DAYS) + 1)
+        open_ages = _ages(len(ages), float(ages.mean()), float(numpy.median(ages)), float(ages.max()), buckets.tolist())
+    else:
+        open_ages = _ages(0, 0.0, 0.0, 0.0, [0] * (len(AGE_BUCKETS_DAYS) + 1))
+    return {"status_counts": status_counts[:len(STATUSES)].tolist(), "open_ages": open_ages, **histograms}
+
+def _summarize_array(columns: Columns, now: int) -> Dict:
+    # Import différé : statistics charge fractions, decimal et random au démarrage de la CLI
+    import statistics
+
+    status_counts = [columns.statuses.count(code) for code in range(len(STATUSES))]
+
+    day_counts = Counter(timestamp // DAY_US for timestamp in columns.created if timestamp != MISSING)
+    if day_counts:
+        first_day = min(day_counts)
+        histograms = _histograms(first_day, [day_counts.get(day, 0) for day in range(first_day, max(day_counts) + 1)])
+    else:
+        histograms = _histograms(0, [])
+
+    ages = [(now - timestamp) / DAY_US for code, timestamp in zip(columns.statuses, columns.created)
+            if code != _DONE and timestamp != MISSING]
+    if ages:
+        buckets = [0] * (len(AGE_BUCKETS_DAYS) + 1)
+        for age in ages:
+            buckets[bisect_right(AGE_BUCKETS_DAYS, age)] += 1
+        open_ages = _ages(len(ages), sum(ages) / len(ages), statistics.median(ages), max(ages), buckets)
+    else:
+        open_ages = _ages(0, 0.0, 0.0, 0.0, [0] * (len(AGE_BUCKETS_DAYS) + 1))
+    return {"status_counts": status_counts, "open_ages": open_ages, **histograms}
+
+def summarize(columns: Columns, now: int) -> Dict:
+    """Nombre de tâches par statut, créations par jour et par semaine, âge (jours) des tâches
+    non terminées à la date now (µs) ; NumPy si disponible, sinon module array"""
+    numpy = load_numpy()
+    summary = _summarize_array(columns, now) if numpy is None else _summarize_numpy(numpy, columns, now)
+    summary["status_counts"] = dict(zip(STATUSES, summary["status_counts"]))
+    return {"total": len(columns), "engine": "array" if numpy is None else "numpy", **summary}
@@ -0,0 +1,118 @@
+# async_manager.py - Façade asynchrone du gestionnaire de tâches
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, Dict, Optional
+
+try:
+    from .task_manager import TaskManager
+except ImportError:
+    from task_manager import TaskManager
+
+class AsyncTaskManager:
+    """Façade asyncio de TaskManager : le travail s'exécute hors de la boucle d'événements
+
+    Les appels sont exécutés dans un pool de threads sur un TaskManager
+    multi-thread en écriture différée. Chaque mutation est appliquée en
+    mémoire puis attend la sauvegarde groupée qui la couvre : les mutations
+    arrivées pendant une sauvegarde sont toutes persistées par la suivante,
+    en une seule écriture. Le processus est supposé seul rédacteur du stockage.
+    """
+
+    def __init__(self, task_manager: Optional[TaskManager] = None, executor: Optional[Executor] = None, **kwargs):
+        if task_manager is None:
+            task_manager = TaskManager(thread_safe=True, **kwargs)
+        elif not task_manager.thread_safe:
+            raise ValueError("TaskManager must be created with thread_safe=True")
+        task_manager.defer_writes()
+        self.task_manager = task_manager
+        self._executor = executor
+        # Sauvegarde demandée par les mutations non encore persistées, et tâche qui enchaîne les sauvegardes
+        self._next_flush: Optional[asyncio.Future] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # Nombre de sauvegardes ayant écrit des mutations, pour observer le regroupement
+        self.flush_count = 0
+
+    async def _call(self, method: Callable, *args, **kwargs):
+        """Exécute une méthode de TaskManager dans le pool de threads"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(method, *args, **kwargs))
+
+    async def _mutate(self, method: Callable, *args, **kwargs):
+        """Applique une mutation puis attend qu'elle soit persistée"""
+        result = await self._call(method, *args, **kwargs)
+        await self.flush()
+        return result
+
+    async def flush(self):
+        """Attend la sauvegarde groupée qui couvre les mutations déjà appliquées"""
+        if self._next_flush is None:
+            self._next_flush = asyncio.get_running_loop().create_future()
+            if self._flusher is None:
+                self._flusher = asyncio.ensure_future(self._run_flushes())
+        await asyncio.shield(self._next_flush)
+
+    async def _run_flushes(self):
+        """Enchaîne les sauvegardes tant que des mutations en attendent une"""
+        try:
+            while self._next_flush is not None:
+                future, self._next_flush = self._next_flush, None
+                try:
+                    written = await self._call(self.task_manager.flush)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    if written:
+                        self.flush_count += 1
+                    future.set_result(None)
+        finally:
+            self._flusher = None
+
+    async def create_task(self, title: str, description: str = "") -> Dict:
+        """Crée une nouvelle tâche avec validation"""
+        return await self._mutate(self.task_manager.create_task, title, description)
+
+    async def get_task_by_id(self, task_id) -> Dict:
+        """Récupère une tâche par son ID"""
+        return await self._call(self.task_manager.get_task_by_id, task_id)
+
+    async def update_task(self, task_id, title: Optional[str] = None, description: Optional[str] = None) -> Dict:
+        """Met à jour une tâche"""
+        return await self._mutate(self.task_manager.update_task, task_id, title, description)
+
+    async def change_task_status(self, task_id, status: str) -> Dict:
+        """Change le statut d'une tâche"""
+        return await self._mutate(self.task_manager.change_task_status, task_id, status)
+
+    async def delete_task(self, task_id) -> bool:
+        """Supprime une tâche"""
+        return await self._mutate(self.task_manager.delete_task, task_id)
+
+    async def get_tasks(self, page: int = 1, page_size: int = 20, status: Optional[str] = None,
+                        cursor: Optional[str] = None, created_after=None, created_before=None,
+                        sort: Optional[str] = None, order: str = "asc") -> Dict:
+        """Récupère la liste des tâches avec pagination"""
+        return await self._call(self.task_manager.get_tasks, page, page_size, status, cursor,
+                                created_after, created_before, sort, order)
+
+    async def search_tasks(self, query: str = "", page: int = 1, page_size: int = 20,
+                           status: Optional[str] = None, cursor: Optional[str] = None,
+                           created_after=None, created_before=None,
+                           sort: Optional[str] = None, order: str = "asc") -> Dict:
+        """Recherche des tâches par mots-clés"""
+        return await self._call(self.task_manager.search_tasks, query, page, page_size, status, cursor,
+                                created_after, created_before, sort, order)
+    
+    async def search_ranked(self, query: str, page: int = 1, page_size: int = 20,
+                            status: Optional[str] = None, match: str = "all") -> Dict:
+        """Recherche par pertinence"""
+        return await self._call(self.task_manager.search_ranked, query, page, page_size, status, match)
+    
+    async def get_stats(self) -> Dict:
+        """Statistiques du stockage et mesures par opération"""
+        return await self._call(self.task_manager.get_stats)
+    
+    async def get_report(self, now=None) -> Dict:
+        """Synthèse des tâches par statut, date de création et âge"""
+        return await self._call(self.task_manager.get_report, now)
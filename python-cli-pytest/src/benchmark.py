@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# benchmark.py - Mesures de performance de TaskManager sur des stockages synthétiques
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List
+
+try:
+    from .task_manager import TaskManager, create_storage
+except ImportError:
+    from task_manager import TaskManager, create_storage
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+PAGE_SIZE = 20
+HIT_QUERY = "projet"  # Présent dans environ une tâche sur huit
+MISS_QUERY = "introuvable"
+
+_WORDS = ["acheter", "appeler", "préparer", "réunion", "rapport", "client", "courses",
+          "sport", "lecture", "facture", "banque", "jardin"]
+
+def synthetic_tasks(count: int, seed: int = 42) -> List[Dict]:
+    """Génère des tâches réalistes et reproductibles"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    statuses = ["TODO", "ONGOING", "DONE"]
+    tasks = []
+    for task_id in range(1, count + 1):
+        words = rng.sample(_WORDS, 3)
+        if task_id % 8 == 0:
+            words.append(HIT_QUERY)
+        tasks.append({
+            "id": task_id,
+            "title": " ".join(words[:2]).capitalize(),
+            "description": " ".join(words),
+            "status": rng.choice(statuses),
+            "created_at": (start + timedelta(seconds=task_id * 37, microseconds=task_id)).isoformat()
+        })
+    return tasks
+
+def _measure(function: Callable, calls: int) -> Dict:
+    """Exécute une opération plusieurs fois et résume ses durées (ms)"""
+    durations = []
+    for i in range(calls):
+        start = time.perf_counter()
+        function(i)
+        durations.append((time.perf_counter() - start) * 1000)
+    return {
+        "calls": calls,
+        "mean_ms": statistics.mean(durations),
+        "median_ms": statistics.median(durations),
+        "min_ms": min(durations),
+        "max_ms": max(durations)
+    }
+
+def _file_size(path: str) -> int:
+    """Taille du stockage et de ses fichiers annexes (octets)"""
+    directory = os.path.dirname(path) or "."
+    prefix = os.path.basename(path)
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)
+               if name.startswith(prefix) and not name.endswith(".lock"))
+
+def benchmark_size(size: int, directory: str, storage_kind: str = "json", format: str = "json", **options) -> Dict:
+    """Mesure les opérations de TaskManager sur un stockage de size tâches"""
+    path = os.path.join(directory, f"bench_{size}.{storage_kind}")
+    tasks = synthetic_tasks(size)
+    storage = create_storage(storage_kind, path, format=format)
+
+    start = time.perf_counter()
+    storage.save(tasks)
+    save_seconds = time.perf_counter() - start
+    del tasks
+    storage.close()
+
+    # Chargement : durée sans tracemalloc (qui le ralentit), puis mémoire de pointe
+    storage = create_storage(storage_kind, path, format=format)
+    task_manager = TaskManager(storage=storage, **options)
+    load_seconds = task_manager.load_seconds
+    del task_manager
+    storage.close()
+
+    tracemalloc.start()
+    storage = create_storage(storage_kind, path, format=format)
+    task_manager = TaskManager(storage=storage, **options)
+    retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(size)
+    read_calls = 200 if size <= 100_000 else 20
+    scan_calls = 20 if size <= 100_000 else 3
+    write_calls = 20 if size <= 1_000 else 3
+    last_page = (size + PAGE_SIZE - 1) // PAGE_SIZE
+    deep_cursor = task_manager.get_tasks(page=last_page - 1, page_size=PAGE_SIZE)["pagination"]["next_cursor"]
+
+    def cold_search(query: str) -> Callable:
+        def run(_):
+            task_manager.search_cache.clear()
+            task_manager.search_tasks(query, page_size=PAGE_SIZE)
+        return run
+
+    operations = {
+        "get_task_by_id": _measure(lambda _: task_manager.get_task_by_id(rng.randint(1, size)), read_calls),
+        "get_tasks_first_page": _measure(lambda _: task_manager.get_tasks(1, PAGE_SIZE), read_calls),
+        "get_tasks_deep_page": _measure(lambda _: task_manager.get_tasks(last_page, PAGE_SIZE), scan_calls),
+        "get_tasks_deep_cursor": _measure(lambda _: task_manager.get_tasks(page_size=PAGE_SIZE, cursor=deep_cursor),
+                                          scan_calls),
+        "get_tasks_sorted": _measure(lambda _: task_manager.get_tasks(last_page // 2 + 1, PAGE_SIZE, sort="title",
+                                                                      order="desc"), scan_calls),
+        "search_hit": _measure(cold_search(HIT_QUERY), scan_calls),
+        "search_hit_cached": _measure(lambda _: task_manager.search_tasks(HIT_QUERY, page=2, page_size=PAGE_SIZE),
+                                      scan_calls),
+        "search_miss": _measure(cold_search(MISS_QUERY), scan_calls),
+        "search_ranked": _measure(lambda _: task_manager.search_ranked(f"{HIT_QUERY} client", page_size=PAGE_SIZE),
+                                  scan_calls),
+        "get_report": _measure(lambda _: task_manager.get_report(), scan_calls),
+        "create_task": _measure(lambda i: task_manager.create_task(f"Tâche de mesure {i}", "benchmark"),
+                                write_calls),
+        "update_task": _measure(lambda i: task_manager.update_task(rng.randint(1, size), title=f"Modifiée {i}"),
+                                write_calls),
+        "delete_task": _measure(lambda i: task_manager.delete_task(size - i), write_calls),
+    }
+    file_bytes = _file_size(path)
+    storage.close()
+
+    return {
+        "tasks": size,
+        "storage": storage_kind,
+        "format": format,
+        "file_bytes": file_bytes,
+        "save_seconds": save_seconds,
+        "load_seconds": load_seconds,
+        "load_peak_bytes": peak_bytes,
+        "retained_bytes": retained_bytes,
+        "operations": operations
+    }
+
+def run_benchmark(sizes: Iterable[int] = DEFAULT_SIZES, storage_kind: str = "json",
+                  directory: str = None, format: str = "json", **options) -> Dict:
+    """Mesure chaque taille de stockage et retourne un rapport sérialisable en JSON"""
+    with tempfile.TemporaryDirectory(dir=directory) as work_dir:
+        results = [benchmark_size(size, work_dir, storage_kind, format, **options) for size in sizes]
+    return {
+        "created_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "options": options,
+        "results": results
+    }
+
+def write_report(report: Dict, output: str):
+    """Écrit le rapport JSON, à comparer entre deux exécutions"""
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure les performances de TaskManager")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Nombres de tâches, séparés par des virgules")
+    parser.add_argument("--storage", default="json", choices=["json", "stream", "sqlite"])
+    parser.add_argument("--format", default="json", choices=["json", "compact", "binary"],
+                        help="Format du fichier des tâches (moteurs json et stream)")
+    parser.add_argument("--search-index", action="store_true", help="Activer l'index de trigrammes")
+    parser.add_argument("--parallel-search", action="store_true", help="Répartir la recherche sur plusieurs processus")
+    parser.add_argument("--output", default="benchmark_results.json", help="Fichier JSON des résultats")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_benchmark(sizes, args.storage, format=args.format, search_index=args.search_index,
+                           parallel_search=args.parallel_search)
+    write_report(report, args.output)
+    for result in report["results"]:
+        operations = ", ".join(f"{name} {stats['median_ms']:.2f} ms" for name, stats in result["operations"].items())
+        print(f"{result['tasks']} tâches : chargement {result['load_seconds']:.2f} s, "
+              f"pointe {result['load_peak_bytes'] / 1e6:.1f} Mo | {operations}")
+    print(f"Résultats écrits dans {args.output}")
+
+if __name__ == '__main__':
+    main()
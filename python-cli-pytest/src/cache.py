@@ -0,0 +1,178 @@
+# cache.py - Cache des résultats de recherche
+
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+SEARCH_CACHE_ENTRIES = 128  # Nombre maximal de requêtes en cache
+SEARCH_CACHE_BYTES = 8 * 1024 * 1024  # Mémoire maximale (estimée) des listes d'IDs en cache
+
+class SearchCache:
+    """Cache LRU des IDs correspondant à une recherche, borné en entrées et en mémoire
+
+    Les listes sont corrigées à chaque mutation plutôt que vidées : une tâche
+    créée est ajoutée en fin de liste, une tâche supprimée ou qui ne
+    correspond plus en est retirée. Seule une tâche modifiée qui se met à
+    correspondre invalide l'entrée, sa place dans l'ordre d'insertion
+    n'étant pas connue du cache.
+
+    L'ordre d'insertion étant en pratique celui des IDs croissants, la
+    présence d'une tâche dans une liste se vérifie par dichotomie ; une tâche
+    retirée est seulement notée, et la liste compactée à sa lecture suivante.
+    Une liste dont les IDs ne sont pas triés (fichier réordonné) est
+    invalidée à la première mutation.
+    """
+
+    def __init__(self, max_entries: int = SEARCH_CACHE_ENTRIES, max_bytes: int = SEARCH_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # IDs retirés des listes, en attente de compactage à la lecture suivante
+        self._removed: Dict[str, Set[int]] = {}
+        # Entrées dont les IDs ne sont pas triés par ordre croissant
+        self._unsorted: Set[str] = set()
+        self._bytes = 0
+        # Les lectures concurrentes d'un TaskManager multi-thread modifient l'ordre LRU
+        self._mutex = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, query: str) -> bool:
+        with self._mutex:
+            return self.normalize(query) in self._entries
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Clé de cache : la recherche étant insensible à la casse, la requête en minuscules"""
+        return query.lower()
+
+    def _size(self, key: str, task_ids: List[int]) -> int:
+        """Estimation de la mémoire d'une entrée (les IDs sont partagés avec l'index principal)"""
+        removed = self._removed.get(key)
+        return sys.getsizeof(key) + sys.getsizeof(task_ids) + (sys.getsizeof(removed) if removed else 0)
+
+    def get(self, query: str) -> Optional[List[int]]:
+        """Retourne les IDs en cache pour la requête (à ne pas modifier), ou None"""
+        with self._mutex:
+            key = self.normalize(query)
+            task_ids = self._entries.get(key)
+            if task_ids is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            removed = self._removed.pop(key, None)
+            if removed:
+                task_ids = self._entries[key] = [task_id for task_id in task_ids if task_id not in removed]
+                self._resize(key)
+            return task_ids
+
+    def put(self, query: str, task_ids: List[int]):
+        """Met en cache les IDs d'une requête en évinçant les moins récemment utilisées"""
+        with self._mutex:
+            key = self.normalize(query)
+            size = self._size(key, task_ids)
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+            self._discard(key)
+            self._entries[key] = task_ids
+            self._sizes[key] = size
+            if any(previous >= task_id for previous, task_id in zip(task_ids, task_ids[1:])):
+                self._unsorted.add(key)
+            self._bytes += size
+            self._shrink()
+
+    def _contains(self, key: str, task_id: int) -> bool:
+        """Indique si une tâche figure dans une liste triée, hors tâches retirées"""
+        task_ids = self._entries[key]
+        position = bisect_left(task_ids, task_id)
+        return (position < len(task_ids) and task_ids[position] == task_id
+                and task_id not in self._removed.get(key, ()))
+
+    def _mark_removed(self, key: str, task_id: int):
+        self._removed.setdefault(key, set()).add(task_id)
+        self._resize(key)
+
+    def update(self, task_id: int, title: str, description: str, new: bool):
+        """Corrige les entrées après la création (new) ou la modification du titre ou de la description d'une tâche"""
+        with self._mutex:
+            title = title.lower()
+            description = description.lower()
+            for key in list(self._entries):
+                matches = key in title or key in description
+                if key in self._unsorted:
+                    if matches or not new:
+                        self._discard(key)
+                elif new:
+                    if matches:
+                        task_ids = self._entries[key]
+                        if task_ids and task_ids[-1] >= task_id:
+                            # ID inférieur à ceux de la liste : l'ordre croissant serait rompu
+                            self._discard(key)
+                        else:
+                            task_ids.append(task_id)
+                            self._resize(key)
+                elif self._contains(key, task_id):
+                    if not matches:
+                        self._mark_removed(key, task_id)
+                elif matches:
+                    removed = self._removed.get(key)
+                    if removed and task_id in removed:
+                        # Retirée puis correspondant à nouveau : elle retrouve sa place
+                        removed.discard(task_id)
+                        self._resize(key)
+                    else:
+                        self._discard(key)
+            self._shrink()
+
+    def remove(self, task_id: int):
+        """Retire une tâche supprimée des entrées"""
+        with self._mutex:
+            for key in list(self._entries):
+                if key in self._unsorted:
+                    self._discard(key)
+                elif self._contains(key, task_id):
+                    self._mark_removed(key, task_id)
+            self._shrink()
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)"""
+        with self._mutex:
+            self._entries.clear()
+            self._sizes.clear()
+            self._removed.clear()
+            self._unsorted.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs de succès et d'échecs, et occupation du cache"""
+        with self._mutex:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
+
+    def _resize(self, key: str):
+        size = self._size(key, self._entries[key])
+        self._bytes += size - self._sizes[key]
+        self._sizes[key] = size
+
+    def _shrink(self):
+        """Évince les entrées les moins récemment utilisées jusqu'à respecter les limites"""
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str):
+        if key in self._entries:
+            del self._entries[key]
+            self._bytes -= self._sizes.pop(key)
+            self._removed.pop(key, None)
+            self._unsorted.discard(key)
@@ -0,0 +1,109 @@
+# daemon.py - Démon du gestionnaire de tâches sur socket Unix
+
+import json
+import os
+import socket
+from typing import Dict, Optional
+
+SOCKET_SUFFIX = ".sock"
+CLIENT_TIMEOUT = 30.0  # Délai maximal (s) d'attente d'une réponse du démon
+
+# Opérations que la CLI peut transmettre au démon
+FORWARDED_METHODS = (
+    "get_tasks", "create_task", "get_task_by_id", "update_task",
+    "change_task_status", "delete_task", "search_tasks", "search_ranked", "get_stats", "get_report",
+)
+
+def default_socket_path() -> str:
+    """Socket du démon : TASKS_SOCKET, ou le fichier de stockage suivi de .sock"""
+    if os.environ.get("TASKS_SOCKET"):
+        return os.environ["TASKS_SOCKET"]
+    default_file = "tasks.db" if os.environ.get("TASKS_STORAGE") == "sqlite" else "tasks.json"
+    return (os.environ.get("TASKS_FILE") or default_file) + SOCKET_SUFFIX
+
+class DaemonClient:
+    """Client du démon : une requête JSON par ligne, une réponse JSON par ligne"""
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._file = sock.makefile("rwb")
+
+    @classmethod
+    def connect(cls, socket_path: str, timeout: float = CLIENT_TIMEOUT) -> Optional["DaemonClient"]:
+        """Se connecte au démon, ou retourne None s'il ne tourne pas"""
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            # Pas de socket, ou socket laissée par un démon arrêté
+            sock.close()
+            return None
+        return cls(sock)
+
+    def call(self, method: str, *args):
+        """Exécute une opération dans le démon et retourne son résultat"""
+        try:
+            self._file.write(json.dumps({"method": method, "params": args}, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        except OSError as e:
+            raise ValueError(f"Daemon unavailable: {e}")
+        if not line:
+            raise ValueError("Daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+async def _dispatch(manager, line: bytes) -> Dict:
+    """Exécute une requête reçue et construit la réponse"""
+    try:
+        request = json.loads(line)
+        method = request["method"]
+        params = request.get("params", [])
+    except (ValueError, KeyError, TypeError):
+        return {"error": "Invalid request"}
+    if method not in FORWARDED_METHODS or not isinstance(params, list):
+        return {"error": f"Unknown method: {method}"}
+    try:
+        return {"result": await getattr(manager, method)(*params)}
+    except ValueError as e:
+        return {"error": str(e)}
+    except TypeError:
+        return {"error": "Invalid parameters"}
+
+async def serve(manager, socket_path: str):
+    """Sert un AsyncTaskManager sur une socket Unix jusqu'à annulation"""
+    import asyncio
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await _dispatch(manager, line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    if os.path.exists(socket_path):
+        # Socket d'un démon arrêté sans nettoyage
+        os.remove(socket_path)
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
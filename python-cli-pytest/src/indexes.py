@@ -0,0 +1,318 @@
+# indexes.py - Index en mémoire utilisés par le gestionnaire de tâches
+
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+TRIGRAM_SIZE = 3
+
+# Paramètres BM25 : saturation de la fréquence des termes, normalisation par la longueur
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 2.0  # Une occurrence dans le titre compte double par rapport à la description
+
+_TOKEN = re.compile(r"\w+")
+
+def _trigrams(text: str) -> Set[str]:
+    """Découpe un texte en trigrammes"""
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+def fold(text: str) -> str:
+    """Met un texte en minuscules sans accents ("Réunion" -> "reunion")"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+def tokenize(text: str) -> List[str]:
+    """Découpe un texte en mots sans casse ni accents"""
+    return _TOKEN.findall(fold(text))
+
+class TrigramIndex:
+    """Index de trigrammes sur le titre et la description en minuscules"""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._texts: Dict[int, Tuple[str, str]] = {}
+        self._seq: Dict[int, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, task_id: int, title: str, description: str):
+        """Indexe (ou réindexe) une tâche en conservant son rang d'insertion"""
+        texts = (title.lower(), description.lower())
+        if task_id in self._texts:
+            if self._texts[task_id] == texts:
+                return
+            self._unlink(task_id)
+        else:
+            self._seq[task_id] = self._next_seq
+            self._next_seq += 1
+        self._texts[task_id] = texts
+        for trigram in _trigrams(texts[0]) | _trigrams(texts[1]):
+            self._postings[trigram].add(task_id)
+
+    def remove(self, task_id: int):
+        """Retire une tâche de l'index"""
+        if task_id in self._texts:
+            self._unlink(task_id)
+            del self._texts[task_id]
+            del self._seq[task_id]
+
+    def _unlink(self, task_id: int):
+        """Retire une tâche des listes de trigrammes"""
+        title, description = self._texts[task_id]
+        for trigram in _trigrams(title) | _trigrams(description):
+            postings = self._postings[trigram]
+            postings.discard(task_id)
+            if not postings:
+                del self._postings[trigram]
+
+    def search(self, query: str) -> List[int]:
+        """Retourne les IDs dont le titre ou la description contient la requête, dans l'ordre d'insertion"""
+        query_lower = query.lower()
+        query_trigrams = _trigrams(query_lower)
+
+        if not query_trigrams:
+            # Requête trop courte : vérification directe sur les textes déjà en minuscules
+            return [task_id for task_id, (title, description) in self._texts.items()
+                    if query_lower in title or query_lower in description]
+
+        postings = []
+        for trigram in query_trigrams:
+            if trigram not in self._postings:
+                return []
+            postings.append(self._postings[trigram])
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        # Les trigrammes ne font que restreindre : la correspondance exacte reste vérifiée
+        matches = []
+        for task_id in candidates:
+            title, description = self._texts[task_id]
+            if query_lower in title or query_lower in description:
+                matches.append(task_id)
+        matches.sort(key=self._seq.__getitem__)
+        return matches
+
+class InvertedIndex:
+    """Index mot -> tâches sur le titre et la description, avec classement BM25
+
+    Chaque liste d'occurrences associe à une tâche le nombre d'occurrences du
+    mot dans son titre et dans sa description ; le score combine les deux
+    champs (BM25F), le titre étant pondéré par TITLE_WEIGHT.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, Tuple[int, int]]] = defaultdict(dict)
+        # Longueur (en mots) du titre et de la description de chaque tâche
+        self._lengths: Dict[int, Tuple[int, int]] = {}
+        self._terms: Dict[int, Tuple[str, ...]] = {}
+        self._title_words = 0
+        self._description_words = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, task_id: int, title: str, description: str):
+        """Indexe (ou réindexe) une tâche"""
+        self.remove(task_id)
+        title_counts = Counter(tokenize(title))
+        description_counts = Counter(tokenize(description))
+        terms = tuple(title_counts.keys() | description_counts.keys())
+        for term in terms:
+            self._postings[term][task_id] = (title_counts[term], description_counts[term])
+        lengths = (sum(title_counts.values()), sum(description_counts.values()))
+        self._lengths[task_id] = lengths
+        self._terms[task_id] = terms
+        self._title_words += lengths[0]
+        self._description_words += lengths[1]
+
+    def remove(self, task_id: int):
+        """Retire une tâche de l'index"""
+        if task_id not in self._lengths:
+            return
+        for term in self._terms.pop(task_id):
+            postings = self._postings[term]
+            del postings[task_id]
+            if not postings:
+                del self._postings[term]
+        title_length, description_length = self._lengths.pop(task_id)
+        self._title_words -= title_length
+        self._description_words -= description_length
+
+    def search(self, query: str, limit: int, match: str = "all",
+               accept: Optional[Callable[[int], bool]] = None) -> Tuple[int, List[Tuple[int, float]]]:
+        """Retourne le nombre de tâches correspondantes et les limit meilleures (ID, score)
+
+        match vaut "all" (tous les mots de la requête) ou "any" (au moins un) ;
+        accept filtre les IDs candidats. Seules les limit meilleures tâches sont
+        gardées dans un tas, sans trier toutes les correspondances ; à score
+        égal, l'ID le plus petit passe devant.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        postings = [(term, self._postings.get(term)) for term in terms]
+        if match == "all":
+            if not postings or any(entries is None for _, entries in postings):
+                return 0, []
+            smallest = min((entries for _, entries in postings), key=len)
+            candidates = [task_id for task_id in smallest if all(task_id in entries for _, entries in postings)]
+        else:
+            postings = [(term, entries) for term, entries in postings if entries]
+            candidates = set().union(*(entries for _, entries in postings))
+        if accept is not None:
+            candidates = [task_id for task_id in candidates if accept(task_id)]
+        count = len(self._lengths)
+        if not count or not candidates:
+            return 0, []
+
+        average_title = self._title_words / count or 1
+        average_description = self._description_words / count or 1
+        weights = [(entries, math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5)))
+                   for _, entries in postings]
+
+        def score(task_id: int) -> float:
+            title_length, description_length = self._lengths[task_id]
+            title_norm = 1 - BM25_B + BM25_B * title_length / average_title
+            description_norm = 1 - BM25_B + BM25_B * description_length / average_description
+            total = 0.0
+            for entries, idf in weights:
+                frequencies = entries.get(task_id)
+                if frequencies is None:
+                    continue
+                frequency = TITLE_WEIGHT * frequencies[0] / title_norm + frequencies[1] / description_norm
+                total += idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1)
+            return total
+
+        best = heapq.nlargest(limit, ((score(task_id), -task_id) for task_id in candidates))
+        return len(candidates), [(-negative_id, value) for value, negative_id in best]
+
+class StatusIndex:
+    """Index statut -> IDs, avec le nombre de tâches par statut en temps constant"""
+
+    def __init__(self):
+        self._ids: Dict[str, Set[int]] = defaultdict(set)
+        self._status: Dict[int, str] = {}
+        # IDs triés, recalculés après modification du statut
+        self._ordered: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def add(self, task_id: int, status: str):
+        """Indexe une tâche (ou déplace une tâche existante vers son nouveau statut)"""
+        current = self._status.get(task_id)
+        if current == status:
+            return
+        if current is not None:
+            self._ids[current].discard(task_id)
+            self._ordered.pop(current, None)
+        self._ids[status].add(task_id)
+        self._status[task_id] = status
+        self._ordered.pop(status, None)
+
+    def remove(self, task_id: int):
+        """Retire une tâche de l'index"""
+        status = self._status.pop(task_id, None)
+        if status is not None:
+            self._ids[status].discard(task_id)
+            self._ordered.pop(status, None)
+
+    def count(self, status: str) -> int:
+        """Nombre de tâches ayant ce statut"""
+        return len(self._ids.get(status, ()))
+
+    def ids(self, status: str) -> List[int]:
+        """IDs triés des tâches ayant ce statut (ordre d'insertion pour les IDs générés)"""
+        if status not in self._ordered:
+            self._ordered[status] = sorted(self._ids.get(status, ()))
+        return self._ordered[status]
+
+class CreatedIndex:
+    """Index trié (date de création, ID) : une période s'obtient par dichotomie en O(log n + k)"""
+
+    def __init__(self):
+        self._entries: List[Tuple[int, int]] = []
+        self._timestamps: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, task_id: int, timestamp: Optional[int]):
+        """Indexe une tâche (sans effet si sa date est inchangée ou illisible)"""
+        current = self._timestamps.get(task_id)
+        if current == timestamp:
+            return
+        if current is not None:
+            self.remove(task_id)
+        if timestamp is None:
+            return
+        entry = (timestamp, task_id)
+        if not self._entries or entry > self._entries[-1]:
+            # Cas courant : la tâche la plus récente s'ajoute en fin de liste
+            self._entries.append(entry)
+        else:
+            insort(self._entries, entry)
+        self._timestamps[task_id] = timestamp
+
+    def remove(self, task_id: int):
+        """Retire une tâche de l'index"""
+        timestamp = self._timestamps.pop(task_id, None)
+        if timestamp is not None:
+            del self._entries[bisect_left(self._entries, (timestamp, task_id))]
+
+    def ids_between(self, start: Optional[int], end: Optional[int]) -> List[int]:
+        """IDs triés des tâches créées dans [start, end[ (None : non borné)"""
+        low = 0 if start is None else bisect_left(self._entries, (start,))
+        high = len(self._entries) if end is None else bisect_left(self._entries, (end,))
+        # Les dates suivent presque toujours l'ordre des IDs : le tri est quasi linéaire
+        return sorted(task_id for _, task_id in self._entries[low:high])
+
+class SortedView:
+    """Liste (clé de tri, ID) tenue triée par insertion dichotomique
+
+    Se parcourt comme une séquence d'IDs : une page s'obtient par découpage,
+    sans trier toutes les tâches à chaque requête.
+    """
+
+    def __init__(self, keys: Optional[Dict[int, object]] = None):
+        self._keys: Dict[int, object] = dict(keys or {})
+        self._entries: List[Tuple[object, int]] = sorted((value, task_id) for task_id, value in self._keys.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [task_id for _, task_id in self._entries[index]]
+        return self._entries[index][1]
+
+    def __iter__(self) -> Iterator[int]:
+        return (task_id for _, task_id in self._entries)
+
+    def __reversed__(self) -> Iterator[int]:
+        return (task_id for _, task_id in reversed(self._entries))
+
+    def add(self, task_id: int, value):
+        """Place une tâche selon sa clé (sans effet si la clé est inchangée)"""
+        if task_id in self._keys:
+            if self._keys[task_id] == value:
+                return
+            self.remove(task_id)
+        insort(self._entries, (value, task_id))
+        self._keys[task_id] = value
+
+    def remove(self, task_id: int):
+        """Retire une tâche de la vue"""
+        if task_id in self._keys:
+            del self._entries[bisect_left(self._entries, (self._keys.pop(task_id), task_id))]
+
+    def key(self, task_id: int) -> Tuple[object, int]:
+        """Clé complète d'une tâche de la vue, pour trier un sous-ensemble d'IDs"""
+        return self._keys[task_id], task_id
@@ -0,0 +1,105 @@
+# locking.py - Verrous entre processus et entre threads
+
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows : pas de verrou consultatif, les accès concurrents ne sont pas protégés
+    fcntl = None
+
+LOCK_SUFFIX = ".lock"
+
+class FileLock:
+    """Verrou consultatif (flock) sur un fichier .lock, qui porte aussi un numéro de génération
+
+    La génération est incrémentée par chaque écriture : elle signale une
+    modification même quand la date et la taille des fichiers ne changent pas
+    (systèmes de fichiers à résolution grossière, réécriture de même taille).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @contextmanager
+    def hold(self, exclusive: bool = True):
+        """Tient le verrou (exclusif pour écrire, partagé pour lire) pendant le bloc"""
+        fd = None
+        if fcntl is not None:
+            try:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            except OSError:
+                # Répertoire en lecture seule : on continue sans verrou
+                fd = None
+        try:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            if fd is not None:
+                # La fermeture libère le verrou
+                os.close(fd)
+
+    def generation(self) -> int:
+        """Numéro de génération courant (0 si le fichier n'existe pas)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return int(f.read() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        """Incrémente la génération (à appeler sous verrou exclusif)"""
+        generation = self.generation() + 1
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(str(generation))
+        except OSError:
+            pass
+        return generation
+
+class ReadWriteLock:
+    """Verrou lecteurs-rédacteur entre threads : lectures en parallèle, écritures exclusives
+
+    Un rédacteur en attente bloque les nouveaux lecteurs, pour que les
+    écritures ne soient pas affamées par un flux continu de lectures.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """Tient le verrou en lecture pendant le bloc"""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Tient le verrou en écriture pendant le bloc"""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
@@ -1,57 +1,186 @@
 #!/usr/bin/env python3
 
+import time
+
+_START = time.perf_counter()
+
+import builtins
+import json
+import os
+from datetime import datetime, timedelta
+
 import click
-from rich.console import Console
-from rich.table import Table
 
-from task_manager import get_tasks, create_task, get_task_by_id, update_task, change_task_status, delete_task, search_tasks
+from task_manager import get_tasks, create_task, get_task_by_id, update_task, change_task_status, delete_task, search_tasks, search_ranked, create_tasks, get_stats, get_report, create_task_manager, get_task_manager, is_task_manager_loaded, BulkOperationError
+from daemon import DaemonClient, default_socket_path
+
+_IMPORTS_DONE = time.perf_counter()
+
+# Budget de démarrage à froid (ms) vérifié par --profile-startup
+STARTUP_BUDGET_MS = float(os.environ.get("TASKS_STARTUP_BUDGET_MS", "250"))
+
+# Styles Rich utilisés par la CLI, traduits pour click.secho
+STYLES = {
+    "red": {"fg": "red"},
+    "green": {"fg": "green"},
+    "yellow": {"fg": "yellow"},
+    "dim": {"dim": True},
+    "bold blue": {"fg": "blue", "bold": True},
+}
+
+_console = None
+_daemon = None
+
+def get_daemon():
+    """Connexion au démon `serve` s'il tourne (tentée une seule fois par commande)"""
+    global _daemon
+    if _daemon is None:
+        _daemon = DaemonClient.connect(default_socket_path()) or False
+    return _daemon or None
+
+def forward(name: str, function):
+    """Transmet l'opération au démon s'il tourne, sinon l'exécute directement sur le stockage"""
+    def call(*args):
+        daemon = get_daemon()
+        if daemon is None:
+            return function(*args)
+        return daemon.call(name, *args)
+    return call
+
+get_tasks = forward("get_tasks", get_tasks)
+create_task = forward("create_task", create_task)
+get_task_by_id = forward("get_task_by_id", get_task_by_id)
+update_task = forward("update_task", update_task)
+change_task_status = forward("change_task_status", change_task_status)
+delete_task = forward("delete_task", delete_task)
+search_tasks = forward("search_tasks", search_tasks)
+search_ranked = forward("search_ranked", search_ranked)
+get_stats = forward("get_stats", get_stats)
+get_report = forward("get_report", get_report)
+
+def get_console():
+    """Console Rich, importée seulement pour le rendu des tableaux"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def echo(message: str, style: str = None):
+    """Affiche un message simple sans charger Rich"""
+    click.secho(message, **STYLES.get(style, {}))
+
+def print_tasks_table(title: str, tasks):
+    """Affiche une liste de tâches sous forme de tableau"""
+    from rich.table import Table
+    
+    table = Table(title=title)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Statut", style="green")
+    table.add_column("Titre", style="white")
+    table.add_column("Description", style="dim")
+    table.add_column("Créée le", style="magenta")
+    # Recherche classée : score de pertinence de chaque tâche
+    scored = bool(tasks) and "score" in tasks[0]
+    if scored:
+        table.add_column("Score", style="yellow", justify="right")
+    
+    for task in tasks:
+        created_at = task.get("created_at", "")
+        if created_at:
+            created_at = created_at.split("T")[0]
+        
+        row = [
+            str(task["id"]),
+            task['status'],
+            task["title"],
+            task["description"] if task["description"] else "-",
+            created_at
+        ]
+        if scored:
+            row.append(f"{task['score']:.2f}")
+        table.add_row(*row)
+    
+    get_console().print(table)
+
+def format_status_counts(pagination) -> str:
+    """Résume le nombre de tâches par statut pour le pied de page"""
+    return ", ".join(f"{status}: {count}" for status, count in pagination["status_counts"].items())
+
+def print_page_footer(pagination, noun: str):
+    """Affiche le pied de page : position, comptages par statut et curseur suivant"""
+    if "total_tasks" in pagination:
+        echo(f"Total: {pagination['total_tasks']} {noun} | Page {pagination['current_page']}/{pagination['total_pages']} | {format_status_counts(pagination)}", style="dim")
+    else:
+        echo(format_status_counts(pagination), style="dim")
+    if pagination["next_cursor"]:
+        echo(f"Page suivante : --cursor {pagination['next_cursor']}", style="dim")
+
+def report_startup():
+    """Affiche sur stderr la répartition du temps de démarrage"""
+    end = time.perf_counter()
+    imports_ms = (_IMPORTS_DONE - _START) * 1000
+    load_ms = get_task_manager().load_seconds * 1000 if is_task_manager_loaded() else 0.0
+    total_ms = (end - _START) * 1000
+    command_ms = total_ms - imports_ms - load_ms
+    verdict = "OK" if total_ms <= STARTUP_BUDGET_MS else "DÉPASSÉ"
+    click.echo(
+        f"Démarrage : imports {imports_ms:.1f} ms | chargement des tâches {load_ms:.1f} ms | "
+        f"commande {command_ms:.1f} ms | total {total_ms:.1f} ms "
+        f"(budget {STARTUP_BUDGET_MS:.0f} ms : {verdict})",
+        err=True
+    )
 
-console = Console()
+def until_bound(until):
+    """Borne de fin exclue d'une période saisie de manière inclusive (--until)"""
+    if until is None:
+        return None
+    try:
+        moment = datetime.fromisoformat(until)
+    except ValueError:
+        # Date illisible : transmise telle quelle pour que le gestionnaire signale l'erreur
+        return until
+    if len(until) == 10:
+        # Date seule : toute la journée est incluse
+        return (moment + timedelta(days=1)).isoformat()
+    return (moment + timedelta(microseconds=1)).isoformat()
 
 @click.group()
-def cli():
+@click.option('--profile-startup', is_flag=True, help='Afficher le temps de démarrage (imports, chargement, commande)')
+@click.pass_context
+def cli(ctx, profile_startup):
     """Gestionnaire de Tâches - Version CLI Python"""
-    pass
+    if profile_startup:
+        ctx.call_on_close(report_startup)
 
 @cli.command()
 @click.option('--page', '-p', default=1, type=int, help='Numéro de page')
 @click.option('--size', '-s', default=20, type=int, help='Taille de page')
-def list(page, size):
+@click.option('--status', type=click.Choice(['TODO', 'ONGOING', 'DONE']), help='Filtrer par statut')
+@click.option('--cursor', help='Reprendre après la page précédente (curseur affiché en pied de page)')
+@click.option('--since', help='Tâches créées à partir de cette date (YYYY-MM-DD ou YYYY-MM-DDTHH:MM:SS)')
+@click.option('--until', help="Tâches créées jusqu'à cette date incluse (YYYY-MM-DD ou YYYY-MM-DDTHH:MM:SS)")
+@click.option('--sort', type=click.Choice(['id', 'title', 'status', 'created_at']), help="Trier par champ au lieu de l'ordre d'insertion")
+@click.option('--order', type=click.Choice(['asc', 'desc']), default='asc', help='Sens du tri (avec --sort)')
+def list(page, size, status, cursor, since, until, sort, order):
     """Lister les tâches avec pagination"""
     try:
-        result = get_tasks(page, size)
+        result = get_tasks(page, size, status, cursor, since, until_bound(until), sort, order)
         tasks = result["tasks"]
         pagination = result["pagination"]
         
         if not tasks:
-            console.print("Aucune tâche trouvée.", style="yellow")
+            echo("Aucune tâche trouvée.", style="yellow")
             return
         
-        table = Table(title=f"Liste des tâches - Page {pagination['current_page']}/{pagination['total_pages']}")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Statut", style="green")
-        table.add_column("Titre", style="white")
-        table.add_column("Description", style="dim")
-        table.add_column("Créée le", style="magenta")
-        
-        for task in tasks:
-            created_at = task.get("created_at", "")
-            if created_at:
-                created_at = created_at.split("T")[0]
-            
-            table.add_row(
-                str(task["id"]),
-                task['status'],
-                task["title"],
-                task["description"] if task["description"] else "-",
-                created_at
-            )
-        
-        console.print(table)
-        console.print(f"Total: {pagination['total_tasks']} tâches | Page {pagination['current_page']}/{pagination['total_pages']}", style="dim")
+        if cursor is None:
+            print_tasks_table(f"Liste des tâches - Page {pagination['current_page']}/{pagination['total_pages']}", tasks)
+        else:
+            print_tasks_table("Liste des tâches", tasks)
+        print_page_footer(pagination, "tâches")
     
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.option('--title', '-t', required=True, help='Titre de la tâche')
@@ -60,14 +189,14 @@ def create(title, description):
     """Créer une nouvelle tâche"""
     try:
         task = create_task(title, description)
-        console.print(f"✅ Tâche créée avec succès (ID: {task['id']})", style="green")
-        console.print(f"Titre: {task['title']}")
+        echo(f"✅ Tâche créée avec succès (ID: {task['id']})", style="green")
+        echo(f"Titre: {task['title']}")
         if task['description']:
-            console.print(f"Description: {task['description']}")
-        console.print(f"Statut: {task['status']}")
-        console.print(f"Créée le: {task['created_at']}")
+            echo(f"Description: {task['description']}")
+        echo(f"Statut: {task['status']}")
+        echo(f"Créée le: {task['created_at']}")
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -76,14 +205,14 @@ def show(task_id):
     try:
         task = get_task_by_id(task_id)
         
-        console.print(f"[bold cyan]Tâche #{task['id']}[/bold cyan]")
-        console.print(f"Titre: {task['title']}")
-        console.print(f"Description: {task['description'] if task['description'] else 'Aucune description'}")
-        console.print(f"Statut: [green]{task['status']}[/green]")
-        console.print(f"Créée le: {task['created_at']}")
+        click.secho(f"Tâche #{task['id']}", fg="cyan", bold=True)
+        echo(f"Titre: {task['title']}")
+        echo(f"Description: {task['description'] if task['description'] else 'Aucune description'}")
+        click.echo(f"Statut: {click.style(task['status'], fg='green')}")
+        echo(f"Créée le: {task['created_at']}")
         
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -93,16 +222,16 @@ def update(task_id, title, description):
     """Modifier une tâche"""
     try:
         if not title and description is None:
-            console.print("❌ Erreur: Au moins un paramètre (titre ou description) doit être fourni", style="red")
+            echo("❌ Erreur: Au moins un paramètre (titre ou description) doit être fourni", style="red")
             return
         
         updated_task = update_task(task_id, title, description)
-        console.print(f"✅ Tâche {task_id} modifiée avec succès", style="green")
-        console.print(f"Titre: {updated_task['title']}")
-        console.print(f"Description: {updated_task['description']}")
+        echo(f"✅ Tâche {task_id} modifiée avec succès", style="green")
+        echo(f"Titre: {updated_task['title']}")
+        echo(f"Description: {updated_task['description']}")
         
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -111,12 +240,12 @@ def status(task_id, status):
     """Changer le statut d'une tâche"""
     try:
         updated_task = change_task_status(task_id, status)
-        console.print(f"✅ Statut de la tâche {task_id} changé vers {status}", style="green")
-        console.print(f"Titre: {updated_task['title']}")
-        console.print(f"Statut: [green]{updated_task['status']}[/green]")
+        echo(f"✅ Statut de la tâche {task_id} changé vers {status}", style="green")
+        echo(f"Titre: {updated_task['title']}")
+        click.echo(f"Statut: {click.style(updated_task['status'], fg='green')}")
         
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.argument('task_id', type=int)
@@ -125,55 +254,211 @@ def delete(task_id):
     """Supprimer une tâche"""
     try:
         delete_task(task_id)
-        console.print(f"✅ Tâche {task_id} supprimée avec succès", style="green")
+        echo(f"✅ Tâche {task_id} supprimée avec succès", style="green")
         
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 @cli.command()
 @click.argument('query', required=False, default='')
 @click.option('--page', '-p', default=1, type=int, help='Numéro de page')
 @click.option('--size', '-s', default=20, type=int, help='Taille de page')
-def search(query, page, size):
+@click.option('--status', type=click.Choice(['TODO', 'ONGOING', 'DONE']), help='Filtrer par statut')
+@click.option('--cursor', help='Reprendre après la page précédente (curseur affiché en pied de page)')
+@click.option('--ranked', is_flag=True, help='Classer par pertinence (tous les mots, sans casse ni accents)')
+@click.option('--any', 'any_word', is_flag=True, help='Classer par pertinence les tâches contenant au moins un des mots')
+@click.option('--since', help='Tâches créées à partir de cette date (YYYY-MM-DD ou YYYY-MM-DDTHH:MM:SS)')
+@click.option('--until', help="Tâches créées jusqu'à cette date incluse (YYYY-MM-DD ou YYYY-MM-DDTHH:MM:SS)")
+@click.option('--sort', type=click.Choice(['id', 'title', 'status', 'created_at']), help="Trier par champ au lieu de l'ordre d'insertion")
+@click.option('--order', type=click.Choice(['asc', 'desc']), default='asc', help='Sens du tri (avec --sort)')
+def search(query, page, size, status, cursor, ranked, any_word, since, until, sort, order):
     """Rechercher des tâches par mots-clés"""
     try:
         if not query:
             query = click.prompt('Entrez votre recherche', default='', show_default=False)
         
-        result = search_tasks(query, page, size)
+        ranked = ranked or any_word
+        if ranked and cursor is not None:
+            echo("❌ Erreur: --cursor n'est pas disponible avec la recherche classée", style="red")
+            return
+        if ranked and (since is not None or until is not None):
+            echo("❌ Erreur: --since et --until ne sont pas disponibles avec la recherche classée", style="red")
+            return
+        if ranked and sort is not None:
+            echo("❌ Erreur: --sort n'est pas disponible avec la recherche classée (triée par pertinence)", style="red")
+            return
+        
+        if ranked and query:
+            result = search_ranked(query, page, size, status, "any" if any_word else "all")
+        else:
+            result = search_tasks(query, page, size, status, cursor, since, until_bound(until), sort, order)
         tasks = result["tasks"]
         pagination = result["pagination"]
         
         if not tasks:
-            console.print(f"Aucune tâche trouvée pour '{query}'", style="yellow")
+            echo(f"Aucune tâche trouvée pour '{query}'", style="yellow")
             return
         
-        table = Table(title=f"Résultats de recherche pour '{query}' - Page {pagination['current_page']}/{pagination['total_pages']}")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Statut", style="green")
-        table.add_column("Titre", style="white")
-        table.add_column("Description", style="dim")
-        table.add_column("Créée le", style="magenta")
-        
-        for task in tasks:
-            created_at = task.get("created_at", "")
-            if created_at:
-                created_at = created_at.split("T")[0]
-            
-            table.add_row(
-                str(task["id"]),
-                task['status'],
-                task["title"],
-                task["description"] if task["description"] else "-",
-                created_at
-            )
-        
-        console.print(table)
-        console.print(f"Total: {pagination['total_tasks']} résultats | Page {pagination['current_page']}/{pagination['total_pages']}", style="dim")
+        if ranked:
+            print_tasks_table(f"Résultats classés pour '{query}' - Page {pagination['current_page']}/{pagination['total_pages']}", tasks)
+        elif cursor is None:
+            print_tasks_table(f"Résultats de recherche pour '{query}' - Page {pagination['current_page']}/{pagination['total_pages']}", tasks)
+        else:
+            print_tasks_table(f"Résultats de recherche pour '{query}'", tasks)
+        print_page_footer(pagination, "résultats")
+    
+    except ValueError as e:
+        echo(f"❌ Erreur: {str(e)}", style="red")
+
+@cli.command()
+@click.option('--socket', 'socket_path', help='Chemin de la socket (par défaut TASKS_SOCKET, ou le fichier de stockage suivi de .sock)')
+def serve(socket_path):
+    """Lancer le démon : tant qu'il tourne, les autres commandes lui sont transmises"""
+    import asyncio
+    from async_manager import AsyncTaskManager
+    from daemon import serve as serve_daemon
+    
+    socket_path = socket_path or default_socket_path()
+    if DaemonClient.connect(socket_path) is not None:
+        echo(f"❌ Erreur: un démon écoute déjà sur {socket_path}", style="red")
+        return
+    
+    manager = AsyncTaskManager(create_task_manager(thread_safe=True))
+    echo(f"✅ Démon en écoute sur {socket_path} (Ctrl+C pour arrêter)", style="green")
+    try:
+        asyncio.run(serve_daemon(manager, socket_path))
+    except KeyboardInterrupt:
+        echo("Démon arrêté", style="dim")
+
+def format_bytes(size: int) -> str:
+    """Taille lisible (o, Ko, Mo, Go)"""
+    for unit in ("o", "Ko", "Mo"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "o" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} Go"
+
+@cli.command()
+@click.option('--json', 'as_json', is_flag=True, help='Exporter les statistiques au format JSON')
+def stats(as_json):
+    """Afficher la taille du stockage, le nombre de tâches et les mesures par opération"""
+    try:
+        result = get_stats()
+    except ValueError as e:
+        echo(f"❌ Erreur: {str(e)}", style="red")
+        return
+    
+    if as_json:
+        click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    
+    source = "démon" if get_daemon() is not None else "accès direct"
+    click.secho(f"Statistiques ({source})", fg="cyan", bold=True)
+    echo(f"Stockage: {result['storage']['backend']}, {format_bytes(result['storage']['bytes'])}")
+    echo(f"Tâches: {result['tasks']['total']} ({', '.join(f'{status}: {count}' for status, count in result['tasks']['status_counts'].items())})")
+    echo(f"Chargement initial: {result['load_seconds'] * 1000:.1f} ms")
+    
+    operations = result["operations"]
+    if operations is None:
+        echo("Instrumentation désactivée (TASKS_METRICS=1 pour l'activer, de préférence sur le démon `serve`)", style="dim")
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title="Opérations")
+    table.add_column("Opération", style="cyan")
+    table.add_column("Appels", justify="right")
+    table.add_column("Erreurs", justify="right")
+    table.add_column("Moyenne (ms)", justify="right")
+    table.add_column("Max (ms)", justify="right")
+    table.add_column("Octets écrits", justify="right")
+    table.add_column("Latences (≤ ms:appels)", style="dim")
+    
+    for name, operation in operations.items():
+        histogram = " ".join(f"{bound}:{count}" for bound, count in operation["histogram_ms"].items() if count)
+        table.add_row(
+            name,
+            str(operation["calls"]),
+            str(operation["errors"]),
+            f"{operation['mean_ms']:.2f}",
+            f"{operation['max_ms']:.2f}",
+            format_bytes(operation["bytes_written"]) if operation["bytes_written"] else "-",
+            histogram
+        )
+    
+    get_console().print(table)
+
+@cli.command()
+@click.option('--days', default=14, type=int, help='Nombre de jours affichés (créations par jour)')
+@click.option('--weeks', default=8, type=int, help='Nombre de semaines affichées (créations par semaine)')
+@click.option('--json', 'as_json', is_flag=True, help='Exporter le rapport complet au format JSON')
+def report(days, weeks, as_json):
+    """Afficher la synthèse des tâches : statuts, créations par jour et par semaine, âge des tâches ouvertes"""
+    try:
+        result = get_report()
+    except ValueError as e:
+        echo(f"❌ Erreur: {str(e)}", style="red")
+        return
+    
+    if as_json:
+        click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    
+    from rich.table import Table
+    
+    click.secho(f"Rapport des tâches (calculé en {result['seconds'] * 1000:.1f} ms, {result['engine']})", fg="cyan", bold=True)
+    echo(f"Tâches: {result['total']} ({', '.join(f'{status}: {count}' for status, count in result['status_counts'].items())})")
+    
+    ages = result["open_ages"]
+    if ages["count"]:
+        echo(f"Tâches ouvertes: {ages['count']}, âge moyen {ages['mean_days']:.1f} j, "
+             f"médian {ages['median_days']:.1f} j, maximum {ages['max_days']:.1f} j")
+        table = Table(title="Âge des tâches ouvertes")
+        table.add_column("Jours", style="cyan")
+        table.add_column("Tâches", justify="right")
+        for bucket, count in ages["buckets"].items():
+            table.add_row(bucket, str(count))
+        get_console().print(table)
+    
+    for key, title, column, limit in (("created_per_day", "Créations par jour", "Jour", days),
+                                      ("created_per_week", "Créations par semaine", "Semaine", weeks)):
+        counts = builtins.list(result[key].items())[-limit:] if limit > 0 else []
+        if not counts:
+            continue
+        table = Table(title=title)
+        table.add_column(column, style="cyan")
+        table.add_column("Tâches", justify="right")
+        for label, count in counts:
+            table.add_row(label, str(count))
+        get_console().print(table)
+
+@cli.command(name='import')
+@click.argument('file', type=click.File('r', encoding='utf-8'))
+def import_tasks(file):
+    """Importer des tâches depuis un fichier JSON (liste de {"title", "description"})"""
+    try:
+        items = json.load(file)
+    except json.JSONDecodeError as e:
+        echo(f"❌ Erreur: fichier JSON invalide ({e})", style="red")
+        return
+    
+    # "list" désigne ici la commande Click, d'où le recours à builtins
+    if not isinstance(items, builtins.list):
+        echo("❌ Erreur: le fichier doit contenir une liste de tâches", style="red")
+        return
+    
+    try:
+        tasks = create_tasks(items)
+        echo(f"✅ {len(tasks)} tâches importées avec succès", style="green")
+    
+    except BulkOperationError as e:
+        echo(f"❌ Erreur: aucune tâche importée, {len(e.errors)} élément(s) invalide(s)", style="red")
+        for index, message in e.errors:
+            echo(f"  Élément {index + 1}: {message}", style="red")
     
     except ValueError as e:
-        console.print(f"❌ Erreur: {str(e)}", style="red")
+        echo(f"❌ Erreur: {str(e)}", style="red")
 
 if __name__ == '__main__':
-    console.print("Gestionnaire de Tâches - Version CLI Python\n", style="bold blue")
+    echo("Gestionnaire de Tâches - Version CLI Python\n", style="bold blue")
     cli()
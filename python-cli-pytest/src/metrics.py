@@ -0,0 +1,74 @@
+# metrics.py - Instrumentation des opérations du gestionnaire de tâches
+
+import json
+import threading
+from bisect import bisect_left
+from typing import Dict, List
+
+# Bornes supérieures (ms) des classes de l'histogramme des latences ; la dernière classe est illimitée
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+class _OperationStats:
+    """Compteurs d'une opération"""
+
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "bytes_written", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_written = 0
+        self.buckets: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+class Metrics:
+    """Nombre d'appels, histogramme des latences et octets écrits, par opération
+
+    Les enregistrements sont protégés par un verrou : plusieurs lectures
+    peuvent être mesurées en parallèle en mode multi-thread.
+    """
+
+    def __init__(self):
+        self._operations: Dict[str, _OperationStats] = {}
+        self._mutex = threading.Lock()
+
+    def record(self, name: str, seconds: float, bytes_written: int = 0, error: bool = False):
+        """Enregistre un appel de l'opération name"""
+        bucket = bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._mutex:
+            stats = self._operations.get(name)
+            if stats is None:
+                stats = self._operations[name] = _OperationStats()
+            stats.calls += 1
+            stats.errors += error
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bytes_written += bytes_written
+            stats.buckets[bucket] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Copie sérialisable des compteurs, triée par nom d'opération"""
+        labels = [str(bound) for bound in LATENCY_BUCKETS_MS] + ["+inf"]
+        with self._mutex:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "total_ms": stats.total_seconds * 1000,
+                    "mean_ms": stats.total_seconds * 1000 / stats.calls,
+                    "max_ms": stats.max_seconds * 1000,
+                    "bytes_written": stats.bytes_written,
+                    # Nombre d'appels dont la durée est inférieure ou égale à chaque borne (ms)
+                    "histogram_ms": dict(zip(labels, stats.buckets))
+                }
+                for name, stats in sorted(self._operations.items())
+            }
+
+    def to_json(self) -> str:
+        """Export JSON des compteurs"""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def reset(self):
+        """Remet tous les compteurs à zéro"""
+        with self._mutex:
+            self._operations.clear()
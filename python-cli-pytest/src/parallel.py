@@ -0,0 +1,183 @@
+# parallel.py - Recherche par sous-chaîne répartie sur plusieurs processus
+
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from array import array
+from bisect import bisect_right
+from contextlib import suppress
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+PARALLEL_CHUNK_SIZE = 50_000  # Nombre de tâches par tranche
+PARALLEL_THRESHOLD = 200_000  # En dessous, la recherche séquentielle est plus rapide
+
+_HEADER = 8  # Nombre de tâches de la tranche (entier 64 bits)
+
+def encode_chunk(texts: Iterable[Tuple[str, str]]) -> bytes:
+    """Encode une tranche : nombre de tâches, positions de début de chaque champ, puis
+    titres et descriptions en minuscules (UTF-8), chacun suivi d'un octet nul"""
+    starts = array("q", [0])
+    parts = []
+    offset = 0
+    for title, description in texts:
+        for text in (title.lower(), description.lower()):
+            data = text.encode("utf-8") + b"\0"
+            parts.append(data)
+            offset += len(data)
+            starts.append(offset)
+    count = (len(starts) - 1) // 2
+    return count.to_bytes(_HEADER, "little") + starts.tobytes() + b"".join(parts)
+
+# Tranches déjà ouvertes par le processus de travail : index -> (chemin, fichier projeté, positions, début du texte)
+_opened: Dict[int, Tuple[str, mmap.mmap, array, int]] = {}
+
+def _open_chunk(index: int, path: str) -> Tuple[mmap.mmap, array, int]:
+    """Projette une tranche en mémoire, une seule fois par version"""
+    chunk = _opened.get(index)
+    if chunk is not None and chunk[0] == path:
+        return chunk[1:]
+    if chunk is not None:
+        chunk[1].close()
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    count = int.from_bytes(data[:_HEADER], "little")
+    base = _HEADER + 8 * (2 * count + 1)
+    starts = array("q", data[_HEADER:base])
+    _opened[index] = (path, data, starts, base)
+    return data, starts, base
+
+def search_chunk(index: int, path: str, needle: bytes) -> List[int]:
+    """Positions, dans la tranche, des tâches dont le titre ou la description contient needle"""
+    data, starts, base = _open_chunk(index, path)
+    positions = []
+    found = data.find(needle, base)
+    while found >= 0:
+        offset = found - base
+        field = bisect_right(starts, offset) - 1
+        # Le champ se termine par un octet nul : une occurrence qui le déborde est ignorée
+        if offset + len(needle) < starts[field + 1]:
+            position = field // 2
+            positions.append(position)
+            found = data.find(needle, base + starts[2 * position + 2])
+        else:
+            found = data.find(needle, found + 1)
+    return positions
+
+class ParallelSearch:
+    """Tranches de tâches partagées avec un groupe de processus pour la recherche par sous-chaîne
+
+    Chaque tranche est écrite une fois dans un fichier temporaire que les
+    processus projettent en mémoire (mmap) et gardent ouvert d'une requête à
+    l'autre : seule la requête leur est transmise. Une mutation ne réécrit que
+    la tranche de la tâche concernée, à la recherche suivante. Les tranches
+    suivent l'ordre d'insertion, si bien que les résultats fusionnés le
+    conservent.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = PARALLEL_CHUNK_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._chunks: List[List[int]] = []
+        self._chunk_of: Dict[int, int] = {}
+        self._paths: List[Optional[str]] = []
+        self._dirty: Set[int] = set()
+        self._version = 0
+        self._directory: Optional[str] = None
+        # ProcessPoolExecutor, démarré à la première recherche
+        self._pool = None
+        self._mutex = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._chunk_of)
+
+    def clear(self):
+        """Oublie toutes les tâches (les fichiers sont réécrits à la recherche suivante)"""
+        self._chunks = []
+        self._chunk_of = {}
+        self._dirty = set(range(len(self._paths)))
+
+    def add(self, task_id: int):
+        """Ajoute une tâche en fin de dernière tranche, ou marque sa tranche comme modifiée"""
+        index = self._chunk_of.get(task_id)
+        if index is None:
+            if not self._chunks or len(self._chunks[-1]) >= self.chunk_size:
+                self._chunks.append([])
+            index = len(self._chunks) - 1
+            self._chunks[index].append(task_id)
+            self._chunk_of[task_id] = index
+        self._dirty.add(index)
+
+    def remove(self, task_id: int):
+        """Retire une tâche de sa tranche"""
+        index = self._chunk_of.pop(task_id, None)
+        if index is not None:
+            self._chunks[index].remove(task_id)
+            self._dirty.add(index)
+
+    def _publish(self, tasks: Mapping):
+        """Réécrit les tranches modifiées depuis la dernière recherche"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="tasks-search-")
+            weakref.finalize(self, shutil.rmtree, self._directory, True)
+        self._paths += [None] * (len(self._chunks) - len(self._paths))
+        self._version += 1
+        for index in sorted(self._dirty):
+            old = self._paths[index]
+            path = None
+            if index < len(self._chunks) and self._chunks[index]:
+                path = os.path.join(self._directory, f"chunk-{index}-{self._version}.bin")
+                chunk_tasks = (tasks[task_id] for task_id in self._chunks[index])
+                with open(path, "wb") as f:
+                    f.write(encode_chunk((task.title, task.description) for task in chunk_tasks))
+            self._paths[index] = path
+            if old is not None:
+                # Les processus qui projettent encore l'ancienne version la gardent lisible
+                with suppress(OSError):
+                    os.remove(old)
+        self._dirty.clear()
+
+    def _executor(self):
+        if self._pool is None:
+            # Import différé : multiprocessing alourdit le démarrage de la CLI quand la recherche parallèle est désactivée
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Processus lancés par un serveur dédié plutôt que par fork : un fork hériterait
+            # du verrou partagé du fichier de données, tenu pendant la recherche, et bloquerait
+            # indéfiniment les écritures suivantes
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+            weakref.finalize(self, self._pool.shutdown, wait=False, cancel_futures=True)
+        return self._pool
+
+    def search(self, query: str, tasks: Mapping) -> List[int]:
+        """IDs des tâches dont le titre ou la description contient la requête, dans l'ordre d'insertion
+
+        tasks associe chaque ID à sa tâche (attributs title et description),
+        pour réécrire les tranches modifiées.
+        """
+        needle = query.lower().encode("utf-8")
+        with self._mutex:
+            self._publish(tasks)
+            pool = self._executor()
+            futures = [(index, pool.submit(search_chunk, index, path, needle))
+                       for index, path in enumerate(self._paths) if path is not None]
+            task_ids = []
+            for index, future in futures:
+                chunk = self._chunks[index]
+                task_ids.extend(chunk[position] for position in future.result())
+        return task_ids
+
+    def close(self):
+        """Arrête les processus et supprime les fichiers des tranches"""
+        with self._mutex:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+            if self._directory is not None:
+                shutil.rmtree(self._directory, ignore_errors=True)
+                self._directory = None
+                self._paths = []
+                self._dirty = set(range(len(self._chunks)))
@@ -0,0 +1,142 @@
+# serialization.py - Formats de fichier des tâches (JSON indenté, JSON compact, binaire)
+
+import io
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List
+
+try:
+    # Bibliothèque JSON plus rapide, utilisée si elle est installée
+    import orjson
+except ImportError:
+    orjson = None
+
+FORMATS = ("json", "compact", "binary")
+
+# Signature en tête des fichiers binaires ; les fichiers JSON commencent par "["
+BINARY_MAGIC = b"TASKS\x02\n"
+BINARY_BLOCK_SIZE = 4096  # Nombre de tâches par bloc binaire
+# Champs texte, stockés colonne par colonne dans chaque bloc
+_TEXT_FIELDS = ("title", "description", "status", "created_at")
+_SIZE = struct.Struct("<I")
+
+def validate_format(format: str) -> str:
+    """Vérifie qu'un format de fichier est connu"""
+    if format not in FORMATS:
+        raise ValueError("Invalid format. Allowed values: json, compact, binary")
+    return format
+
+def dumps(value, indent: bool = False) -> bytes:
+    """Sérialise en JSON UTF-8 (caractères non ASCII conservés), indenté ou compact"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def loads(data: bytes):
+    """Désérialise du JSON UTF-8 ; lève ValueError s'il est invalide"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _little_endian(values: array) -> bytes:
+    """Octets d'un tableau en petit-boutiste, quelle que soit la machine"""
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def encode_block(tasks: List[Dict]) -> bytes:
+    """Encode un bloc binaire : nombre de tâches, IDs, puis pour chaque champ texte
+    la taille du bloc de texte, la longueur (en caractères) de chaque valeur et
+    leurs valeurs UTF-8 mises bout à bout"""
+    parts = [_SIZE.pack(len(tasks)), _little_endian(array("q", [task["id"] for task in tasks]))]
+    for name in _TEXT_FIELDS:
+        values = [task[name] for task in tasks]
+        text = "".join(values).encode("utf-8")
+        parts += [_SIZE.pack(len(text)), _little_endian(array("I", map(len, values))), text]
+    return b"".join(parts)
+
+def encode_tasks(tasks: Iterable[Dict], format: str) -> Iterator[bytes]:
+    """Produit le contenu d'un fichier de tâches par morceaux, dans le format demandé"""
+    if format == "binary":
+        yield BINARY_MAGIC
+        tasks = iter(tasks)
+        while True:
+            block = list(islice(tasks, BINARY_BLOCK_SIZE))
+            if not block:
+                return
+            yield encode_block(block)
+    elif format == "compact":
+        yield b"["
+        separator = b""
+        for task in tasks:
+            yield separator + dumps(task)
+            separator = b","
+        yield b"]"
+    else:
+        # Même rendu que json.dump(tasks, indent=2), tâche par tâche
+        yield b"["
+        separator = b"\n  "
+        for task in tasks:
+            yield separator + dumps(task, indent=True).replace(b"\n", b"\n  ")
+            separator = b",\n  "
+        yield b"\n]" if separator != b"\n  " else b"]"
+
+def encode_all(tasks: List[Dict], format: str) -> bytes:
+    """Contenu complet d'un fichier de tâches, sérialisé en une seule passe"""
+    if format == "binary":
+        return b"".join(encode_tasks(tasks, format))
+    return dumps(tasks, indent=format == "json")
+
+def _read(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary block")
+    return data
+
+def iter_binary_blocks(f: BinaryIO) -> Iterator[List[Dict]]:
+    """Parcourt les blocs d'un fichier binaire (signature déjà lue), un bloc en mémoire à la fois"""
+    while True:
+        header = f.read(_SIZE.size)
+        if not header:
+            return
+        if len(header) != _SIZE.size:
+            raise ValueError("Truncated binary block")
+        (count,) = _SIZE.unpack(header)
+        ids = _from_little_endian("q", _read(f, 8 * count))
+        columns = []
+        for _ in _TEXT_FIELDS:
+            (size,) = _SIZE.unpack(_read(f, _SIZE.size))
+            bounds = list(accumulate(_from_little_endian("I", _read(f, 4 * count)), initial=0))
+            text = _read(f, size).decode("utf-8")
+            if bounds[-1] != len(text):
+                raise ValueError("Corrupted binary block")
+            columns.append([text[start:end] for start, end in zip(bounds, islice(bounds, 1, None))])
+        yield [{"id": task_id, "title": title, "description": description, "status": status, "created_at": created_at}
+               for task_id, title, description, status, created_at in zip(ids, *columns)]
+
+def iter_binary_records(f: BinaryIO) -> Iterator[Dict]:
+    """Parcourt les tâches d'un fichier binaire (signature déjà lue) sans le charger entièrement"""
+    for block in iter_binary_blocks(f):
+        yield from block
+
+def decode_tasks(data: bytes) -> List[Dict]:
+    """Décode un fichier de tâches complet, quel que soit son format (détecté par sa signature)"""
+    if not data.startswith(BINARY_MAGIC):
+        return loads(data)
+    f = io.BytesIO(data)
+    f.seek(len(BINARY_MAGIC))
+    tasks = []
+    for block in iter_binary_blocks(f):
+        tasks.extend(block)
+    return tasks
@@ -0,0 +1,720 @@
+# storage.py - Moteurs de stockage du gestionnaire de tâches
+
+import heapq
+import io
+import json
+import os
+from collections import Counter
+from contextlib import nullcontext, suppress
+from itertools import islice
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .locking import LOCK_SUFFIX, FileLock
+    from .models import SORT_KEYS, STATUSES, CreatedRange, Task, in_created_range, timestamp_of, _to_iso
+    from .serialization import BINARY_MAGIC, decode_tasks, encode_all, encode_tasks, iter_binary_records, validate_format
+except ImportError:
+    from locking import LOCK_SUFFIX, FileLock
+    from models import SORT_KEYS, STATUSES, CreatedRange, Task, in_created_range, timestamp_of, _to_iso
+    from serialization import BINARY_MAGIC, decode_tasks, encode_all, encode_tasks, iter_binary_records, validate_format
+
+JOURNAL_SUFFIX = ".journal"
+TEMP_SUFFIX = ".tmp"
+COMPACT_THRESHOLD = 1024 * 1024  # Taille du journal (octets) déclenchant la compaction
+STREAM_CHUNK_SIZE = 64 * 1024  # Taille des blocs lus par le chargement en flux
+
+# Une mutation : ("put", tâche) pour une création/modification, ("delete", tâche) pour une suppression
+Change = Tuple[str, Dict]
+
+def iter_json_array(f, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator:
+    """Parcourt un tableau JSON élément par élément sans charger tout le fichier"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                if started:
+                    raise json.JSONDecodeError("Unterminated array", buffer, pos)
+                return
+            buffer = f.read(chunk_size)
+            pos = 0
+            eof = not buffer
+            continue
+        if not started:
+            if buffer[pos] != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, pos)
+            started = True
+            pos += 1
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # Élément coupé par la fin du bloc : on complète le tampon
+            more = f.read(chunk_size)
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+            continue
+        yield item
+        pos = end
+
+class StorageError(ValueError):
+    """Lecture ou écriture du stockage impossible (fichier illisible, corrompu ou disque plein)"""
+
+def _fsync_directory(path: str):
+    """Rend durable le renommage d'un fichier dans son répertoire (POSIX uniquement)"""
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _trim_torn_record(f):
+    """Retire la fin d'un journal qui ne se termine pas par un saut de ligne (enregistrement
+    tronqué par un arrêt brutal ou un disque plein), pour que les ajouts suivants restent lisibles"""
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    position = end
+    while position > 0:
+        start = max(position - 4096, 0)
+        f.seek(start)
+        newline = f.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            position = start + newline + 1
+            break
+        position = start
+    f.truncate(position)
+
+def write_atomic(path: str, chunks: Iterable[bytes], durable: bool = True) -> int:
+    """Écrit un fichier par un fichier temporaire renommé et retourne sa taille
+
+    Le fichier contient l'ancien ou le nouveau contenu, jamais un mélange des
+    deux, même après un arrêt brutal ; avec durable, les données et le
+    renommage sont forcés sur disque (fsync) avant le retour.
+    """
+    temp_file = path + TEMP_SUFFIX
+    try:
+        with open(temp_file, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            size = f.tell()
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file, path)
+        if durable:
+            _fsync_directory(path)
+    except BaseException as e:
+        with suppress(OSError):
+            os.remove(temp_file)
+        if isinstance(e, OSError):
+            raise StorageError(f"Could not save tasks: {e}") from e
+        raise
+    return size
+
+def _matches(task: Dict, query_lower: str) -> bool:
+    """Vérifie qu'une tâche contient la requête (déjà en minuscules)"""
+    return query_lower in task["title"].lower() or query_lower in task["description"].lower()
+
+class StorageBackend:
+    """Interface commune des moteurs de stockage
+
+    Un moteur « en mémoire » (in_memory = True) se contente de charger et de
+    persister les tâches : TaskManager les garde toutes en mémoire et répond
+    lui-même aux requêtes. Un moteur interrogeable (in_memory = False) répond
+    directement aux lectures (get, count, page) sans matérialiser le stockage.
+    """
+
+    in_memory = True
+    # Octets écrits depuis la création du moteur (fichiers JSON et journal)
+    bytes_written = 0
+
+    def load(self) -> List[Dict]:
+        """Charge toutes les tâches dans l'ordre d'insertion"""
+        raise NotImplementedError
+
+    def save(self, tasks: List[Dict]):
+        """Remplace le contenu du stockage par les tâches fournies"""
+        raise NotImplementedError
+
+    def apply(self, changes: List[Change], snapshot: Callable[[], List[Dict]]):
+        """Persiste un lot de mutations ; snapshot fournit l'état complet si nécessaire"""
+        self.save(snapshot())
+
+    def close(self):
+        """Libère les ressources du moteur"""
+
+    def size(self) -> int:
+        """Taille du stockage sur disque (octets)"""
+        return 0
+
+    def begin(self):
+        """Ouvre une transaction : les écritures suivantes ne sont validées qu'au commit"""
+
+    def commit(self):
+        """Valide la transaction en cours"""
+
+    def rollback(self):
+        """Annule la transaction en cours"""
+
+    # Accès concurrents entre processus
+
+    def lock(self, exclusive: bool = True) -> ContextManager:
+        """Verrou inter-processus autour d'une lecture-modification-écriture"""
+        return nullcontext()
+
+    def signature(self) -> Tuple:
+        """Identifie l'état persistant pour détecter les modifications d'autres processus"""
+        return ()
+
+    def mark_changed(self):
+        """Signale une écriture aux autres processus (sous verrou exclusif)"""
+
+    # Lectures des moteurs interrogeables
+
+    def get(self, task_id: int) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def max_id(self) -> int:
+        raise NotImplementedError
+
+    # Les lectures filtrent par requête, statut et période de création (created_range)
+
+    def count(self, query: str = "", status: Optional[str] = None,
+              created_range: Optional[CreatedRange] = None) -> int:
+        raise NotImplementedError
+
+    def page(self, offset: int, limit: int, query: str = "", status: Optional[str] = None,
+             created_range: Optional[CreatedRange] = None, sort: Optional[str] = None,
+             order: str = "asc") -> List[Dict]:
+        """Page des tâches dans l'ordre d'insertion, ou triées selon sort (voir models.SORT_FIELDS)"""
+        raise NotImplementedError
+
+    def page_after(self, after_id: int, limit: int, query: str = "", status: Optional[str] = None,
+                   created_range: Optional[CreatedRange] = None) -> List[Dict]:
+        """Tâches d'ID supérieur à after_id, par ID croissant (pagination par curseur)"""
+        raise NotImplementedError
+
+    def status_counts(self) -> Dict[str, int]:
+        """Nombre de tâches par statut présent dans le stockage"""
+        raise NotImplementedError
+
+    def report_rows(self) -> Iterable[Tuple[int, str, str]]:
+        """(ID, statut, date de création) de chaque tâche, sans titre ni description, dans un ordre quelconque"""
+        return ((task["id"], task["status"], task["created_at"]) for task in self.load())
+
+class JsonStorage(StorageBackend):
+    """Stockage dans un fichier JSON, avec journal d'ajouts optionnel
+
+    Le format d'écriture (format) est "json" (indenté, par défaut), "compact"
+    (JSON sans espaces) ou "binary" (enregistrements préfixés par leurs
+    longueurs) ; au chargement, le format est détecté d'après la signature du
+    fichier, si bien qu'un stockage existant est converti à la sauvegarde suivante.
+
+    Les instantanés sont écrits de façon atomique (fichier temporaire renommé)
+    et, avec durable (par défaut), forcés sur disque comme chaque ajout au
+    journal. Un fichier illisible lève StorageError au lieu d'être vu comme vide.
+    """
+
+    def __init__(self, path: str, journal: bool = False, compact_threshold: int = COMPACT_THRESHOLD,
+                 format: str = "json", durable: bool = True):
+        self.path = path
+        self.format = validate_format(format)
+        self.durable = durable
+        self.journal_file = path + JOURNAL_SUFFIX
+        self.journal = journal
+        self.compact_threshold = compact_threshold
+        self._lock = FileLock(path + LOCK_SUFFIX)
+
+    def load(self) -> List[Dict]:
+        """Charge l'instantané (format détecté) puis rejoue le journal éventuel"""
+        tasks = []
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                raise StorageError(f"Could not read tasks: {e}") from e
+            try:
+                # Un fichier vide (créé à la main) correspond à un stockage vide
+                tasks = decode_tasks(data) if data.strip() else []
+            except ValueError as e:
+                raise StorageError(f"Corrupted task file {self.path}: {e}") from e
+        if os.path.exists(self.journal_file):
+            tasks = self._replay_journal(tasks)
+        return tasks
+
+    def _read_journal(self) -> Iterator[Dict]:
+        """Lit les enregistrements du journal"""
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Dernier enregistrement tronqué par un arrêt brutal
+                        return
+        except IOError:
+            return
+
+    def _replay_journal(self, tasks: List[Dict]) -> List[Dict]:
+        """Applique les mutations du journal à l'instantané chargé"""
+        tasks_by_id = {task["id"]: task for task in tasks}
+        for record in self._read_journal():
+            if record["op"] == "put":
+                tasks_by_id[record["task"]["id"]] = record["task"]
+            elif record["op"] == "delete":
+                tasks_by_id.pop(record["id"], None)
+        return list(tasks_by_id.values())
+
+    def save(self, tasks: List[Dict]):
+        """Sauvegarde un instantané complet de façon atomique et vide le journal"""
+        self.bytes_written += write_atomic(self.path, [encode_all(tasks, self.format)], self.durable)
+        self._remove_journal()
+
+    def _remove_journal(self):
+        """Supprime le journal, déjà contenu dans l'instantané qui vient d'être écrit"""
+        try:
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+        except OSError as e:
+            raise StorageError(f"Could not remove journal: {e}") from e
+
+    def apply(self, changes: List[Change], snapshot: Callable[[], List[Dict]]):
+        """Ajoute les mutations au journal (ou réécrit le fichier hors mode journalisé)"""
+        if not self.journal:
+            self.save(snapshot())
+        elif self._append_journal(changes) >= self.compact_threshold:
+            self.save(snapshot())
+
+    def lock(self, exclusive: bool = True) -> ContextManager:
+        return self._lock.hold(exclusive)
+
+    def size(self) -> int:
+        """Taille de l'instantané et du journal"""
+        return sum(os.path.getsize(path) for path in (self.path, self.journal_file) if os.path.exists(path))
+
+    def signature(self) -> Tuple:
+        """Génération, puis date et taille de l'instantané et du journal"""
+        signature = [self._lock.generation()]
+        for path in (self.path, self.journal_file):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def mark_changed(self):
+        self._lock.bump()
+
+    def _append_journal(self, changes: List[Change]) -> int:
+        """Ajoute les mutations au journal et retourne sa nouvelle taille"""
+        records = []
+        for op, task in changes:
+            if op == "delete":
+                record = {"op": "delete", "id": task["id"]}
+            else:
+                record = {"op": "put", "task": task}
+            records.append(json.dumps(record, ensure_ascii=False) + "\n")
+        data = "".join(records).encode("utf-8")
+        try:
+            with open(self.journal_file, 'a+b') as f:
+                _trim_torn_record(f)
+                f.write(data)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.bytes_written += len(data)
+                return f.tell()
+        except OSError as e:
+            raise StorageError(f"Could not append to journal: {e}") from e
+
+class JsonStreamStorage(JsonStorage):
+    """Fichier JSON lu en flux : la mémoire dépend de la taille de page, pas du fichier
+
+    Les lectures parcourent le fichier tâche par tâche (en superposant le
+    journal), la pagination s'arrête dès que la page est remplie et les
+    réécritures se font elles aussi en flux vers un fichier temporaire.
+    """
+
+    in_memory = False
+
+    def __init__(self, path: str, journal: bool = False, compact_threshold: int = COMPACT_THRESHOLD,
+                 format: str = "json", durable: bool = True):
+        super().__init__(path, journal, compact_threshold, format, durable)
+        self._pending: Optional[Dict[int, Optional[Dict]]] = None
+        self._counts: Dict[Tuple, int] = {}
+        self._status_counts: Optional[Dict[str, int]] = None
+        self._counts_signature = None
+
+    def _overlay(self) -> Dict[int, Optional[Dict]]:
+        """Mutations à superposer au fichier : journal puis transaction en cours (None = supprimée)"""
+        overlay = {}
+        if os.path.exists(self.journal_file):
+            for record in self._read_journal():
+                if record["op"] == "put":
+                    overlay[record["task"]["id"]] = record["task"]
+                elif record["op"] == "delete":
+                    overlay[record["id"]] = None
+        if self._pending:
+            overlay.update(self._pending)
+        return overlay
+
+    def iter_tasks(self) -> Iterator[Dict]:
+        """Parcourt les tâches dans l'ordre d'insertion sans les charger toutes"""
+        overlay = self._overlay()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'rb') as f:
+                    if f.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+                        tasks = iter_binary_records(f)
+                    else:
+                        f.seek(0)
+                        tasks = iter_json_array(io.TextIOWrapper(f, encoding='utf-8'))
+                    for task in tasks:
+                        if task["id"] in overlay:
+                            task = overlay.pop(task["id"])
+                            if task is None:
+                                continue
+                        yield task
+            except (ValueError, OSError) as e:
+                raise StorageError(f"Corrupted task file {self.path}: {e}") from e
+        for task in overlay.values():
+            if task is not None:
+                yield task
+
+    def load(self) -> List[Dict]:
+        return list(self.iter_tasks())
+
+    def save(self, tasks: Iterable[Dict]):
+        """Écrit les tâches en flux (même rendu que l'écriture complète), de façon atomique, et vide le journal"""
+        try:
+            self.bytes_written += write_atomic(self.path, encode_tasks(tasks, self.format), self.durable)
+            self._remove_journal()
+        finally:
+            self._clear_counts()
+
+    def apply(self, changes: List[Change], snapshot: Callable[[], List[Dict]]):
+        """Persiste les mutations sans matérialiser le stockage"""
+        if self._pending is not None:
+            # Transaction en cours : écriture différée au commit
+            for op, task in changes:
+                self._pending[task["id"]] = None if op == "delete" else task
+            return
+        self._clear_counts()
+        if self.journal:
+            if self._append_journal(changes) >= self.compact_threshold:
+                self.save(self.iter_tasks())
+        else:
+            self._pending = {task["id"]: None if op == "delete" else task for op, task in changes}
+            try:
+                self.save(self.iter_tasks())
+            finally:
+                self._pending = None
+
+    def begin(self):
+        self._pending = {}
+
+    def commit(self):
+        pending, self._pending = self._pending, None
+        if pending:
+            self.apply([("delete", {"id": task_id}) if task is None else ("put", task)
+                        for task_id, task in pending.items()], self.load)
+
+    def rollback(self):
+        self._pending = None
+
+    def get(self, task_id: int) -> Optional[Dict]:
+        for task in self.iter_tasks():
+            if task["id"] == task_id:
+                return task
+        return None
+
+    def max_id(self) -> int:
+        return max((task["id"] for task in self.iter_tasks()), default=0)
+
+    def _filtered(self, query: str, status: Optional[str] = None,
+                  created_range: Optional[CreatedRange] = None) -> Iterator[Dict]:
+        tasks = self.iter_tasks()
+        if status is not None:
+            tasks = (task for task in tasks if task["status"] == status)
+        if created_range is not None:
+            tasks = (task for task in tasks if in_created_range(timestamp_of(task["created_at"]), created_range))
+        if not query:
+            return tasks
+        query_lower = query.lower()
+        return (task for task in tasks if _matches(task, query_lower))
+
+    def _clear_counts(self):
+        self._counts.clear()
+        self._status_counts = None
+
+    def _counts_valid(self) -> bool:
+        """Invalide les comptages si les fichiers ont changé ; faux pendant une transaction"""
+        if self._pending:
+            return False
+        signature = self.signature()
+        if signature != self._counts_signature:
+            self._clear_counts()
+            self._counts_signature = signature
+        return True
+
+    def count(self, query: str = "", status: Optional[str] = None,
+              created_range: Optional[CreatedRange] = None) -> int:
+        """Compte les tâches (résultat mis en cache tant que les fichiers ne changent pas)"""
+        if not self._counts_valid():
+            return sum(1 for _ in self._filtered(query, status, created_range))
+        key = (query, status, created_range)
+        if key not in self._counts:
+            self._counts[key] = sum(1 for _ in self._filtered(query, status, created_range))
+        return self._counts[key]
+
+    def page(self, offset: int, limit: int, query: str = "", status: Optional[str] = None,
+             created_range: Optional[CreatedRange] = None, sort: Optional[str] = None,
+             order: str = "asc") -> List[Dict]:
+        """Retourne une page en arrêtant la lecture dès qu'elle est remplie
+        
+        Triée, la page est extraite en un parcours par un tas borné à
+        offset + limit tâches, sans garder tout le fichier en mémoire.
+        """
+        tasks = self._filtered(query, status, created_range)
+        if sort is None:
+            return list(islice(tasks, offset, offset + limit))
+        if sort == "id":
+            key = lambda task: task["id"]
+        else:
+            value = SORT_KEYS[sort]
+            key = lambda task: (value(Task.from_dict(task)), task["id"])
+        select = heapq.nlargest if order == "desc" else heapq.nsmallest
+        return select(offset + limit, tasks, key=key)[offset:]
+
+    def page_after(self, after_id: int, limit: int, query: str = "", status: Optional[str] = None,
+                   created_range: Optional[CreatedRange] = None) -> List[Dict]:
+        """Retourne les tâches suivant le curseur, en s'arrêtant dès que la page est remplie"""
+        tasks = (task for task in self._filtered(query, status, created_range) if task["id"] > after_id)
+        return list(islice(tasks, limit))
+
+    def report_rows(self) -> Iterator[Tuple[int, str, str]]:
+        """Champs du rapport en un seul parcours du fichier, sans garder les tâches"""
+        return ((task["id"], task["status"], task["created_at"]) for task in self.iter_tasks())
+
+    def status_counts(self) -> Dict[str, int]:
+        """Compte les tâches par statut en un seul parcours (mis en cache comme count)"""
+        if not self._counts_valid():
+            return dict(Counter(task["status"] for task in self.iter_tasks()))
+        if self._status_counts is None:
+            self._status_counts = dict(Counter(task["status"] for task in self.iter_tasks()))
+        return self._status_counts
+
+class SqliteStorage(StorageBackend):
+    """Stockage SQLite (mode WAL) interrogé par requêtes indexées"""
+
+    in_memory = False
+
+    _COLUMNS = "id, title, description, status, created_at"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._in_transaction = False
+        self._lock = FileLock(path + LOCK_SUFFIX)
+        # Import différé : inutile tant que le moteur SQLite n'est pas choisi
+        import sqlite3
+        # TaskManager sérialise les accès : la connexion peut servir à plusieurs threads
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            # seq conserve l'ordre d'insertion ; les colonnes *_lower servent à la
+            # recherche insensible à la casse avec la sémantique de str.lower()
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id INTEGER NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    title_lower TEXT NOT NULL,
+                    description_lower TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, seq);
+                CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+                CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (title_lower, id);
+            """)
+
+    @staticmethod
+    def _to_task(row: Tuple) -> Dict:
+        return {
+            "id": row[0],
+            "title": row[1],
+            "description": row[2],
+            "status": row[3],
+            "created_at": row[4]
+        }
+
+    @staticmethod
+    def _to_row(task: Dict) -> Tuple:
+        return (task["id"], task["title"], task["description"], task["status"], task["created_at"],
+                task["title"].lower(), task["description"].lower())
+
+    def _put(self, tasks: Iterable[Dict]):
+        self._conn.executemany(
+            "INSERT INTO tasks (id, title, description, status, created_at, title_lower, description_lower) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET title = excluded.title, description = excluded.description, "
+            "status = excluded.status, created_at = excluded.created_at, "
+            "title_lower = excluded.title_lower, description_lower = excluded.description_lower",
+            (self._to_row(task) for task in tasks)
+        )
+
+    def load(self) -> List[Dict]:
+        rows = self._conn.execute(f"SELECT {self._COLUMNS} FROM tasks ORDER BY seq")
+        return [self._to_task(row) for row in rows]
+
+    def _write(self, statements: Callable[[], None]):
+        """Exécute des écritures, validées immédiatement hors transaction explicite"""
+        if self._in_transaction:
+            statements()
+        else:
+            with self._conn:
+                statements()
+
+    def save(self, tasks: List[Dict]):
+        def statements():
+            self._conn.execute("DELETE FROM tasks")
+            self._put(tasks)
+        self._write(statements)
+
+    def apply(self, changes: List[Change], snapshot: Callable[[], List[Dict]]):
+        def statements():
+            for op, task in changes:
+                if op == "delete":
+                    self._conn.execute("DELETE FROM tasks WHERE id = ?", (task["id"],))
+                else:
+                    self._put([task])
+        self._write(statements)
+
+    def close(self):
+        self._conn.close()
+
+    def size(self) -> int:
+        """Taille de la base et de son fichier WAL"""
+        return sum(os.path.getsize(path) for path in (self.path, self.path + "-wal") if os.path.exists(path))
+
+    def begin(self):
+        self._in_transaction = True
+
+    def commit(self):
+        self._in_transaction = False
+        self._conn.commit()
+
+    def rollback(self):
+        self._in_transaction = False
+        self._conn.rollback()
+
+    def lock(self, exclusive: bool = True) -> ContextManager:
+        return self._lock.hold(exclusive)
+
+    def signature(self) -> Tuple:
+        """Génération et data_version, qui change à chaque validation d'une autre connexion"""
+        return (self._lock.generation(), self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def mark_changed(self):
+        self._lock.bump()
+
+    def get(self, task_id: int) -> Optional[Dict]:
+        row = self._conn.execute(f"SELECT {self._COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._to_task(row) if row else None
+
+    def max_id(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+
+    @staticmethod
+    def _where(query: str, status: Optional[str] = None,
+               created_range: Optional[CreatedRange] = None) -> Tuple[str, Tuple]:
+        conditions = []
+        params = ()
+        if status is not None:
+            conditions.append("status = ?")
+            params += (status,)
+        if created_range is not None:
+            # Dates ISO naïves : l'ordre des chaînes est l'ordre chronologique (index idx_tasks_created_at)
+            start, end = created_range
+            if start is not None:
+                conditions.append("created_at >= ?")
+                params += (_to_iso(start),)
+            if end is not None:
+                conditions.append("created_at < ?")
+                params += (_to_iso(end),)
+        if query:
+            query_lower = query.lower()
+            conditions.append("(instr(title_lower, ?) > 0 OR instr(description_lower, ?) > 0)")
+            params += (query_lower, query_lower)
+        if not conditions:
+            return "", ()
+        return "WHERE " + " AND ".join(conditions), params
+
+    def count(self, query: str = "", status: Optional[str] = None,
+              created_range: Optional[CreatedRange] = None) -> int:
+        where, params = self._where(query, status, created_range)
+        return self._conn.execute(f"SELECT COUNT(*) FROM tasks {where}", params).fetchone()[0]
+
+    @staticmethod
+    def _order_by(sort: Optional[str], order: str = "asc") -> str:
+        """Clause ORDER BY équivalente aux clés de tri de models.SORT_KEYS"""
+        if sort is None:
+            return "seq"
+        direction = " DESC" if order == "desc" else ""
+        columns = {
+            "id": [],
+            "title": ["title_lower"],
+            "status": ["CASE status " + " ".join(f"WHEN '{status}' THEN {rank}" for rank, status in enumerate(STATUSES))
+                       + f" ELSE {len(STATUSES)} END"],
+            "created_at": ["created_at"],
+        }[sort] + ["id"]
+        return ", ".join(column + direction for column in columns)
+
+    def page(self, offset: int, limit: int, query: str = "", status: Optional[str] = None,
+             created_range: Optional[CreatedRange] = None, sort: Optional[str] = None,
+             order: str = "asc") -> List[Dict]:
+        where, params = self._where(query, status, created_range)
+        rows = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM tasks {where} ORDER BY {self._order_by(sort, order)} LIMIT ? OFFSET ?",
+            params + (limit, offset)
+        )
+        return [self._to_task(row) for row in rows]
+
+    def status_counts(self) -> Dict[str, int]:
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status")
+        return dict(rows.fetchall())
+
+    def report_rows(self) -> List[Tuple[int, str, str]]:
+        return self._conn.execute("SELECT id, status, created_at FROM tasks").fetchall()
+
+    def page_after(self, after_id: int, limit: int, query: str = "", status: Optional[str] = None,
+                   created_range: Optional[CreatedRange] = None) -> List[Dict]:
+        where, params = self._where(query, status, created_range)
+        where = f"{where} AND id > ?" if where else "WHERE id > ?"
+        rows = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM tasks {where} ORDER BY id LIMIT ?",
+            params + (after_id, limit)
+        )
+        return [self._to_task(row) for row in rows]
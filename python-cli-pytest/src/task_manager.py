@@ -1,47 +1,543 @@
 # task_manager.py - Logique métier du gestionnaire de tâches
 
+import atexit
+import base64
+import hashlib
 import json
 import os
+import sys
+import threading
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import wraps
+from itertools import islice
+from typing import Callable, ContextManager, Iterable, List, Dict, Optional, Set, Tuple
 from uuid import uuid4
 
+try:
+    from .analytics import Columns, summarize
+    from .cache import SEARCH_CACHE_BYTES, SEARCH_CACHE_ENTRIES, SearchCache
+    from .indexes import CreatedIndex, InvertedIndex, SortedView, StatusIndex, TrigramIndex
+    from .locking import ReadWriteLock
+    from .metrics import Metrics
+    from .models import SORT_FIELDS, SORT_KEYS, SORT_ORDERS, STATUSES, CreatedRange, Task, timestamp_of
+    from .parallel import PARALLEL_THRESHOLD, ParallelSearch
+    from .storage import COMPACT_THRESHOLD, Change, JsonStorage, JsonStreamStorage, SqliteStorage, StorageBackend
+except ImportError:
+    from analytics import Columns, summarize
+    from cache import SEARCH_CACHE_BYTES, SEARCH_CACHE_ENTRIES, SearchCache
+    from indexes import CreatedIndex, InvertedIndex, SortedView, StatusIndex, TrigramIndex
+    from locking import ReadWriteLock
+    from metrics import Metrics
+    from models import SORT_FIELDS, SORT_KEYS, SORT_ORDERS, STATUSES, CreatedRange, Task, timestamp_of
+    from parallel import PARALLEL_THRESHOLD, ParallelSearch
+    from storage import COMPACT_THRESHOLD, Change, JsonStorage, JsonStreamStorage, SqliteStorage, StorageBackend
+
 DATA_FILE = "tasks.json"
+DB_FILE = "tasks.db"
+# Un sous-ensemble de moins d'une tâche sur SORT_SCAN_RATIO est trié directement ;
+# au-delà, la vue triée est parcourue en ne gardant que ses tâches
+SORT_SCAN_RATIO = 8
+
+class BulkOperationError(ValueError):
+    """Erreur de validation d'une opération groupée, détaillée élément par élément"""
+    
+    def __init__(self, errors: List[Tuple[int, str]]):
+        # errors : liste de (position de l'élément dans le lot, message d'erreur)
+        self.errors = errors
+        details = "; ".join(f"#{index}: {message}" for index, message in errors)
+        super().__init__(f"Invalid items: {details}")
+
+class _UnitOfWork:
+    """État d'une transaction : mutations en attente et de quoi les annuler
+    
+    Sans instantané (snapshot faux, unité implicite d'une seule mutation),
+    l'annulation retire les tâches créées et remet les tâches supprimées à
+    leur place dans l'ordre des IDs.
+    """
+    
+    def __init__(self, manager: "TaskManager", snapshot: bool = True):
+        self.changes: Dict[int, Change] = {}
+        self.originals: Dict[int, Tuple[Task, Task]] = {}
+        self.tasks = list(manager._tasks.values()) if snapshot else None
+        self.next_id = manager._next_id
+        self.snapshot_stale = manager._snapshot_stale
+    
+    def track(self, task: Task):
+        """Mémorise l'état d'une tâche avant sa première modification"""
+        if task.id not in self.originals:
+            self.originals[task.id] = (task, task.copy())
+    
+    def record(self, changes: List[Change]):
+        """Ajoute des mutations en ne gardant que la dernière par tâche"""
+        for op, task in changes:
+            self.changes[task.id] = (op, task)
+    
+    def restored_tasks(self, tasks: Iterable[Task]) -> List[Task]:
+        """Tâches d'avant l'unité, sans instantané : celles créées sont retirées, celles supprimées réinsérées"""
+        if self.tasks is not None:
+            return self.tasks
+        created = {task_id for task_id, (op, _) in self.changes.items() if op == "put" and task_id not in self.originals}
+        deleted = sorted((task for op, task in self.changes.values() if op == "delete"), key=lambda task: task.id)
+        restored = []
+        position = 0
+        for task in tasks:
+            if task.id in created:
+                continue
+            while position < len(deleted) and deleted[position].id < task.id:
+                restored.append(deleted[position])
+                position += 1
+            restored.append(task)
+        return restored + deleted[position:]
+
+def _exclusive(method: Callable) -> Callable:
+    """Exécute une mutation sous verrou exclusif du stockage, sur des tâches à jour, annulée si sa sauvegarde échoue"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._timed(method.__name__), self._locked(exclusive=True), self._atomic():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _shared(method: Callable) -> Callable:
+    """Exécute une lecture sous verrou partagé du stockage, sur des tâches à jour"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._timed(method.__name__), self._locked(exclusive=False):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+# Instances en regroupement d'écritures, dont les mutations en attente sont sauvegardées à la sortie du processus
+_group_commit_managers: "weakref.WeakSet[TaskManager]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_group_commits():
+    for manager in list(_group_commit_managers):
+        manager.flush()
 
 class TaskManager:
-    def __init__(self):
-        self.tasks = self._load_tasks()
+    def __init__(self, data_file: Optional[str] = None, journal: bool = False,
+                 compact_threshold: int = COMPACT_THRESHOLD, search_index: bool = False,
+                 storage: Optional[StorageBackend] = None, search_cache_entries: int = SEARCH_CACHE_ENTRIES,
+                 search_cache_bytes: int = SEARCH_CACHE_BYTES, thread_safe: bool = False,
+                 metrics: bool = False, group_commit: Optional[float] = None,
+                 parallel_search: bool = False, parallel_threshold: int = PARALLEL_THRESHOLD):
+        if storage is None:
+            storage = JsonStorage(data_file or DATA_FILE, journal, compact_threshold)
+        self.storage = storage
+        self._search_index = TrigramIndex() if search_index else None
+        # Recherche répartie sur plusieurs processus, à partir de parallel_threshold tâches
+        self._parallel = ParallelSearch() if parallel_search else None
+        self._parallel_threshold = parallel_threshold
+        # Index mot -> tâches de la recherche classée, construit à la première utilisation
+        self._inverted_index: Optional[InvertedIndex] = None
+        self._status_index = StatusIndex()
+        self._created_index = CreatedIndex()
+        # Vues triées par champ (titre, statut, date), construites au premier tri demandé
+        self._sorted_views: Dict[str, SortedView] = {}
+        # Colonnes statut / date de création de get_report(), construites au premier rapport
+        self._columns: Optional[Columns] = None
+        # Hors mémoire, état du stockage auquel correspondent les colonnes
+        self._columns_signature = None
+        # Résultats de recherche récents (moteurs en mémoire uniquement)
+        self.search_cache = SearchCache(search_cache_entries, search_cache_bytes)
+        self._unit_of_work: Optional[_UnitOfWork] = None
+        # Mode multi-thread : lectures en parallèle, mutations sérialisées ; requis par le
+        # regroupement des écritures, dont les sauvegardes s'exécutent dans un thread minuteur
+        self._rwlock = ReadWriteLock() if thread_safe or group_commit is not None else None
+        # Fenêtre (s) pendant laquelle les mutations attendent une sauvegarde commune (None : désactivé)
+        self._group_commit = group_commit
+        self._flush_timer: Optional[threading.Timer] = None
+        # Profondeur d'imbrication des appels verrouillés, propre à chaque thread
+        self._local = threading.local()
+        self._written = False
+        # Mutations en attente du prochain flush() en mode d'écriture différée (None : désactivé)
+        self._deferred: Optional[Dict[int, Change]] = None
+        # IDs des tâches créées depuis le dernier flush(), absentes du stockage
+        self._pending_creates: Set[int] = set()
+        # Instrumentation optionnelle : appels, latences et octets écrits par opération
+        self.metrics = Metrics() if metrics else None
+        start = time.perf_counter()
+        with self.storage.lock(exclusive=False):
+            self._reset_index([Task.from_dict(task) for task in self._load_tasks()])
+            # État du stockage correspondant aux tâches en mémoire
+            self._signature = self.storage.signature()
+        # Durée du chargement initial (lecture du stockage et construction des index)
+        self.load_seconds = time.perf_counter() - start
+        self._snapshot_stale = False
+        if group_commit is not None:
+            self.defer_writes()
+            _group_commit_managers.add(self)
     
-    def _load_tasks(self) -> List[Dict]:
-        """Charge les tâches depuis le fichier JSON"""
-        if os.path.exists(DATA_FILE):
+    @property
+    @_shared
+    def tasks(self) -> List[Dict]:
+        """Liste des tâches dans l'ordre d'insertion"""
+        if not self.storage.in_memory:
+            return self.storage.load()
+        return [task.to_dict() for task in self._tasks.values()]
+    
+    @tasks.setter
+    @_exclusive
+    def tasks(self, tasks: List[Dict]):
+        if not self.storage.in_memory:
+            self.storage.save(tasks)
+            self._written = True
+        self._reset_index([Task.from_dict(task) for task in tasks])
+        # Le journal ne décrit plus l'état courant : le prochain enregistrement
+        # doit être un instantané complet
+        self._snapshot_stale = True
+    
+    def _reset_index(self, tasks: List[Task]):
+        """Reconstruit l'index id -> tâche, le compteur d'IDs et les index secondaires"""
+        if not self.storage.in_memory:
+            # Le moteur interrogeable répond lui-même aux lectures ; le compteur
+            # d'IDs n'est calculé qu'à la première création
+            self._tasks = {}
+            self._ids = []
+            self._next_id = None
+            return
+        self._tasks = {task.id: task for task in tasks}
+        # IDs triés, parcourus par la pagination par curseur
+        self._ids = sorted(self._tasks)
+        self._next_id = max(self._tasks, default=0) + 1
+        if self._search_index is not None:
+            self._search_index = TrigramIndex()
+        self._inverted_index = None
+        self._status_index = StatusIndex()
+        self._created_index = CreatedIndex()
+        self._sorted_views = {}
+        self._columns = None
+        if self._parallel is not None:
+            self._parallel.clear()
+        self.search_cache.clear()
+        for task in self._tasks.values():
+            self._index_task(task)
+    
+    def _index_task(self, task: Task):
+        """Ajoute ou met à jour une tâche dans les index secondaires"""
+        self._status_index.add(task.id, task.status)
+        self._created_index.add(task.id, task.timestamp)
+        if self._search_index is not None:
+            self._search_index.add(task.id, task.title, task.description)
+        if self._inverted_index is not None:
+            self._inverted_index.add(task.id, task.title, task.description)
+        for sort, view in self._sorted_views.items():
+            view.add(task.id, SORT_KEYS[sort](task))
+        if self._parallel is not None:
+            self._parallel.add(task.id)
+        if self._columns is not None:
+            self._columns.add(task.id, task.status, task.timestamp)
+    
+    def _unindex_task(self, task: Task):
+        """Retire une tâche des index secondaires"""
+        self._status_index.remove(task.id)
+        self._created_index.remove(task.id)
+        if self._search_index is not None:
+            self._search_index.remove(task.id)
+        if self._inverted_index is not None:
+            self._inverted_index.remove(task.id)
+        for view in self._sorted_views.values():
+            view.remove(task.id)
+        if self._parallel is not None:
+            self._parallel.remove(task.id)
+        if self._columns is not None:
+            self._columns.remove(task.id)
+    
+    def _timed(self, name: str) -> ContextManager:
+        """Mesure une opération publique (appels imbriqués exclus) si l'instrumentation est active"""
+        if self.metrics is None or getattr(self._local, "depth", 0):
+            return nullcontext()
+        return self._measure(name)
+    
+    @contextmanager
+    def _measure(self, name: str):
+        """Enregistre la durée d'une opération et les octets écrits par le stockage pendant celle-ci"""
+        written = self.storage.bytes_written
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.metrics.record(name, time.perf_counter() - start, self.storage.bytes_written - written, error)
+    
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Verrouille les tâches (entre threads et entre processus) et les recharge si un autre processus les a modifiées"""
+        depth = getattr(self._local, "depth", 0)
+        if depth:
+            # Appel imbriqué : le verrou est déjà tenu par ce thread
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+        
+        # Seul le moteur en mémoire supporte des lectures parallèles : les autres
+        # partagent un curseur ou une connexion et sont sérialisés
+        exclusive_in_thread = exclusive or not self.storage.in_memory
+        if self._rwlock is None:
+            thread_lock = nullcontext()
+        elif exclusive_in_thread:
+            thread_lock = self._rwlock.write()
+        else:
+            # Le rechargement modifie l'état partagé : il se fait sous verrou d'écriture
+            if self.storage.signature() != self._signature:
+                with self._rwlock.write(), self.storage.lock(exclusive=False):
+                    self._refresh()
+            thread_lock = self._rwlock.read()
+        
+        with thread_lock, self.storage.lock(exclusive):
+            self._local.depth = 1
             try:
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+                if exclusive_in_thread or self._rwlock is None:
+                    self._refresh()
+                yield
+                if self._written:
+                    self.storage.mark_changed()
+                    self._signature = self.storage.signature()
+            finally:
+                self._local.depth = 0
+                if exclusive_in_thread:
+                    self._written = False
+    
+    def _refresh(self):
+        """Recharge les tâches si la signature du stockage a changé depuis le dernier accès"""
+        signature = self.storage.signature()
+        if signature != self._signature:
+            pending, created = self._deferred, self._pending_creates
+            self._reset_index([Task.from_dict(task) for task in self._load_tasks()])
+            self._snapshot_stale = False
+            self._signature = signature
+            if pending:
+                self._replay(pending, created)
+    
+    def _replay(self, pending: Dict[int, Change], created: Set[int]):
+        """Rejoue les mutations différées sur les tâches rechargées après l'écriture d'un autre processus
+        
+        Une tâche créée en attente dont l'ID a été pris entre-temps en reçoit
+        un nouveau ; la modification ou la suppression d'une tâche supprimée
+        entre-temps est abandonnée.
+        """
+        self._deferred = {}
+        self._pending_creates = set()
+        free_ids = [task.id for _, task in pending.values() if task.id in created and task.id not in self._tasks]
+        self._next_id = max([self._next_id] + [task_id + 1 for task_id in free_ids])
+        changes = []
+        for op, task in pending.values():
+            if task.id in created:
+                if task.id in self._tasks:
+                    task.id = self._get_next_id()
+            elif task.id not in self._tasks:
+                continue
+            changes.append((op, task))
+        self._commit(changes)
+    
+    def _load_tasks(self) -> List[Dict]:
+        """Charge les tâches depuis le moteur de stockage"""
+        if not self.storage.in_memory:
+            return []
+        with self._instrumented("load"):
+            return self.storage.load()
+    
+    def _instrumented(self, name: str) -> ContextManager:
+        """Mesure une étape interne (chargement, sauvegarde) si l'instrumentation est active"""
+        return nullcontext() if self.metrics is None else self._measure(name)
     
     def _save_tasks(self):
-        """Sauvegarde les tâches dans le fichier JSON"""
+        """Sauvegarde un instantané complet des tâches"""
+        with self._instrumented("save"):
+            self.storage.save(self.tasks)
+        self._snapshot_stale = False
+        self._written = True
+        if self._deferred:
+            # L'instantané contient déjà les mutations en attente
+            self._deferred = {}
+            self._pending_creates = set()
+    
+    def _persist(self, changes: List[Change]):
+        """Persiste un lot de mutations en une seule écriture"""
+        if self._unit_of_work is not None and self.storage.in_memory:
+            # Écriture différée jusqu'à la fin de la transaction
+            self._unit_of_work.record(changes)
+        elif self._deferred is not None and self.storage.in_memory:
+            # Écriture différée jusqu'au prochain flush(), en ne gardant que la dernière mutation par tâche
+            for op, task in changes:
+                if op == "delete" and task.id in self._pending_creates:
+                    # Tâche jamais sauvegardée : il n'y a rien à supprimer du stockage
+                    self._pending_creates.discard(task.id)
+                    self._deferred.pop(task.id, None)
+                else:
+                    self._deferred[task.id] = (op, task)
+            self._schedule_flush()
+        else:
+            self._write(changes)
+    
+    def _write(self, changes: List[Change]):
+        """Écrit un lot de mutations dans le stockage"""
+        if self._snapshot_stale and self.storage.in_memory:
+            self._save_tasks()
+        else:
+            # Les moteurs de stockage ne manipulent que la forme dictionnaire
+            with self._instrumented("write"):
+                self.storage.apply([(op, task.to_dict()) for op, task in changes], lambda: self.tasks)
+            self._written = True
+    
+    @property
+    def thread_safe(self) -> bool:
+        """Indique si le mode multi-thread est actif"""
+        return self._rwlock is not None
+    
+    @_exclusive
+    def defer_writes(self):
+        """Active l'écriture différée : les mutations ne sont persistées qu'au prochain flush()
+        
+        Les modifications d'autres processus sont rechargées au prochain accès
+        (au plus tard au flush, sous verrou exclusif) et les mutations en
+        attente rejouées par-dessus : une tâche créée en attente dont l'ID a
+        été pris entre-temps en reçoit un nouveau.
+        """
+        if self._deferred is None:
+            self._deferred = {}
+    
+    @_exclusive
+    def flush(self) -> int:
+        """Persiste en une seule écriture les mutations différées et retourne leur nombre
+        
+        En cas d'échec, les mutations restent en attente du flush suivant.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._deferred:
+            return 0
+        changes = list(self._deferred.values())
+        self._write(changes)
+        self._deferred = {}
+        self._pending_creates = set()
+        return len(changes)
+    
+    def _schedule_flush(self):
+        """Programme la sauvegarde groupée à la fin de la fenêtre de regroupement"""
+        if self._group_commit is None or self._flush_timer is not None:
+            return
+        self._flush_timer = threading.Timer(self._group_commit, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _commit(self, changes: List[Change], texts_changed: bool = True):
+        """Applique les mutations en mémoire et dans les index, puis les persiste
+        
+        texts_changed est faux quand seuls les statuts changent : les résultats
+        de recherche en cache, qui ne dépendent que des textes, restent valides.
+        """
+        if self.storage.in_memory:
+            for op, task in changes:
+                if op == "delete":
+                    del self._tasks[task.id]
+                    del self._ids[bisect_left(self._ids, task.id)]
+                    self._unindex_task(task)
+                    self.search_cache.remove(task.id)
+                else:
+                    new = task.id not in self._tasks
+                    if new:
+                        insort(self._ids, task.id)
+                        if self._deferred is not None:
+                            self._pending_creates.add(task.id)
+                    self._tasks[task.id] = task
+                    if new or texts_changed:
+                        self.search_cache.update(task.id, task.title, task.description, new)
+                    self._index_task(task)
+        self._persist(changes)
+    
+    @_exclusive
+    def compact(self):
+        """Replie le journal dans l'instantané"""
+        self._save_tasks()
+    
+    @contextmanager
+    def _atomic(self):
+        """Unité de travail implicite d'une mutation : si sa sauvegarde échoue, la mémoire et les index sont restaurés
+        
+        Sans effet dans une transaction (qui annule elle-même), en écriture
+        différée (une sauvegarde en échec garde les mutations en attente) et
+        hors mémoire (le moteur répond lui-même aux lectures).
+        """
+        if self._unit_of_work is not None or self._deferred is not None or not self.storage.in_memory:
+            yield
+            return
+        
+        unit = self._unit_of_work = _UnitOfWork(self, snapshot=False)
         try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, ensure_ascii=False, indent=2)
-        except IOError:
-            pass
+            try:
+                yield
+            finally:
+                self._unit_of_work = None
+            if unit.changes:
+                self._persist(list(unit.changes.values()))
+        except BaseException:
+            if unit.changes:
+                self._rollback(unit)
+            raise
+    
+    @contextmanager
+    def transaction(self):
+        """Regroupe les mutations du bloc en une seule écriture, annulées si une exception survient"""
+        # Le verrou est pris avant de lire la transaction en cours : celle d'un
+        # autre thread se termine d'abord, seule celle de ce thread est visible
+        with self._locked(exclusive=True):
+            if self._unit_of_work is not None:
+                # Transaction imbriquée : rattachée à la transaction englobante
+                yield self
+                return
+            
+            unit = self._unit_of_work = _UnitOfWork(self)
+            self.storage.begin()
+            try:
+                try:
+                    yield self
+                finally:
+                    self._unit_of_work = None
+                if unit.changes:
+                    self._persist(list(unit.changes.values()))
+                self.storage.commit()
+            except BaseException:
+                # Exception du bloc ou sauvegarde en échec : rien n'est conservé
+                self._rollback(unit)
+                raise
+    
+    def _rollback(self, unit: _UnitOfWork):
+        """Restaure l'état des tâches au début de la transaction"""
+        self.storage.rollback()
+        for task, original in unit.originals.values():
+            task.assign(original)
+        self._reset_index(unit.restored_tasks(self._tasks.values()))
+        self._next_id = unit.next_id
+        self._snapshot_stale = unit.snapshot_stale
+        if self._deferred is not None:
+            # Les tâches créées pendant la transaction n'ont jamais été en attente
+            self._pending_creates &= self._deferred.keys()
     
     def _get_next_id(self) -> int:
         """Génère le prochain ID unique"""
-        if not self.tasks:
-            return 1
-        return max(task["id"] for task in self.tasks) + 1
+        if self._next_id is None:
+            self._next_id = self.storage.max_id() + 1
+        task_id = self._next_id
+        self._next_id += 1
+        return task_id
     
-    def _find_task_by_id(self, task_id: int) -> Optional[Dict]:
+    def _find_task_by_id(self, task_id: int) -> Optional[Task]:
         """Trouve une tâche par son ID"""
-        for task in self.tasks:
-            if task["id"] == task_id:
-                return task
-        return None
+        if not self.storage.in_memory:
+            task = self.storage.get(task_id)
+            return Task.from_dict(task) if task else None
+        return self._tasks.get(task_id)
     
     def _validate_id(self, task_id) -> int:
         """Valide et convertit un ID"""
@@ -50,14 +546,25 @@ class TaskManager:
         except (ValueError, TypeError):
             raise ValueError("Invalid ID format")
     
-    def _validate_status(self, status: str):
-        """Valide un statut"""
-        valid_statuses = ["TODO", "ONGOING", "DONE"]
-        if status not in valid_statuses:
+    def _validate_status(self, status: str) -> str:
+        """Valide un statut et retourne la chaîne partagée par toutes les tâches"""
+        if status not in STATUSES:
             raise ValueError("Invalid status. Allowed values: TODO, ONGOING, DONE")
+        return sys.intern(status)
     
-    def create_task(self, title: str, description: str = "") -> Dict:
-        """Crée une nouvelle tâche avec validation"""
+    def _validate_sort(self, sort: Optional[str], order: str, cursor: Optional[str] = None) -> bool:
+        """Valide le tri demandé ; retourne vrai si les pages suivent l'ordre des IDs (reprise par curseur possible)"""
+        if sort is not None and sort not in SORT_FIELDS:
+            raise ValueError("Invalid sort field. Allowed values: id, title, status, created_at")
+        if order not in SORT_ORDERS:
+            raise ValueError("Invalid sort order. Allowed values: asc, desc")
+        resumable = sort is None or (sort == "id" and order == "asc")
+        if cursor is not None and not resumable:
+            raise ValueError("Cursor pagination is only available in ascending id order")
+        return resumable
+    
+    def _validate_title(self, title: Optional[str]) -> str:
+        """Valide un titre et le retourne sans espaces superflus"""
         if not title or not title.strip():
             raise ValueError("Title is required")
         
@@ -65,88 +572,176 @@ class TaskManager:
         
         if len(title) > 100:
             raise ValueError("Title cannot exceed 100 characters")
-        
+        return title
+    
+    def _validate_description(self, description: str):
+        """Valide une description"""
         if len(description) > 500:
             raise ValueError("Description cannot exceed 500 characters")
-        
-        task = {
-            "id": self._get_next_id(),
-            "title": title,
-            "description": description,
-            "status": "TODO",
-            "created_at": datetime.now().isoformat()
-        }
-        
-        self.tasks.append(task)
-        self._save_tasks()
-        return task
     
-    def get_task_by_id(self, task_id) -> Dict:
-        """Récupère une tâche par son ID"""
+    def _get_existing_task(self, task_id) -> Task:
+        """Valide un ID et retourne la tâche correspondante"""
         task_id = self._validate_id(task_id)
         task = self._find_task_by_id(task_id)
         if not task:
             raise ValueError("Task not found")
+        if self._unit_of_work is not None:
+            # Tâche sur le point d'être modifiée : son état est conservé pour l'annulation
+            self._unit_of_work.track(task)
         return task
     
-    def update_task(self, task_id, title: Optional[str] = None, description: Optional[str] = None) -> Dict:
-        """Met à jour une tâche"""
+    def _new_task(self, title: str, description: str) -> Task:
+        """Construit une nouvelle tâche à partir de champs déjà validés"""
+        return Task.new(self._get_next_id(), title, description)
+    
+    @_exclusive
+    def create_task(self, title: str, description: str = "") -> Dict:
+        """Crée une nouvelle tâche avec validation"""
+        title = self._validate_title(title)
+        self._validate_description(description)
+        
+        task = self._new_task(title, description)
+        self._commit([("put", task)])
+        return task.to_dict()
+    
+    @_shared
+    def get_task_by_id(self, task_id) -> Dict:
+        """Récupère une tâche par son ID"""
         task_id = self._validate_id(task_id)
         task = self._find_task_by_id(task_id)
         if not task:
             raise ValueError("Task not found")
+        return task.to_dict()
+    
+    def _prepare_update(self, task_id, title: Optional[str], description: Optional[str]) -> Tuple[Task, Dict]:
+        """Valide une modification et retourne (tâche, champs à modifier)"""
+        task = self._get_existing_task(task_id)
+        fields = {}
         
         if title is not None:
-            if not title.strip():
-                raise ValueError("Title is required")
-            title = title.strip()
-            if len(title) > 100:
-                raise ValueError("Title cannot exceed 100 characters")
-            task["title"] = title
+            fields["title"] = self._validate_title(title)
         
         if description is not None:
-            if len(description) > 500:
-                raise ValueError("Description cannot exceed 500 characters")
-            task["description"] = description
+            self._validate_description(description)
+            fields["description"] = description
         
-        self._save_tasks()
-        return task
+        return task, fields
     
+    @_exclusive
+    def update_task(self, task_id, title: Optional[str] = None, description: Optional[str] = None) -> Dict:
+        """Met à jour une tâche"""
+        task, fields = self._prepare_update(task_id, title, description)
+        for name, value in fields.items():
+            setattr(task, name, value)
+        self._commit([("put", task)])
+        return task.to_dict()
+    
+    @_exclusive
     def change_task_status(self, task_id, status: str) -> Dict:
         """Change le statut d'une tâche"""
-        task_id = self._validate_id(task_id)
-        task = self._find_task_by_id(task_id)
-        if not task:
-            raise ValueError("Task not found")
+        task = self._get_existing_task(task_id)
         
-        self._validate_status(status)
-        task["status"] = status
-        self._save_tasks()
-        return task
+        task.status = self._validate_status(status)
+        self._commit([("put", task)], texts_changed=False)
+        return task.to_dict()
     
+    @_exclusive
     def delete_task(self, task_id) -> bool:
         """Supprime une tâche"""
-        task_id = self._validate_id(task_id)
-        task = self._find_task_by_id(task_id)
-        if not task:
-            raise ValueError("Task not found")
+        task = self._get_existing_task(task_id)
         
-        self.tasks.remove(task)
-        self._save_tasks()
+        self._commit([("delete", task)])
         return True
     
-    def get_tasks(self, page: int = 1, page_size: int = 20) -> Dict:
-        """Récupère la liste des tâches avec pagination"""
-        if page_size <= 0:
-            raise ValueError("Invalid page size")
+    def _validate_batch(self, items: Iterable, validate: Callable) -> List:
+        """Valide tous les éléments d'un lot avant toute modification"""
+        validated = []
+        errors = []
+        for index, item in enumerate(items):
+            try:
+                validated.append(validate(item))
+            except ValueError as e:
+                errors.append((index, str(e)))
+        if errors:
+            raise BulkOperationError(errors)
+        return validated
+    
+    def _unique_tasks(self, task_ids: Iterable) -> List[Task]:
+        """Valide une liste d'IDs et retourne les tâches sans doublon"""
+        tasks = self._validate_batch(task_ids, self._get_existing_task)
+        return list({task.id: task for task in tasks}.values())
+    
+    @_exclusive
+    def create_tasks(self, items: Iterable[Dict]) -> List[Dict]:
+        """Crée plusieurs tâches ({"title", "description"}) avec une seule sauvegarde"""
+        def validate(item: Dict) -> Tuple[str, str]:
+            if not isinstance(item, dict):
+                raise ValueError("Task must be an object")
+            description = item.get("description") or ""
+            if not isinstance(item.get("title", ""), str) or not isinstance(description, str):
+                raise ValueError("Title and description must be strings")
+            self._validate_description(description)
+            return self._validate_title(item.get("title")), description
         
-        total_tasks = len(self.tasks)
+        fields = self._validate_batch(items, validate)
+        tasks = [self._new_task(title, description) for title, description in fields]
+        self._commit([("put", task) for task in tasks])
+        return [task.to_dict() for task in tasks]
+    
+    @_exclusive
+    def update_tasks(self, updates: Iterable[Dict]) -> List[Dict]:
+        """Modifie plusieurs tâches ({"id", "title", "description"}) avec une seule sauvegarde"""
+        def validate(update: Dict) -> Tuple[Task, Dict]:
+            if not isinstance(update, dict):
+                raise ValueError("Update must be an object")
+            return self._prepare_update(update.get("id"), update.get("title"), update.get("description"))
+        
+        prepared = self._validate_batch(updates, validate)
+        tasks = {}
+        for task, fields in prepared:
+            task = tasks.setdefault(task.id, task)
+            for name, value in fields.items():
+                setattr(task, name, value)
+        self._commit([("put", task) for task in tasks.values()])
+        return [task.to_dict() for task in tasks.values()]
+    
+    @_exclusive
+    def change_tasks_status(self, task_ids: Iterable, status: str) -> List[Dict]:
+        """Change le statut de plusieurs tâches avec une seule sauvegarde"""
+        status = self._validate_status(status)
+        tasks = self._unique_tasks(task_ids)
+        for task in tasks:
+            task.status = status
+        self._commit([("put", task) for task in tasks], texts_changed=False)
+        return [task.to_dict() for task in tasks]
+    
+    @_exclusive
+    def delete_tasks(self, task_ids: Iterable) -> int:
+        """Supprime plusieurs tâches avec une seule sauvegarde et retourne leur nombre"""
+        tasks = self._unique_tasks(task_ids)
+        self._commit([("delete", task) for task in tasks])
+        return len(tasks)
+    
+    def _paginate(self, page: int, page_size: int, total_tasks: int,
+                  fetch: Callable[[int, int], List[Dict]], query: str = "",
+                  status: Optional[str] = None, resumable: bool = True,
+                  created_range: Optional[CreatedRange] = None) -> Dict:
+        """Construit une page de résultats ; fetch(début, fin) fournit les tâches de la page
+        
+        resumable indique si la page suivante peut être obtenue par curseur
+        (résultats dans l'ordre des IDs).
+        """
         total_pages = (total_tasks + page_size - 1) // page_size if total_tasks > 0 else 0
         
         start_index = (page - 1) * page_size
         end_index = start_index + page_size
         
-        page_tasks = self.tasks[start_index:end_index] if page <= total_pages else []
+        page_tasks = fetch(start_index, end_index) if 1 <= page <= total_pages else []
+        
+        # Curseur permettant de poursuivre en mode curseur à partir de cette page
+        next_cursor = None
+        if resumable and page_tasks and page < total_pages:
+            next_cursor = _encode_cursor(page_tasks[-1]["id"], query, status, created_range)
         
         return {
             "tasks": page_tasks,
@@ -154,73 +749,464 @@ class TaskManager:
                 "current_page": page,
                 "total_pages": total_pages,
                 "total_tasks": total_tasks,
-                "page_size": page_size
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+                "status_counts": self.get_status_counts()
+            }
+        }
+    
+    def _paginate_after(self, cursor: str, page_size: int, fetch: Callable[[int, int], List[Dict]],
+                        query: str = "", status: Optional[str] = None,
+                        created_range: Optional[CreatedRange] = None) -> Dict:
+        """Construit la page qui suit le curseur ; fetch(après_id, limite) fournit les tâches suivantes"""
+        after_id = _decode_cursor(cursor, query, status, created_range)
+        # Une tâche de plus que la page indique s'il reste des résultats
+        page_tasks = fetch(after_id, page_size + 1)
+        next_cursor = None
+        if len(page_tasks) > page_size:
+            page_tasks = page_tasks[:page_size]
+            next_cursor = _encode_cursor(page_tasks[-1]["id"], query, status, created_range)
+        
+        return {
+            "tasks": page_tasks,
+            "pagination": {
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+                "status_counts": self.get_status_counts()
             }
         }
     
-    def search_tasks(self, query: str = "", page: int = 1, page_size: int = 20) -> Dict:
-        """Recherche des tâches par mots-clés"""
+    @_shared
+    def get_stats(self) -> Dict:
+        """Taille du stockage, nombre de tâches, durée du chargement initial et mesures par opération"""
+        status_counts = self.get_status_counts()
+        return {
+            "storage": {"backend": type(self.storage).__name__, "bytes": self.storage.size()},
+            "tasks": {"total": sum(status_counts.values()), "status_counts": status_counts},
+            "load_seconds": self.load_seconds,
+            "operations": self.metrics.snapshot() if self.metrics is not None else None
+        }
+    
+    def _report_columns(self) -> Columns:
+        """Colonnes du rapport : construites au premier appel puis tenues à jour à chaque mutation (en mémoire)
+        
+        Hors mémoire, seuls l'ID, le statut et la date de création sont lus,
+        et les colonnes resservent tant que le stockage n'a pas changé (hors
+        transaction, dont les écritures ne changent pas encore sa signature).
+        """
+        if not self.storage.in_memory:
+            signature = None if self._unit_of_work is not None else self.storage.signature()
+            if signature is None or self._columns is None or signature != self._columns_signature:
+                rows = list(self.storage.report_rows())
+                self._columns = Columns([row[0] for row in rows], [row[1] for row in rows],
+                                        [timestamp_of(row[2]) for row in rows])
+                self._columns_signature = signature
+            return self._columns
+        if self._columns is None:
+            tasks = self._tasks.values()
+            self._columns = Columns(self._tasks, [task.status for task in tasks], [task.timestamp for task in tasks])
+        return self._columns
+    
+    @_shared
+    def get_report(self, now=None) -> Dict:
+        """Synthèse des tâches : nombre par statut, créations par jour et par semaine, âge des tâches non terminées
+        
+        Les agrégats sont calculés sur des colonnes (statut, date de création),
+        par NumPy s'il est installé. now (date ISO ou datetime, maintenant par
+        défaut) est la date de référence de l'âge des tâches.
+        """
+        reference = self._validate_date(now if now is not None else datetime.now())
+        start = time.perf_counter()
+        report = summarize(self._report_columns(), reference)
+        report["seconds"] = time.perf_counter() - start
+        return report
+    
+    @_shared
+    def get_status_counts(self) -> Dict[str, int]:
+        """Nombre de tâches par statut (temps constant en mémoire)"""
+        if not self.storage.in_memory:
+            counts = self.storage.status_counts()
+            return {status: counts.get(status, 0) for status in STATUSES}
+        return {status: self._status_index.count(status) for status in STATUSES}
+    
+    def _ids_after(self, task_ids: List[int], after_id: int, limit: int,
+                   query_lower: str = "", status: Optional[str] = None) -> List[Dict]:
+        """Tâches suivant after_id dans une liste d'IDs triée, en s'arrêtant dès que la limite est atteinte"""
+        tasks = []
+        for position in range(bisect_right(task_ids, after_id), len(task_ids)):
+            task = self._tasks[task_ids[position]]
+            if status is not None and task.status != status:
+                continue
+            if query_lower and query_lower not in task.title.lower() and query_lower not in task.description.lower():
+                continue
+            tasks.append(task.to_dict())
+            if len(tasks) == limit:
+                break
+        return tasks
+    
+    def _search_ids(self, query: str) -> List[int]:
+        """IDs des tâches correspondant à la requête, dans l'ordre d'insertion (mis en cache)"""
+        task_ids = self.search_cache.get(query)
+        if task_ids is not None:
+            return task_ids
+        
+        if self._search_index is not None:
+            task_ids = self._search_index.search(query)
+        elif self._parallel is not None and len(self._tasks) >= self._parallel_threshold:
+            task_ids = self._parallel.search(query, self._tasks)
+        else:
+            query_lower = query.lower()
+            task_ids = []
+            
+            for task in self._tasks.values():
+                title_match = query_lower in task.title.lower()
+                description_match = query_lower in task.description.lower()
+                
+                if title_match or description_match:
+                    task_ids.append(task.id)
+        
+        self.search_cache.put(query, task_ids)
+        return task_ids
+    
+    def _validate_date(self, value) -> int:
+        """Valide une date (ISO ou datetime) et la convertit en microsecondes depuis l'époque"""
+        timestamp = timestamp_of(value.isoformat() if hasattr(value, "isoformat") else value)
+        if timestamp is None:
+            raise ValueError("Invalid date format. Expected ISO 8601 (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)")
+        return timestamp
+    
+    def _created_range(self, created_after, created_before) -> Optional[CreatedRange]:
+        """Valide les bornes de période (dates ISO ou datetime) et les convertit en microsecondes"""
+        if created_after is None and created_before is None:
+            return None
+        return tuple(None if value is None else self._validate_date(value) for value in (created_after, created_before))
+    
+    def _filtered_ids(self, status: Optional[str], created_range: Optional[CreatedRange]) -> List[int]:
+        """IDs triés des tâches du statut et de la période demandés (index de statut ou de dates)"""
+        if created_range is None:
+            return self._ids if status is None else self._status_index.ids(status)
+        task_ids = self._created_index.ids_between(*created_range)
+        if status is not None:
+            task_ids = [task_id for task_id in task_ids if self._tasks[task_id].status == status]
+        return task_ids
+    
+    def _sorted_view(self, sort: str) -> SortedView:
+        """Vue triée d'un champ, construite à la première demande puis tenue à jour à chaque mutation"""
+        view = self._sorted_views.get(sort)
+        if view is None:
+            key = SORT_KEYS[sort]
+            view = self._sorted_views[sort] = SortedView({task.id: key(task) for task in self._tasks.values()})
+        return view
+    
+    def _sorted_page(self, sort: str, order: str, start: int, end: int,
+                     task_ids: Optional[List[int]] = None) -> List[Dict]:
+        """Tâches de rang [start, end[ dans l'ordre de tri, parmi task_ids (toutes les tâches si None)"""
+        descending = order == "desc"
+        view = self._ids if sort == "id" else self._sorted_view(sort)
+        if task_ids is None:
+            size = len(view)
+            page_ids = view[max(size - end, 0):size - start][::-1] if descending else view[start:end]
+        elif len(task_ids) * SORT_SCAN_RATIO < len(view):
+            # Peu de tâches retenues : les trier coûte moins que parcourir la vue
+            page_ids = sorted(task_ids, key=None if sort == "id" else view.key, reverse=descending)[start:end]
+        else:
+            members = set(task_ids)
+            ordered = reversed(view) if descending else iter(view)
+            page_ids = list(islice((task_id for task_id in ordered if task_id in members), start, end))
+        return [self._tasks[task_id].to_dict() for task_id in page_ids]
+    
+    @_shared
+    def get_tasks(self, page: int = 1, page_size: int = 20, status: Optional[str] = None,
+                  cursor: Optional[str] = None, created_after=None, created_before=None,
+                  sort: Optional[str] = None, order: str = "asc") -> Dict:
+        """Récupère la liste des tâches avec pagination, éventuellement filtrée par statut et par période
+        
+        created_after (inclus) et created_before (exclu) bornent la date de
+        création ; la période est lue dans un index trié par date. Avec un
+        curseur (next_cursor d'une page précédente), la page reprend après la
+        dernière tâche vue au lieu de recompter depuis le début. sort (id,
+        title, status ou created_at) et order (asc ou desc) remplacent l'ordre
+        d'insertion ; les pages sont lues dans une vue triée tenue à jour.
+        """
+        if page_size <= 0:
+            raise ValueError("Invalid page size")
+        if status is not None:
+            status = self._validate_status(status)
+        resumable = self._validate_sort(sort, order, cursor)
+        created_range = self._created_range(created_after, created_before)
+        
+        if not self.storage.in_memory:
+            if cursor is not None:
+                return self._paginate_after(cursor, page_size,
+                                            lambda after_id, limit: self.storage.page_after(after_id, limit, status=status,
+                                                                                            created_range=created_range),
+                                            status=status, created_range=created_range)
+            return self._paginate(page, page_size, self.storage.count(status=status, created_range=created_range),
+                                  lambda start, end: self.storage.page(start, end - start, status=status,
+                                                                       created_range=created_range,
+                                                                       sort=sort, order=order),
+                                  status=status, resumable=resumable, created_range=created_range)
+        
+        task_ids = self._filtered_ids(status, created_range)
+        if cursor is not None:
+            return self._paginate_after(cursor, page_size,
+                                        lambda after_id, limit: self._ids_after(task_ids, after_id, limit),
+                                        status=status, created_range=created_range)
+        
+        if sort is not None:
+            subset = None if status is None and created_range is None else task_ids
+            return self._paginate(page, page_size, len(task_ids),
+                                  lambda start, end: self._sorted_page(sort, order, start, end, subset),
+                                  status=status, resumable=resumable, created_range=created_range)
+        
+        if status is not None or created_range is not None:
+            return self._paginate(page, page_size, len(task_ids),
+                                  lambda start, end: [self._tasks[task_id].to_dict() for task_id in task_ids[start:end]],
+                                  status=status, created_range=created_range)
+        
+        return self._paginate(page, page_size, len(self._tasks),
+                              lambda start, end: [task.to_dict() for task in islice(self._tasks.values(), start, end)])
+    
+    @_shared
+    def search_tasks(self, query: str = "", page: int = 1, page_size: int = 20,
+                     status: Optional[str] = None, cursor: Optional[str] = None,
+                     created_after=None, created_before=None,
+                     sort: Optional[str] = None, order: str = "asc") -> Dict:
+        """Recherche des tâches par mots-clés, éventuellement filtrée par statut et par période
+        
+        Avec un curseur, la recherche reprend après la dernière tâche vue au
+        lieu de filtrer à nouveau toutes les tâches. Avec une période, seules
+        les tâches de la période sont examinées. sort et order trient les
+        résultats comme pour get_tasks.
+        """
         if page_size <= 0:
             raise ValueError("Invalid page size")
         
         if not query:
-            return self.get_tasks(page, page_size)
+            return self.get_tasks(page, page_size, status, cursor, created_after, created_before, sort, order)
+        if status is not None:
+            status = self._validate_status(status)
+        resumable = self._validate_sort(sort, order, cursor)
+        created_range = self._created_range(created_after, created_before)
+        
+        if not self.storage.in_memory:
+            if cursor is not None:
+                return self._paginate_after(cursor, page_size,
+                                            lambda after_id, limit: self.storage.page_after(after_id, limit, query, status,
+                                                                                            created_range),
+                                            query, status, created_range)
+            return self._paginate(page, page_size, self.storage.count(query, status, created_range),
+                                  lambda start, end: self.storage.page(start, end - start, query, status, created_range,
+                                                                       sort, order),
+                                  query, status, resumable, created_range)
         
-        query_lower = query.lower()
-        filtered_tasks = []
+        if cursor is not None:
+            if created_range is None and (self._search_index is not None or query in self.search_cache):
+                task_ids = sorted(self._search_ids(query))
+                fetch = lambda after_id, limit: self._ids_after(task_ids, after_id, limit, status=status)
+            else:
+                task_ids = self._filtered_ids(status, created_range)
+                fetch = lambda after_id, limit: self._ids_after(task_ids, after_id, limit, query.lower())
+            return self._paginate_after(cursor, page_size, fetch, query, status, created_range)
         
-        for task in self.tasks:
-            title_match = query_lower in task["title"].lower()
-            description_match = query_lower in task["description"].lower()
+        if created_range is not None:
+            # La période est en général plus sélective que la requête : seules ses tâches sont examinées
+            query_lower = query.lower()
+            filtered_tasks = [task for task in map(self._tasks.__getitem__, self._filtered_ids(status, created_range))
+                              if query_lower in task.title.lower() or query_lower in task.description.lower()]
+        else:
+            filtered_tasks = [self._tasks[task_id] for task_id in self._search_ids(query)]
             
-            if title_match or description_match:
-                filtered_tasks.append(task)
+            if status is not None:
+                filtered_tasks = [task for task in filtered_tasks if task.status == status]
         
-        total_tasks = len(filtered_tasks)
-        total_pages = (total_tasks + page_size - 1) // page_size if total_tasks > 0 else 0
+        if sort is not None:
+            task_ids = [task.id for task in filtered_tasks]
+            fetch = lambda start, end: self._sorted_page(sort, order, start, end, task_ids)
+        else:
+            fetch = lambda start, end: [task.to_dict() for task in filtered_tasks[start:end]]
+        return self._paginate(page, page_size, len(filtered_tasks), fetch, query, status, resumable, created_range)
+    
+    def _ranked_index(self) -> InvertedIndex:
+        """Index de la recherche classée, construit au premier appel puis tenu à jour à chaque mutation"""
+        if self._inverted_index is None:
+            index = InvertedIndex()
+            for task in self._tasks.values():
+                index.add(task.id, task.title, task.description)
+            self._inverted_index = index
+        return self._inverted_index
+    
+    @_shared
+    def search_ranked(self, query: str, page: int = 1, page_size: int = 20, status: Optional[str] = None,
+                      match: str = "all") -> Dict:
+        """Recherche par pertinence : mots sans casse ni accents, classés par score BM25 (titre prioritaire)
         
-        start_index = (page - 1) * page_size
-        end_index = start_index + page_size
+        match vaut "all" (tous les mots) ou "any" (au moins un). Chaque tâche
+        retournée porte son score ; seules les tâches jusqu'à la page demandée
+        sont classées. Hors mémoire (stream, sqlite), l'index est construit à
+        chaque recherche en un parcours du stockage.
+        """
+        if page_size <= 0:
+            raise ValueError("Invalid page size")
+        if match not in ("all", "any"):
+            raise ValueError("Invalid match mode. Allowed values: all, any")
+        if status is not None:
+            status = self._validate_status(status)
         
-        page_tasks = filtered_tasks[start_index:end_index] if page <= total_pages else []
+        if self.storage.in_memory:
+            index = self._ranked_index()
+            lookup = lambda task_id: self._tasks[task_id].to_dict()
+            accept = None if status is None else lambda task_id: self._tasks[task_id].status == status
+        else:
+            index = InvertedIndex()
+            tasks = {}
+            for task in self.storage.load():
+                if status is None or task["status"] == status:
+                    index.add(task["id"], task["title"], task["description"])
+                    tasks[task["id"]] = task
+            lookup = tasks.__getitem__
+            accept = None
         
-        return {
-            "tasks": page_tasks,
-            "pagination": {
-                "current_page": page,
-                "total_pages": total_pages,
-                "total_tasks": total_tasks,
-                "page_size": page_size
-            }
-        }
+        total_tasks, ranked = index.search(query, max(page, 0) * page_size, match, accept)
+        return self._paginate(page, page_size, total_tasks,
+                              lambda start, end: [dict(lookup(task_id), score=round(score, 4))
+                                                  for task_id, score in ranked[start:end]],
+                              query, status, resumable=False)
+
+def _cursor_fingerprint(query: str, status: Optional[str], created_range: Optional[CreatedRange] = None) -> str:
+    """Empreinte de la requête à laquelle un curseur est lié"""
+    key = [query.lower(), status]
+    if created_range is not None:
+        key.append(list(created_range))
+    return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()[:12]
+
+def _encode_cursor(last_id: int, query: str = "", status: Optional[str] = None,
+                   created_range: Optional[CreatedRange] = None) -> str:
+    """Construit un curseur opaque : dernier ID vu et empreinte de la requête"""
+    raw = f"{last_id}:{_cursor_fingerprint(query, status, created_range)}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str, query: str = "", status: Optional[str] = None,
+                   created_range: Optional[CreatedRange] = None) -> int:
+    """Retourne le dernier ID vu d'un curseur émis pour la même requête"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        last_id, fingerprint = raw.split(":")
+        last_id = int(last_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if fingerprint != _cursor_fingerprint(query, status, created_range):
+        raise ValueError("Cursor does not match this query")
+    return last_id
+
+def create_storage(kind: str = "json", path: Optional[str] = None, journal: bool = False,
+                   format: str = "json", durable: bool = True) -> StorageBackend:
+    """Crée un moteur de stockage à partir de son nom ("json", "stream" ou "sqlite")
+    
+    format ("json", "compact" ou "binary") choisit le format d'écriture des
+    moteurs à fichier et durable force chaque écriture sur disque (fsync) ;
+    ils sont sans effet en SQLite.
+    """
+    if kind == "json":
+        return JsonStorage(path or DATA_FILE, journal, format=format, durable=durable)
+    if kind == "stream":
+        return JsonStreamStorage(path or DATA_FILE, journal, format=format, durable=durable)
+    if kind == "sqlite":
+        return SqliteStorage(path or DB_FILE)
+    raise ValueError("Invalid storage. Allowed values: json, stream, sqlite")
+
+def create_task_manager(**kwargs) -> TaskManager:
+    """Crée un TaskManager configuré par les variables d'environnement TASKS_*"""
+    return TaskManager(
+        storage=create_storage(os.environ.get("TASKS_STORAGE", "json"), os.environ.get("TASKS_FILE"),
+                               journal=os.environ.get("TASKS_JOURNAL") == "1",
+                               format=os.environ.get("TASKS_FORMAT", "json"),
+                               durable=os.environ.get("TASKS_FSYNC") != "0"),
+        search_index=os.environ.get("TASKS_SEARCH_INDEX") == "1",
+        metrics=os.environ.get("TASKS_METRICS") == "1",
+        group_commit=float(os.environ["TASKS_GROUP_COMMIT_MS"]) / 1000 if os.environ.get("TASKS_GROUP_COMMIT_MS") else None,
+        parallel_search=os.environ.get("TASKS_PARALLEL_SEARCH") == "1",
+        parallel_threshold=int(os.environ.get("TASKS_PARALLEL_THRESHOLD", PARALLEL_THRESHOLD)),
+        **kwargs
+    )
 
-# Instance globale pour rétrocompatibilité
-_task_manager = TaskManager()
+# Instance globale pour rétrocompatibilité, créée au premier usage pour que
+# l'import du module ne charge pas le stockage
+_task_manager: Optional[TaskManager] = None
 
-def get_tasks(page: int = 1, page_size: int = 20) -> Dict:
+def get_task_manager() -> TaskManager:
+    """Retourne l'instance globale, configurée par les variables d'environnement TASKS_*"""
+    global _task_manager
+    if _task_manager is None:
+        _task_manager = create_task_manager()
+    return _task_manager
+
+def is_task_manager_loaded() -> bool:
+    """Indique si l'instance globale a déjà été créée"""
+    return _task_manager is not None
+
+def get_tasks(page: int = 1, page_size: int = 20, status: Optional[str] = None,
+              cursor: Optional[str] = None, created_after=None, created_before=None,
+              sort: Optional[str] = None, order: str = "asc") -> Dict:
     """Récupère la liste des tâches avec pagination (fonction globale)"""
-    return _task_manager.get_tasks(page, page_size)
+    return get_task_manager().get_tasks(page, page_size, status, cursor, created_after, created_before, sort, order)
 
 def create_task(title: str, description: str = "") -> Dict:
     """Crée une nouvelle tâche (fonction globale)"""
-    return _task_manager.create_task(title, description)
+    return get_task_manager().create_task(title, description)
 
 def get_task_by_id(task_id) -> Dict:
     """Récupère une tâche par son ID (fonction globale)"""
-    return _task_manager.get_task_by_id(task_id)
+    return get_task_manager().get_task_by_id(task_id)
 
 def update_task(task_id, title: Optional[str] = None, description: Optional[str] = None) -> Dict:
     """Met à jour une tâche (fonction globale)"""
-    return _task_manager.update_task(task_id, title, description)
+    return get_task_manager().update_task(task_id, title, description)
 
 def change_task_status(task_id, status: str) -> Dict:
     """Change le statut d'une tâche (fonction globale)"""
-    return _task_manager.change_task_status(task_id, status)
+    return get_task_manager().change_task_status(task_id, status)
 
 def delete_task(task_id) -> bool:
     """Supprime une tâche (fonction globale)"""
-    return _task_manager.delete_task(task_id)
+    return get_task_manager().delete_task(task_id)
 
-def search_tasks(query: str = "", page: int = 1, page_size: int = 20) -> Dict:
+def search_tasks(query: str = "", page: int = 1, page_size: int = 20, status: Optional[str] = None,
+                 cursor: Optional[str] = None, created_after=None, created_before=None,
+                 sort: Optional[str] = None, order: str = "asc") -> Dict:
     """Recherche des tâches par mots-clés (fonction globale)"""
-    return _task_manager.search_tasks(query, page, page_size)
+    return get_task_manager().search_tasks(query, page, page_size, status, cursor, created_after, created_before,
+                                           sort, order)
+
+def get_stats() -> Dict:
+    """Statistiques du stockage et mesures par opération (fonction globale)"""
+    return get_task_manager().get_stats()
+
+def get_report(now=None) -> Dict:
+    """Synthèse des tâches par statut, date de création et âge (fonction globale)"""
+    return get_task_manager().get_report(now)
+
+def search_ranked(query: str, page: int = 1, page_size: int = 20, status: Optional[str] = None,
+                  match: str = "all") -> Dict:
+    """Recherche par pertinence (fonction globale)"""
+    return get_task_manager().search_ranked(query, page, page_size, status, match)
+
+def transaction():
+    """Regroupe plusieurs mutations en une seule écriture (fonction globale)"""
+    return get_task_manager().transaction()
+
+def create_tasks(items: Iterable[Dict]) -> List[Dict]:
+    """Crée plusieurs tâches en une seule sauvegarde (fonction globale)"""
+    return get_task_manager().create_tasks(items)
+
+def update_tasks(updates: Iterable[Dict]) -> List[Dict]:
+    """Modifie plusieurs tâches en une seule sauvegarde (fonction globale)"""
+    return get_task_manager().update_tasks(updates)
+
+def change_tasks_status(task_ids: Iterable, status: str) -> List[Dict]:
+    """Change le statut de plusieurs tâches en une seule sauvegarde (fonction globale)"""
+    return get_task_manager().change_tasks_status(task_ids, status)
+
+def delete_tasks(task_ids: Iterable) -> int:
+    """Supprime plusieurs tâches en une seule sauvegarde (fonction globale)"""
+    return get_task_manager().delete_tasks(task_ids)
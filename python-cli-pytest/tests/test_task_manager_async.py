@@ -0,0 +1,99 @@
+# test_task_manager_async.py - Tests pour la façade asynchrone
+import sys
+import os
+import asyncio
+import threading
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.async_manager import AsyncTaskManager
+from src.storage import JsonStorage
+
+class CountingStorage(JsonStorage):
+    """Stockage JSON qui compte les écritures et note le thread qui les exécute"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.writes = 0
+        self.threads = set()
+
+    def save(self, tasks):
+        self.writes += 1
+        self.threads.add(threading.get_ident())
+        super().save(tasks)
+
+class TestAsyncTaskManager:
+    """Tests pour AsyncTaskManager"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.storage = CountingStorage(self.data_file)
+
+    def run(self, coroutine_function):
+        """Exécute un scénario dans une boucle d'événements dédiée"""
+        return asyncio.run(coroutine_function(AsyncTaskManager(storage=self.storage)))
+
+    def test_crud_round_trip(self):
+        """Test que les opérations de la façade reflètent celles de TaskManager"""
+        async def scenario(manager):
+            task = await manager.create_task("Tâche", "Description")
+            await manager.update_task(task["id"], title="Tâche modifiée")
+            await manager.change_task_status(task["id"], "DONE")
+            other = await manager.create_task("Autre tâche")
+            await manager.delete_task(other["id"])
+            return (await manager.get_task_by_id(task["id"]), await manager.get_tasks(),
+                    await manager.search_tasks("modifiée", status="DONE"))
+
+        task, listing, found = self.run(scenario)
+
+        assert (task["title"], task["status"]) == ("Tâche modifiée", "DONE")
+        assert [t["id"] for t in listing["tasks"]] == [1]
+        assert [t["id"] for t in found["tasks"]] == [1]
+        assert TaskManager(data_file=self.data_file).tasks == [task]
+
+    def test_concurrent_writers_share_flushes(self):
+        """Test que des créations concurrentes sont persistées en quelques écritures groupées"""
+        async def scenario(manager):
+            tasks = await asyncio.gather(*(manager.create_task(f"Tâche {i}") for i in range(50)))
+            return tasks, manager.flush_count
+
+        tasks, flush_count = self.run(scenario)
+
+        assert sorted(task["id"] for task in tasks) == list(range(1, 51))
+        assert self.storage.writes == flush_count
+        assert flush_count < 50
+        assert len(TaskManager(data_file=self.data_file).tasks) == 50
+
+    def test_persistence_runs_off_the_event_loop(self):
+        """Test que les écritures ne s'exécutent pas dans le thread de la boucle d'événements"""
+        async def scenario(manager):
+            await manager.create_task("Tâche")
+            return threading.get_ident()
+
+        loop_thread = self.run(scenario)
+
+        assert self.storage.writes == 1
+        assert loop_thread not in self.storage.threads
+
+    def test_mutation_returns_after_persistence(self):
+        """Test qu'une mutation attendue est déjà sur disque"""
+        async def scenario(manager):
+            await manager.create_task("Tâche")
+            return TaskManager(data_file=self.data_file).tasks
+
+        assert [task["title"] for task in self.run(scenario)] == ["Tâche"]
+
+    def test_validation_errors_propagate(self):
+        """Test que les erreurs de validation sont levées par la coroutine"""
+        async def scenario(manager):
+            with pytest.raises(ValueError, match="Task not found"):
+                await manager.delete_task(42)
+
+        self.run(scenario)
+
+    def test_requires_thread_safe_manager(self):
+        """Test qu'un TaskManager mono-thread est refusé"""
+        with pytest.raises(ValueError, match="thread_safe"):
+            AsyncTaskManager(TaskManager(storage=self.storage))
@@ -0,0 +1,48 @@
+# test_task_manager_benchmark.py - Tests pour les mesures de performance
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.benchmark import DEFAULT_SIZES, HIT_QUERY, run_benchmark, synthetic_tasks, write_report
+
+OPERATIONS = {
+    "get_task_by_id", "get_tasks_first_page", "get_tasks_deep_page", "get_tasks_deep_cursor", "get_tasks_sorted",
+    "search_hit", "search_hit_cached", "search_miss", "search_ranked", "get_report", "create_task", "update_task", "delete_task",
+}
+
+class TestBenchmarkHarness:
+    """Tests pour le générateur de tâches et le rapport de mesures"""
+
+    def test_synthetic_tasks_are_reproducible(self):
+        """Test que les tâches générées sont identiques d'une exécution à l'autre"""
+        tasks = synthetic_tasks(100)
+
+        assert tasks == synthetic_tasks(100)
+        assert [task["id"] for task in tasks] == list(range(1, 101))
+        assert sum(HIT_QUERY in task["description"] for task in tasks) == 12
+
+    @pytest.mark.parametrize("storage_kind", ["json", "stream", "sqlite"])
+    def test_report_covers_every_operation(self, tmp_path, storage_kind):
+        """Test que le rapport contient chaque opération et se sérialise en JSON"""
+        report = run_benchmark([200], storage_kind, directory=str(tmp_path))
+        output = str(tmp_path / "results.json")
+        write_report(report, output)
+
+        with open(output, encoding='utf-8') as f:
+            result = json.load(f)["results"][0]
+        assert result["tasks"] == 200
+        assert set(result["operations"]) == OPERATIONS
+        assert result["load_peak_bytes"] >= result["retained_bytes"] > 0
+        assert result["file_bytes"] > 0
+        assert os.listdir(tmp_path) == ["results.json"]
+
+@pytest.mark.slow
+def test_benchmark_at_scale():
+    """Mesure 1k, 100k et 1M tâches ; résultats dans TASKS_BENCH_OUTPUT (python -m pytest -m slow)"""
+    sizes = [int(size) for size in os.environ.get("TASKS_BENCH_SIZES", "").split(",") if size] or DEFAULT_SIZES
+    report = run_benchmark(sizes)
+    write_report(report, os.environ.get("TASKS_BENCH_OUTPUT", "benchmark_results.json"))
+
+    assert [result["tasks"] for result in report["results"]] == list(sizes)
@@ -0,0 +1,94 @@
+# test_task_manager_bulk.py - Tests pour les opérations groupées
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, BulkOperationError
+from src.storage import JsonStorage
+
+class CountingStorage(JsonStorage):
+    """Stockage JSON qui compte les écritures"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.writes = 0
+
+    def save(self, tasks):
+        self.writes += 1
+        super().save(tasks)
+
+class TestBulkOperations:
+    """Tests pour les créations, modifications et suppressions groupées"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.storage = CountingStorage(self.data_file)
+        self.task_manager = TaskManager(storage=self.storage)
+
+    def test_create_tasks_persists_once(self):
+        """Test que la création groupée ne sauvegarde qu'une seule fois"""
+        tasks = self.task_manager.create_tasks([{"title": f"Tâche {i}"} for i in range(50)])
+
+        assert [task["id"] for task in tasks] == list(range(1, 51))
+        assert self.storage.writes == 1
+        assert len(TaskManager(data_file=self.data_file).tasks) == 50
+
+    def test_create_tasks_reports_every_invalid_item(self):
+        """Test que toutes les erreurs sont signalées et qu'aucune tâche n'est créée"""
+        with pytest.raises(BulkOperationError) as excinfo:
+            self.task_manager.create_tasks([
+                {"title": "Valide"},
+                {"title": ""},
+                {"title": "Titre", "description": "a" * 501},
+                "pas un objet",
+            ])
+
+        assert excinfo.value.errors == [
+            (1, "Title is required"),
+            (2, "Description cannot exceed 500 characters"),
+            (3, "Task must be an object"),
+        ]
+        assert self.task_manager.tasks == []
+        assert self.storage.writes == 0
+        assert self.task_manager.create_task("Suivante")["id"] == 1
+
+    def test_change_tasks_status_and_delete_tasks(self):
+        """Test le changement de statut et la suppression groupés"""
+        self.task_manager.create_tasks([{"title": f"Tâche {i}"} for i in range(5)])
+
+        updated = self.task_manager.change_tasks_status([1, 2, 2, "3"], "DONE")
+        deleted = self.task_manager.delete_tasks([4, 5])
+
+        assert [task["id"] for task in updated] == [1, 2, 3]
+        assert deleted == 2
+        assert [task["status"] for task in self.task_manager.tasks] == ["DONE", "DONE", "DONE"]
+        assert self.storage.writes == 3
+
+    def test_unknown_ids_abort_the_batch(self):
+        """Test qu'un ID inconnu annule toute l'opération groupée"""
+        self.task_manager.create_task("Tâche")
+
+        with pytest.raises(BulkOperationError) as excinfo:
+            self.task_manager.delete_tasks([1, 99, "abc"])
+
+        assert excinfo.value.errors == [(1, "Task not found"), (2, "Invalid ID format")]
+        assert len(self.task_manager.tasks) == 1
+
+    def test_update_tasks(self):
+        """Test la modification groupée avec validation préalable"""
+        self.task_manager.create_tasks([{"title": "A"}, {"title": "B"}])
+
+        with pytest.raises(BulkOperationError):
+            self.task_manager.update_tasks([{"id": 1, "title": "A2"}, {"id": 2, "title": " "}])
+        assert self.task_manager.get_task_by_id(1)["title"] == "A"
+
+        self.task_manager.update_tasks([{"id": 1, "title": "A2"}, {"id": 2, "description": "Desc"}])
+        assert self.task_manager.get_task_by_id(1)["title"] == "A2"
+        assert self.task_manager.get_task_by_id(2)["description"] == "Desc"
+
+    def test_invalid_status_error(self):
+        """Test qu'un statut invalide est refusé pour tout le lot"""
+        with pytest.raises(ValueError, match="Invalid status"):
+            self.task_manager.change_tasks_status([1], "INVALID")
@@ -0,0 +1,127 @@
+# test_task_manager_cache.py - Tests pour le cache des résultats de recherche
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.cache import SearchCache
+
+class TestSearchCache:
+    """Tests pour le cache de recherche de TaskManager"""
+
+    @pytest.fixture(autouse=True, params=[False, True], ids=["scan", "index"])
+    def setup(self, request, tmp_path):
+        self.task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"), search_index=request.param)
+        for title in ["Projet A", "Courses", "Projet B", "Sport"]:
+            self.task_manager.create_task(title)
+
+    def search_ids(self, query):
+        return [task["id"] for task in self.task_manager.search_tasks(query)["tasks"]]
+
+    def test_repeated_query_hits_cache(self):
+        """Test que les pages suivantes d'une même requête sont servies par le cache"""
+        self.task_manager.search_tasks("projet", page=1, page_size=1)
+        self.task_manager.search_tasks("PROJET", page=2, page_size=1)
+
+        stats = self.task_manager.search_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_create_appends_to_cached_results(self):
+        """Test qu'une tâche créée qui correspond est ajoutée aux résultats en cache"""
+        self.search_ids("projet")
+        self.task_manager.create_task("Projet C")
+        self.task_manager.create_task("Lecture")
+
+        assert self.search_ids("projet") == [1, 3, 5]
+        assert self.task_manager.search_cache.hits == 1
+
+    def test_update_and_delete_patch_cached_results(self):
+        """Test que modification et suppression corrigent les résultats en cache"""
+        self.search_ids("projet")
+        self.task_manager.update_task(1, title="Ancien")
+        self.task_manager.delete_task(3)
+
+        assert self.search_ids("projet") == []
+
+    def test_update_that_starts_matching_invalidates_entry(self):
+        """Test qu'une tâche modifiée qui se met à correspondre garde sa place dans les résultats"""
+        self.search_ids("projet")
+        self.task_manager.update_task(2, description="Pour le projet")
+
+        assert self.search_ids("projet") == [1, 2, 3]
+
+    def test_status_filter_uses_cached_ids(self):
+        """Test que le filtre par statut s'applique aux résultats en cache"""
+        self.search_ids("projet")
+        self.task_manager.change_task_status(3, "DONE")
+
+        result = self.task_manager.search_tasks("projet", status="DONE")
+        assert [task["id"] for task in result["tasks"]] == [3]
+        assert self.task_manager.search_cache.hits == 1
+
+    def test_status_change_leaves_entries_untouched(self, monkeypatch):
+        """Test qu'un changement de statut ne corrige pas les entrées, les textes n'ayant pas changé"""
+        self.search_ids("projet")
+        monkeypatch.setattr(self.task_manager.search_cache, "update", None)
+        self.task_manager.change_task_status(1, "DONE")
+        self.task_manager.change_tasks_status([2, 3], "ONGOING")
+
+        assert self.search_ids("projet") == [1, 3]
+
+    def test_rollback_clears_cache(self):
+        """Test que l'annulation d'une transaction vide le cache"""
+        self.search_ids("projet")
+        with pytest.raises(RuntimeError):
+            with self.task_manager.transaction():
+                self.task_manager.update_task(1, title="Ancien")
+                raise RuntimeError("échec")
+
+        assert len(self.task_manager.search_cache) == 0
+        assert self.search_ids("projet") == [1, 3]
+
+class TestSearchCacheBounds:
+    """Tests unitaires des limites de SearchCache"""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test que l'entrée la moins récemment utilisée est évincée au-delà du nombre d'entrées"""
+        cache = SearchCache(max_entries=2)
+        cache.put("a", [1])
+        cache.put("b", [2])
+        cache.get("a")
+        cache.put("c", [3])
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+
+    def test_memory_bound(self):
+        """Test que le cache respecte la limite de mémoire"""
+        cache = SearchCache(max_bytes=2000)
+        cache.put("petit", [1, 2])
+        cache.put("grand", list(range(1000)))
+        cache.put("moyen", list(range(100)))
+        cache.put("moyen bis", list(range(100)))
+
+        assert "grand" not in cache
+        assert "moyen bis" in cache
+        assert cache.stats()["bytes"] <= 2000
+
+    def test_removed_ids_are_compacted_on_read(self):
+        """Test qu'une tâche retirée est notée puis ôtée de la liste à la lecture suivante"""
+        cache = SearchCache()
+        cache.put("projet", [1, 3, 5])
+        cache.remove(3)
+        cache.update(5, "Autre", "", new=False)
+        cache.update(3, "Projet", "", new=False)
+
+        assert cache.get("projet") == [1, 3]
+
+    def test_unsorted_entry_is_dropped_on_mutation(self):
+        """Test qu'une liste dont les IDs ne sont pas triés est invalidée plutôt que parcourue"""
+        cache = SearchCache()
+        cache.put("projet", [3, 1])
+        cache.update(7, "Lecture", "", new=True)
+        assert "projet" in cache
+
+        cache.remove(2)
+        assert "projet" not in cache
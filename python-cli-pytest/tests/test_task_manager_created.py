@@ -0,0 +1,93 @@
+# test_task_manager_created.py - Tests pour le filtrage par date de création
+import sys
+import os
+import pytest
+from datetime import datetime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.indexes import CreatedIndex
+
+class TestCreatedIndex:
+    """Tests pour l'index trié par date de création"""
+
+    def test_ids_between_bounds(self):
+        """Test que la période inclut le début, exclut la fin et retourne les IDs triés"""
+        index = CreatedIndex()
+        for task_id, timestamp in [(3, 10), (1, 30), (2, 20), (4, 40)]:
+            index.add(task_id, timestamp)
+
+        assert index.ids_between(20, 40) == [1, 2]
+        assert index.ids_between(None, 20) == [3]
+        assert index.ids_between(30, None) == [1, 4]
+
+    def test_update_and_remove(self):
+        """Test qu'une tâche déplacée ou retirée n'apparaît qu'à sa nouvelle place"""
+        index = CreatedIndex()
+        index.add(1, 10)
+        index.add(2, 20)
+        index.add(1, 30)
+        index.remove(2)
+
+        assert index.ids_between(None, None) == [1]
+        assert index.ids_between(None, 25) == []
+
+class TestCreatedRange:
+    """Tests pour get_tasks et search_tasks filtrés par période"""
+
+    @pytest.fixture(autouse=True, params=["json", "stream", "sqlite"])
+    def setup(self, request, tmp_path):
+        storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+        storage.save([
+            {"id": 1, "title": "Rapport annuel", "description": "", "status": "TODO", "created_at": "2024-01-10T09:00:00"},
+            {"id": 2, "title": "Appeler le client", "description": "rapport", "status": "DONE", "created_at": "2024-02-01T00:00:00"},
+            {"id": 3, "title": "Courses", "description": "", "status": "TODO", "created_at": "2024-02-15T18:30:00"},
+            {"id": 4, "title": "Rapport mensuel", "description": "", "status": "TODO", "created_at": "2024-03-01T08:00:00"},
+        ])
+        self.task_manager = TaskManager(storage=storage)
+
+    def ids(self, result):
+        return [task["id"] for task in result["tasks"]]
+
+    def test_range_is_half_open(self):
+        """Test que created_after est inclus et created_before exclu"""
+        result = self.task_manager.get_tasks(created_after="2024-02-01", created_before="2024-03-01T08:00:00")
+
+        assert self.ids(result) == [2, 3]
+        assert result["pagination"]["total_tasks"] == 2
+
+    def test_open_ended_range(self):
+        """Test qu'une seule borne suffit et accepte un datetime"""
+        assert self.ids(self.task_manager.get_tasks(created_after=datetime(2024, 2, 10))) == [3, 4]
+        assert self.ids(self.task_manager.get_tasks(created_before="2024-02-01")) == [1]
+
+    def test_range_with_status_and_query(self):
+        """Test que la période se combine au statut et à la recherche"""
+        assert self.ids(self.task_manager.get_tasks(status="TODO", created_after="2024-01-15")) == [3, 4]
+        assert self.ids(self.task_manager.search_tasks("rapport", created_before="2024-02-15")) == [1, 2]
+        assert self.ids(self.task_manager.search_tasks("rapport", status="TODO", created_after="2024-01-15")) == [4]
+
+    def test_cursor_keeps_range(self):
+        """Test que la pagination par curseur reste dans la période et y est liée"""
+        first = self.task_manager.get_tasks(page_size=1, created_after="2024-02-01")
+        cursor = first["pagination"]["next_cursor"]
+        second = self.task_manager.get_tasks(page_size=2, cursor=cursor, created_after="2024-02-01")
+
+        assert self.ids(first) == [2]
+        assert self.ids(second) == [3, 4]
+        with pytest.raises(ValueError):
+            self.task_manager.get_tasks(page_size=1, cursor=cursor)
+
+    def test_index_follows_mutations(self):
+        """Test que les tâches créées et supprimées sont prises en compte"""
+        today = datetime.now().date().isoformat()
+        task = self.task_manager.create_task("Nouvelle tâche", "")
+        self.task_manager.delete_task(3)
+
+        assert self.ids(self.task_manager.get_tasks(created_after=today)) == [task["id"]]
+        assert self.ids(self.task_manager.get_tasks(created_after="2024-02-01", created_before="2024-03-01")) == [2]
+
+    def test_invalid_date_raises(self):
+        """Test qu'une date illisible est refusée"""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            self.task_manager.get_tasks(created_after="hier")
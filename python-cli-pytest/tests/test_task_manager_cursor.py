@@ -0,0 +1,90 @@
+# test_task_manager_cursor.py - Tests pour la pagination par curseur
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+
+@pytest.fixture(params=["json", "stream", "sqlite", "index"])
+def task_manager(request, tmp_path):
+    """Gestionnaire sur chacun des moteurs de stockage, et avec l'index de trigrammes"""
+    if request.param == "index":
+        yield TaskManager(data_file=str(tmp_path / "tasks.json"), search_index=True)
+        return
+    storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+    yield TaskManager(storage=storage)
+    storage.close()
+
+def walk(fetch):
+    """Parcourt toutes les pages en suivant next_cursor et retourne les IDs vus"""
+    result = fetch(None)
+    ids = [task["id"] for task in result["tasks"]]
+    while result["pagination"]["next_cursor"]:
+        result = fetch(result["pagination"]["next_cursor"])
+        ids.extend(task["id"] for task in result["tasks"])
+    return ids
+
+class TestCursorPagination:
+    """Tests pour get_tasks et search_tasks en mode curseur"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, task_manager):
+        self.task_manager = task_manager
+        for i in range(1, 11):
+            self.task_manager.create_task(f"Tâche {i}", "projet" if i % 3 == 0 else "")
+
+    def test_cursor_walk_matches_offset_pages(self):
+        """Test que le parcours par curseur renvoie toutes les tâches une seule fois, dans l'ordre"""
+        ids = walk(lambda cursor: self.task_manager.get_tasks(page_size=3, cursor=cursor))
+
+        assert ids == list(range(1, 11))
+
+    def test_search_cursor_walk(self):
+        """Test que la recherche par curseur ne renvoie que les résultats correspondants"""
+        ids = walk(lambda cursor: self.task_manager.search_tasks("projet", page_size=2, cursor=cursor))
+
+        assert ids == [3, 6, 9]
+
+    def test_cursor_with_status_filter(self):
+        """Test que le curseur respecte le filtre par statut"""
+        self.task_manager.change_tasks_status([2, 5, 7, 8], "DONE")
+
+        ids = walk(lambda cursor: self.task_manager.get_tasks(page_size=3, status="DONE", cursor=cursor))
+        assert ids == [2, 5, 7, 8]
+
+    def test_cursor_survives_deletions(self):
+        """Test qu'une suppression entre deux pages ne décale pas la suite"""
+        first = self.task_manager.get_tasks(page_size=4)
+        self.task_manager.delete_tasks([2, 4, 5])
+
+        result = self.task_manager.get_tasks(page_size=4, cursor=first["pagination"]["next_cursor"])
+        assert [task["id"] for task in result["tasks"]] == [6, 7, 8, 9]
+
+    def test_last_page_has_no_cursor(self):
+        """Test que la dernière page ne fournit pas de curseur"""
+        result = self.task_manager.get_tasks(page=4, page_size=3)
+
+        assert result["pagination"]["next_cursor"] is None
+
+class TestCursorValidation:
+    """Tests pour la validation des curseurs"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"))
+        for i in range(5):
+            self.task_manager.create_task(f"Tâche {i}")
+
+    def test_cursor_is_bound_to_query(self):
+        """Test qu'un curseur émis pour une autre requête est refusé"""
+        cursor = self.task_manager.search_tasks("tâche", page_size=2)["pagination"]["next_cursor"]
+
+        with pytest.raises(ValueError, match="Cursor does not match"):
+            self.task_manager.get_tasks(page_size=2, cursor=cursor)
+        assert self.task_manager.search_tasks("TÂCHE", page_size=2, cursor=cursor)["tasks"]
+
+    def test_malformed_cursor(self):
+        """Test qu'un curseur illisible est refusé"""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.task_manager.get_tasks(cursor="pas-un-curseur")
@@ -0,0 +1,98 @@
+# test_task_manager_daemon.py - Tests pour le démon sur socket Unix
+import sys
+import os
+import asyncio
+import socket
+import threading
+import time
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.async_manager import AsyncTaskManager
+from src.daemon import DaemonClient, default_socket_path, serve
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Sockets Unix indisponibles")
+
+class TestDaemon:
+    """Tests pour le démon et son client"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.socket_path = str(tmp_path / "tasks.sock")
+        manager = AsyncTaskManager(TaskManager(data_file=self.data_file, thread_safe=True))
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        server = asyncio.run_coroutine_threadsafe(serve(manager, self.socket_path), loop)
+        for _ in range(100):
+            if os.path.exists(self.socket_path):
+                break
+            time.sleep(0.01)
+        self.client = DaemonClient.connect(self.socket_path)
+        yield
+        self.client.close()
+        loop.call_soon_threadsafe(server.cancel)
+        for _ in range(100):
+            if not os.path.exists(self.socket_path):
+                break
+            time.sleep(0.01)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def test_operations_are_executed_by_daemon(self):
+        """Test que les opérations transmises sont exécutées et persistées par le démon"""
+        task = self.client.call("create_task", "Tâche", "Description")
+        self.client.call("change_task_status", task["id"], "DONE")
+
+        assert self.client.call("get_task_by_id", task["id"])["status"] == "DONE"
+        assert self.client.call("search_tasks", "tâche", 1, 20, "DONE")["pagination"]["total_tasks"] == 1
+        assert TaskManager(data_file=self.data_file).tasks[0]["status"] == "DONE"
+
+    def test_errors_are_raised_as_value_errors(self):
+        """Test que les erreurs du démon sont relevées côté client"""
+        with pytest.raises(ValueError, match="Task not found"):
+            self.client.call("delete_task", 42)
+        with pytest.raises(ValueError, match="Unknown method"):
+            self.client.call("compact")
+
+    def test_stats_are_forwarded(self):
+        """Test que les statistiques sont celles du démon"""
+        self.client.call("create_task", "Tâche")
+
+        stats = self.client.call("get_stats")
+        assert stats["tasks"]["total"] == 1
+        assert stats["storage"]["bytes"] > 0
+
+    def test_clients_see_each_other_writes(self):
+        """Test que plusieurs clients partagent le même état"""
+        other = DaemonClient.connect(self.socket_path)
+        other.call("create_task", "Tâche d'un autre client")
+        other.close()
+
+        assert self.client.call("get_tasks")["pagination"]["total_tasks"] == 1
+
+class TestDaemonFallback:
+    """Tests pour le repli sur l'accès direct quand le démon ne tourne pas"""
+
+    def test_connect_without_daemon(self, tmp_path):
+        """Test que la connexion échoue proprement sans démon"""
+        assert DaemonClient.connect(str(tmp_path / "absent.sock")) is None
+
+    def test_connect_to_stale_socket(self, tmp_path):
+        """Test qu'une socket laissée par un démon arrêté est ignorée"""
+        socket_path = str(tmp_path / "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        assert DaemonClient.connect(socket_path) is None
+
+    def test_default_socket_path(self, monkeypatch):
+        """Test que la socket par défaut suit le fichier de stockage"""
+        monkeypatch.delenv("TASKS_SOCKET", raising=False)
+        monkeypatch.setenv("TASKS_FILE", "/tmp/mes_taches.json")
+
+        assert default_socket_path() == "/tmp/mes_taches.json.sock"
@@ -0,0 +1,222 @@
+# test_task_manager_durability.py - Tests pour les sauvegardes atomiques et le regroupement des écritures
+import sys
+import os
+import time
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import storage as storage_module
+from src import task_manager as task_manager_module
+from src.task_manager import TaskManager
+from src.storage import JsonStorage, JsonStreamStorage, StorageError
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    """Compte les appels à os.fsync"""
+    calls = []
+    real_fsync = os.fsync
+    def fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+    monkeypatch.setattr(storage_module.os, "fsync", fsync)
+    return calls
+
+class TestAtomicSave:
+    """Tests pour les sauvegardes atomiques et durables"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.task_manager = TaskManager(data_file=self.data_file)
+        self.task_manager.create_task("Tâche existante")
+        with open(self.data_file, encoding='utf-8') as f:
+            self.saved = f.read()
+
+    def test_interrupted_save_keeps_previous_file(self):
+        """Test qu'une écriture interrompue laisse l'ancien fichier intact et sans fichier temporaire"""
+        def interrupted_tasks():
+            yield {"id": 1, "title": "Nouvelle", "description": "", "status": "TODO", "created_at": "2024-01-01T00:00:00"}
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            JsonStreamStorage(self.data_file).save(interrupted_tasks())
+
+        with open(self.data_file, encoding='utf-8') as f:
+            assert f.read() == self.saved
+        assert not os.path.exists(self.data_file + ".tmp")
+
+    def test_save_is_forced_to_disk(self, fsyncs):
+        """Test que le fichier et le répertoire sont synchronisés à chaque sauvegarde"""
+        self.task_manager.create_task("Tâche")
+
+        assert len(fsyncs) == 2
+
+    def test_journal_append_is_forced_to_disk(self, fsyncs):
+        """Test que chaque ajout au journal est synchronisé"""
+        TaskManager(data_file=self.data_file, journal=True).create_task("Tâche")
+
+        assert len(fsyncs) == 1
+
+    def test_durability_can_be_disabled(self, fsyncs):
+        """Test qu'aucune synchronisation n'a lieu sans durable"""
+        TaskManager(storage=JsonStorage(self.data_file, durable=False)).create_task("Tâche")
+
+        assert fsyncs == []
+
+    def test_write_errors_are_raised(self, tmp_path):
+        """Test qu'une sauvegarde impossible lève StorageError au lieu d'être ignorée"""
+        task_manager = TaskManager(data_file=str(tmp_path / "absent" / "tasks.json"))
+
+        with pytest.raises(StorageError, match="Could not save tasks"):
+            task_manager.create_task("Tâche")
+
+    def test_corrupted_file_is_not_read_as_empty(self):
+        """Test qu'un fichier corrompu lève StorageError au lieu d'être remplacé par un stockage vide"""
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write('[{"id": 1, "ti')
+
+        with pytest.raises(StorageError, match="Corrupted task file"):
+            TaskManager(data_file=self.data_file)
+
+    def test_empty_file_is_an_empty_store(self):
+        """Test qu'un fichier vide correspond à un stockage vide"""
+        open(self.data_file, 'w').close()
+
+        assert TaskManager(data_file=self.data_file).tasks == []
+
+class TestFailedWrite:
+    """Tests pour l'annulation en mémoire d'une mutation dont la sauvegarde échoue"""
+
+    @pytest.fixture(autouse=True, params=[False, True], ids=["snapshot", "journal"])
+    def setup(self, request, tmp_path, monkeypatch):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.journal = request.param
+        self.task_manager = TaskManager(data_file=self.data_file, journal=self.journal)
+        for title in ["Rapport", "Projet", "Courses"]:
+            self.task_manager.create_task(title, "client")
+        self.monkeypatch = monkeypatch
+
+    def fail_writes(self):
+        def disk_full(*args, **kwargs):
+            raise StorageError("Could not save tasks: disk full")
+        self.monkeypatch.setattr(storage_module, "write_atomic", disk_full)
+        self.monkeypatch.setattr(self.task_manager.storage, "_append_journal", disk_full)
+
+    def state(self, task_manager):
+        return task_manager.tasks, task_manager.get_status_counts(), task_manager.search_tasks("client")["tasks"]
+
+    def test_failed_mutations_are_rolled_back(self):
+        """Test que création, modification, suppression et opérations groupées en échec ne laissent aucune trace"""
+        before = self.state(self.task_manager)
+        self.fail_writes()
+        for mutation in [lambda: self.task_manager.create_task("Perdue", "client"),
+                         lambda: self.task_manager.update_task(1, title="Perdue"),
+                         lambda: self.task_manager.change_tasks_status([1, 3], "DONE"),
+                         lambda: self.task_manager.delete_task(2),
+                         lambda: self.task_manager.delete_tasks([1, 3])]:
+            with pytest.raises(StorageError):
+                mutation()
+            assert self.state(self.task_manager) == before
+
+        self.monkeypatch.undo()
+        assert self.task_manager.create_task("Suivante")["id"] == 4
+        assert self.state(self.task_manager) == self.state(TaskManager(data_file=self.data_file, journal=self.journal))
+
+    def test_failed_transaction_save_is_rolled_back(self):
+        """Test que la sauvegarde en échec d'une transaction annule toutes ses mutations"""
+        before = self.state(self.task_manager)
+        with pytest.raises(StorageError):
+            with self.task_manager.transaction():
+                self.task_manager.create_task("Perdue")
+                self.task_manager.delete_task(2)
+                self.fail_writes()
+
+        assert self.state(self.task_manager) == before
+
+class TestGroupCommit:
+    """Tests pour le regroupement des écritures"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        TaskManager(data_file=self.data_file).create_tasks([{"title": f"Tâche {i}"} for i in range(20)])
+
+    def saved_statuses(self):
+        return {task["status"] for task in TaskManager(data_file=self.data_file).tasks}
+
+    def test_burst_is_saved_once(self, fsyncs):
+        """Test qu'une rafale de mutations est sauvegardée en une seule écriture"""
+        task_manager = TaskManager(data_file=self.data_file, group_commit=60)
+        for task_id in range(1, 21):
+            task_manager.change_task_status(task_id, "DONE")
+
+        assert fsyncs == []
+        assert self.saved_statuses() == {"TODO"}
+        assert task_manager.flush() == 20
+        assert len(fsyncs) == 2
+        assert self.saved_statuses() == {"DONE"}
+
+    def test_window_expiry_saves(self):
+        """Test que les mutations sont sauvegardées à la fin de la fenêtre"""
+        task_manager = TaskManager(data_file=self.data_file, group_commit=0.01)
+        task_manager.change_task_status(1, "DONE")
+
+        deadline = time.monotonic() + 5
+        while "DONE" not in self.saved_statuses() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "DONE" in self.saved_statuses()
+        assert task_manager.flush() == 0
+
+    def test_pending_mutations_are_saved_at_exit(self):
+        """Test que les mutations en attente sont sauvegardées à la sortie du processus"""
+        task_manager = TaskManager(data_file=self.data_file, group_commit=60)
+        task_manager.delete_task(1)
+
+        task_manager_module._flush_group_commits()
+
+        assert len(TaskManager(data_file=self.data_file).tasks) == 19
+
+    def test_failed_flush_keeps_mutations(self, monkeypatch):
+        """Test qu'une sauvegarde groupée en échec garde les mutations pour la suivante"""
+        task_manager = TaskManager(data_file=self.data_file, group_commit=60)
+        task_manager.change_task_status(1, "DONE")
+
+        real_save = task_manager.storage.save
+        def failing_save(tasks):
+            raise StorageError("Could not save tasks: disk full")
+        monkeypatch.setattr(task_manager.storage, "save", failing_save)
+        with pytest.raises(StorageError):
+            task_manager.flush()
+
+        monkeypatch.setattr(task_manager.storage, "save", real_save)
+        assert task_manager.flush() == 1
+        assert self.saved_statuses() == {"TODO", "DONE"}
+
+    def test_flush_replays_over_other_writers(self):
+        """Test que le flush recharge les écritures d'un autre processus et rejoue par-dessus les mutations en attente"""
+        grouped = TaskManager(data_file=self.data_file, group_commit=60)
+        other = TaskManager(data_file=self.data_file)
+        created = grouped.create_task("Depuis A")
+        grouped.change_task_status(2, "DONE")
+        grouped.delete_task(3)
+        assert other.create_task("Depuis B")["id"] == created["id"]
+        other.update_task(2, title="Renommée par B")
+        other.delete_task(4)
+
+        assert grouped.flush() == 3
+        saved = {task["id"]: task for task in TaskManager(data_file=self.data_file).tasks}
+        assert saved[21]["title"] == "Depuis B"
+        assert saved[22]["title"] == "Depuis A"
+        assert saved[2]["status"] == "DONE"
+        assert 3 not in saved and 4 not in saved
+        assert grouped.create_task("Suivante")["id"] == 23
+
+    def test_pending_create_then_delete_is_dropped(self):
+        """Test qu'une tâche créée puis supprimée avant le flush ne supprime pas la tâche d'un autre processus"""
+        grouped = TaskManager(data_file=self.data_file, group_commit=60)
+        task_id = grouped.create_task("Éphémère")["id"]
+        grouped.delete_task(task_id)
+        TaskManager(data_file=self.data_file).create_task("Depuis B")
+
+        assert grouped.flush() == 0
+        assert [task["title"] for task in TaskManager(data_file=self.data_file).tasks][-1] == "Depuis B"
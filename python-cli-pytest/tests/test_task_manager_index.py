@@ -0,0 +1,62 @@
+# test_task_manager_index.py - Tests pour l'index des tâches par ID
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+
+class TestTaskIdIndex:
+    """Tests pour l'index id -> tâche et le compteur d'IDs"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.task_manager = TaskManager(data_file=self.data_file)
+
+    def test_lookup_after_delete_keeps_other_tasks(self):
+        """Test que la suppression ne retire que la tâche visée de l'index"""
+        tasks = [self.task_manager.create_task(f"Tâche {i}") for i in range(5)]
+        self.task_manager.delete_task(tasks[2]["id"])
+
+        assert self.task_manager.get_task_by_id(tasks[3]["id"])["title"] == "Tâche 3"
+        with pytest.raises(ValueError, match="Task not found"):
+            self.task_manager.get_task_by_id(tasks[2]["id"])
+
+    def test_ids_are_not_reused_after_delete(self):
+        """Test que le compteur d'IDs ne réattribue pas l'ID de la dernière tâche supprimée"""
+        self.task_manager.create_task("Tâche 1")
+        task2 = self.task_manager.create_task("Tâche 2")
+        self.task_manager.delete_task(task2["id"])
+
+        task3 = self.task_manager.create_task("Tâche 3")
+        assert task3["id"] == 3
+
+    def test_get_tasks_preserves_insertion_order(self):
+        """Test que la liste conserve l'ordre d'insertion après suppression"""
+        for i in range(4):
+            self.task_manager.create_task(f"Tâche {i}")
+        self.task_manager.delete_task(2)
+
+        result = self.task_manager.get_tasks()
+        assert [task["id"] for task in result["tasks"]] == [1, 3, 4]
+
+    def test_assigning_tasks_rebuilds_index(self):
+        """Test que l'affectation de la liste reconstruit l'index et le compteur"""
+        self.task_manager.tasks = [
+            {"id": 7, "title": "A", "description": "", "status": "TODO", "created_at": "2025-01-01T00:00:00"},
+            {"id": 3, "title": "B", "description": "", "status": "TODO", "created_at": "2025-01-01T00:00:00"},
+        ]
+
+        assert self.task_manager.get_task_by_id(3)["title"] == "B"
+        assert self.task_manager.create_task("C")["id"] == 8
+
+    def test_assigning_tasks_forces_snapshot_in_journal_mode(self):
+        """Test qu'une affectation complète est sauvegardée en instantané en mode journalisé"""
+        journaled = TaskManager(data_file=self.data_file, journal=True)
+        journaled.create_task("Ancienne tâche")
+        journaled.tasks = []
+        journaled.create_task("Nouvelle tâche")
+
+        reloaded = TaskManager(data_file=self.data_file)
+        assert [task["title"] for task in reloaded.tasks] == ["Nouvelle tâche"]
@@ -0,0 +1,73 @@
+# test_task_manager_journal.py - Tests pour le stockage journalisé
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+
+class TestJournalStorage:
+    """Tests pour le mode de stockage journalisé"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.task_manager = TaskManager(data_file=self.data_file, journal=True)
+
+    def test_mutations_are_appended_to_journal(self):
+        """Test que les mutations sont ajoutées au journal sans réécrire l'instantané"""
+        task = self.task_manager.create_task("Tâche journalisée")
+        self.task_manager.change_task_status(task["id"], "DONE")
+
+        assert not os.path.exists(self.data_file)
+        with open(self.task_manager.storage.journal_file, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [record["op"] for record in records] == ["put", "put"]
+        assert records[1]["task"]["status"] == "DONE"
+
+    def test_reload_replays_snapshot_and_journal(self):
+        """Test que le rechargement rejoue l'instantané puis le journal"""
+        task1 = self.task_manager.create_task("Tâche 1")
+        self.task_manager.compact()
+        task2 = self.task_manager.create_task("Tâche 2")
+        self.task_manager.update_task(task1["id"], title="Tâche 1 modifiée")
+        self.task_manager.delete_task(task2["id"])
+
+        reloaded = TaskManager(data_file=self.data_file, journal=True)
+        assert [task["title"] for task in reloaded.tasks] == ["Tâche 1 modifiée"]
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        """Test que le journal est replié dans l'instantané au-delà du seuil"""
+        task_manager = TaskManager(data_file=self.data_file, journal=True, compact_threshold=200)
+        for i in range(5):
+            task_manager.create_task(f"Tâche {i}", "Description assez longue pour dépasser le seuil")
+
+        with open(self.data_file, encoding='utf-8') as f:
+            snapshot = json.load(f)
+        assert len(snapshot) >= 1
+        assert len(TaskManager(data_file=self.data_file).tasks) == 5
+
+    def test_truncated_last_record_is_ignored(self):
+        """Test qu'un dernier enregistrement tronqué n'empêche pas le chargement ni les écritures suivantes"""
+        self.task_manager.create_task("Tâche complète")
+        with open(self.task_manager.storage.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"op": "put", "task": {"id": 2, "ti')
+
+        reloaded = TaskManager(data_file=self.data_file, journal=True)
+        assert [task["title"] for task in reloaded.tasks] == ["Tâche complète"]
+
+        reloaded.create_task("Après l'arrêt")
+        reloaded.create_task("Encore après")
+        titles = [task["title"] for task in TaskManager(data_file=self.data_file, journal=True).tasks]
+        assert titles == ["Tâche complète", "Après l'arrêt", "Encore après"]
+
+    def test_full_save_removes_journal(self):
+        """Test qu'une sauvegarde complète supprime le journal devenu inutile"""
+        self.task_manager.create_task("Tâche")
+
+        plain_manager = TaskManager(data_file=self.data_file)
+        plain_manager.create_task("Autre tâche")
+
+        assert not os.path.exists(plain_manager.storage.journal_file)
+        assert len(TaskManager(data_file=self.data_file).tasks) == 2
@@ -0,0 +1,40 @@
+# test_task_manager_lazy.py - Tests pour l'instance globale créée à la demande
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.task_manager as task_manager_module
+
+class TestLazyGlobalInstance:
+    """Tests pour la création différée de l'instance globale"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(task_manager_module, "_task_manager", None)
+
+    def test_instance_is_created_on_first_use(self):
+        """Test que le stockage n'est chargé qu'au premier appel d'une fonction globale"""
+        assert not task_manager_module.is_task_manager_loaded()
+
+        task_manager_module.create_task("Tâche")
+
+        assert task_manager_module.is_task_manager_loaded()
+        assert task_manager_module.get_task_manager().load_seconds >= 0
+
+    def test_instance_is_reused(self):
+        """Test que les appels suivants réutilisent la même instance"""
+        first = task_manager_module.get_task_manager()
+
+        assert task_manager_module.get_task_manager() is first
+
+    def test_environment_selects_storage(self, monkeypatch):
+        """Test que les variables d'environnement configurent l'instance globale"""
+        monkeypatch.setenv("TASKS_STORAGE", "sqlite")
+        monkeypatch.setenv("TASKS_FILE", "autre.db")
+
+        task_manager = task_manager_module.get_task_manager()
+
+        assert task_manager.storage.path == "autre.db"
+        task_manager.storage.close()
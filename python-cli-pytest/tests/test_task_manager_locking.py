@@ -0,0 +1,79 @@
+# test_task_manager_locking.py - Tests pour les accès concurrents entre processus
+import sys
+import os
+import multiprocessing
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.locking import FileLock
+
+def create_many(kind, path, worker, count):
+    """Crée des tâches depuis un processus séparé"""
+    storage = create_storage(kind, path)
+    task_manager = TaskManager(storage=storage)
+    for i in range(count):
+        task_manager.create_task(f"Processus {worker} - tâche {i}")
+    storage.close()
+
+class TestConcurrentProcesses:
+    """Tests pour le verrouillage de la lecture-modification-écriture"""
+
+    @pytest.mark.parametrize("kind", ["json", "stream", "sqlite"])
+    def test_concurrent_creates_are_not_lost(self, kind, tmp_path):
+        """Test qu'aucune création n'est perdue quand plusieurs processus écrivent en même temps"""
+        path = str(tmp_path / f"tasks.{kind}")
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=create_many, args=(kind, path, worker, 15)) for worker in range(4)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+
+        storage = create_storage(kind, path)
+        tasks = TaskManager(storage=storage).tasks
+        storage.close()
+        assert len(tasks) == 60
+        assert len({task["id"] for task in tasks}) == 60
+
+class TestReloadIfChanged:
+    """Tests pour le rechargement des tâches modifiées par un autre processus"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.task_manager = TaskManager(data_file=self.data_file)
+        self.task_manager.create_task("Tâche 1")
+
+    def count_loads(self, monkeypatch, task_manager):
+        """Compte les chargements complets du stockage"""
+        loads = []
+        original = task_manager.storage.load
+        monkeypatch.setattr(task_manager.storage, "load", lambda: loads.append(1) or original())
+        return loads
+
+    def test_no_reload_when_unchanged(self, monkeypatch):
+        """Test que le stockage n'est pas relu s'il n'a pas changé, y compris après ses propres écritures"""
+        loads = self.count_loads(monkeypatch, self.task_manager)
+        self.task_manager.create_task("Tâche 2")
+        self.task_manager.get_tasks()
+        self.task_manager.search_tasks("tâche")
+
+        assert loads == []
+
+    def test_reload_after_external_write(self, monkeypatch):
+        """Test qu'une écriture d'un autre gestionnaire est vue sans recréer l'instance"""
+        other = TaskManager(data_file=self.data_file)
+        loads = self.count_loads(monkeypatch, self.task_manager)
+        other.create_task("Tâche externe")
+
+        assert [task["title"] for task in self.task_manager.get_tasks()["tasks"]] == ["Tâche 1", "Tâche externe"]
+        assert self.task_manager.create_task("Tâche 3")["id"] == 3
+        assert len(loads) == 1
+
+    def test_generation_detects_same_size_rewrite(self):
+        """Test que la génération signale une modification invisible dans la date et la taille"""
+        before = self.task_manager.storage.signature()
+        FileLock(self.data_file + ".lock").bump()
+
+        assert self.task_manager.storage.signature() != before
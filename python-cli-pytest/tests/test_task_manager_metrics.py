@@ -0,0 +1,99 @@
+# test_task_manager_metrics.py - Tests pour l'instrumentation des opérations
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.metrics import Metrics
+
+class TestMetrics:
+    """Tests pour les compteurs d'opérations"""
+
+    def test_histogram_buckets(self):
+        """Test que chaque appel est rangé dans la classe de sa borne supérieure"""
+        metrics = Metrics()
+        metrics.record("op", 0.0004)
+        metrics.record("op", 0.002)
+        metrics.record("op", 10.0, error=True)
+
+        stats = metrics.snapshot()["op"]
+        assert (stats["calls"], stats["errors"]) == (3, 1)
+        assert stats["histogram_ms"]["0.5"] == 1
+        assert stats["histogram_ms"]["5"] == 1
+        assert stats["histogram_ms"]["+inf"] == 1
+        assert stats["max_ms"] == pytest.approx(10000)
+
+    def test_json_export(self):
+        """Test que l'export JSON reflète les compteurs"""
+        metrics = Metrics()
+        metrics.record("save", 0.001, bytes_written=120)
+
+        assert json.loads(metrics.to_json()) == metrics.snapshot()
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+class TestTaskManagerMetrics:
+    """Tests pour l'instrumentation de TaskManager"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+
+    def test_disabled_by_default(self):
+        """Test que l'instrumentation est désactivée par défaut"""
+        task_manager = TaskManager(data_file=self.data_file)
+        task_manager.create_task("Tâche")
+
+        assert task_manager.metrics is None
+        assert task_manager.get_stats()["operations"] is None
+
+    def test_public_operations_are_counted_once(self):
+        """Test que seules les opérations publiques sont comptées, pas leurs appels imbriqués"""
+        task_manager = TaskManager(data_file=self.data_file, metrics=True)
+        task = task_manager.create_task("Tâche")
+        task_manager.search_tasks("")
+        task_manager.get_task_by_id(task["id"])
+        with pytest.raises(ValueError):
+            task_manager.delete_task(42)
+
+        operations = task_manager.metrics.snapshot()
+        assert operations["create_task"]["calls"] == 1
+        assert operations["search_tasks"]["calls"] == 1
+        assert "get_tasks" not in operations
+        assert "get_status_counts" not in operations
+        assert operations["delete_task"]["errors"] == 1
+
+    def test_load_and_write_bytes(self):
+        """Test que le chargement est mesuré et que les octets écrits correspondent au fichier"""
+        task_manager = TaskManager(data_file=self.data_file, metrics=True)
+        task_manager.create_task("Tâche", "Description")
+        task_manager.compact()
+
+        operations = task_manager.metrics.snapshot()
+        assert operations["load"]["calls"] == 1
+        assert operations["write"]["bytes_written"] == os.path.getsize(self.data_file)
+        assert operations["save"]["bytes_written"] == os.path.getsize(self.data_file)
+        assert operations["create_task"]["bytes_written"] == operations["write"]["bytes_written"]
+
+    def test_journal_bytes(self):
+        """Test que les ajouts au journal sont comptés"""
+        task_manager = TaskManager(data_file=self.data_file, journal=True, metrics=True)
+        task_manager.create_task("Tâche")
+
+        assert task_manager.metrics.snapshot()["write"]["bytes_written"] == os.path.getsize(self.data_file + ".journal")
+
+    @pytest.mark.parametrize("kind", ["json", "stream", "sqlite"])
+    def test_stats(self, tmp_path, kind):
+        """Test que les statistiques donnent la taille du stockage et les comptages"""
+        task_manager = TaskManager(storage=create_storage(kind, str(tmp_path / f"tasks.{kind}")), metrics=True)
+        task = task_manager.create_task("Tâche")
+        task_manager.change_task_status(task["id"], "DONE")
+        task_manager.create_task("Autre tâche")
+
+        stats = task_manager.get_stats()
+        assert stats["storage"]["bytes"] > 0
+        assert stats["tasks"] == {"total": 2, "status_counts": {"TODO": 1, "ONGOING": 0, "DONE": 1}}
+        assert stats["operations"]["create_task"]["calls"] == 2
+        assert json.loads(json.dumps(stats)) == stats
@@ -0,0 +1,72 @@
+# test_task_manager_models.py - Tests pour la représentation compacte des tâches
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.models import Task
+
+class TestTaskRecord:
+    """Tests unitaires de Task"""
+
+    def test_round_trip_keeps_dict_shape(self):
+        """Test que la conversion dictionnaire -> Task -> dictionnaire est sans perte"""
+        data = {"id": 1, "title": "A", "description": "B", "status": "ONGOING",
+                "created_at": "2025-07-01T13:40:13.123456"}
+        task = Task.from_dict(data)
+
+        assert isinstance(task.created, int)
+        assert task.to_dict() == data
+
+    @pytest.mark.parametrize("created_at", [
+        "2025-07-01 13:40:13", "2025-07-01T13:40:13.000000", "2025-07-01T13:40:13+02:00", "hier"
+    ])
+    def test_non_canonical_dates_are_kept_verbatim(self, created_at):
+        """Test qu'une date qui ne se réécrirait pas à l'identique est conservée telle quelle"""
+        task = Task.from_dict({"id": 1, "title": "A", "description": "", "status": "TODO",
+                               "created_at": created_at})
+
+        assert task.created_at == created_at
+
+    def test_statuses_are_shared(self):
+        """Test que le statut est une chaîne partagée entre les tâches"""
+        first = Task.from_dict({"id": 1, "title": "A", "description": "", "status": "".join(["DO", "NE"]),
+                                "created_at": "2025-01-01T00:00:00"})
+        second = Task(2, "B", "", "".join(["D", "ONE"]), 0)
+
+        assert first.status is second.status
+
+    def test_record_has_no_instance_dict(self):
+        """Test que la tâche n'a pas de dictionnaire d'attributs"""
+        assert not hasattr(Task(1, "A", "", "TODO", 0), "__dict__")
+
+class TestApiBoundary:
+    """Tests pour la conversion en dictionnaire aux frontières de l'API"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.task_manager = TaskManager(data_file=self.data_file)
+
+    def test_tasks_are_stored_as_records(self):
+        """Test que les tâches sont conservées sous forme compacte en mémoire"""
+        self.task_manager.create_task("Tâche")
+
+        assert all(isinstance(task, Task) for task in self.task_manager._tasks.values())
+        assert isinstance(self.task_manager.tasks[0], dict)
+
+    def test_returned_dicts_are_copies(self):
+        """Test que modifier un dictionnaire retourné ne modifie pas la tâche stockée"""
+        task = self.task_manager.create_task("Tâche")
+        task["title"] = "Modifiée hors API"
+
+        assert self.task_manager.get_task_by_id(task["id"])["title"] == "Tâche"
+
+    def test_reload_preserves_fields(self):
+        """Test que la sauvegarde puis le rechargement conservent tous les champs"""
+        task = self.task_manager.create_task("Tâche", "Description")
+        self.task_manager.change_task_status(task["id"], "DONE")
+
+        reloaded = TaskManager(data_file=self.data_file)
+        assert reloaded.get_task_by_id(task["id"]) == {**task, "status": "DONE"}
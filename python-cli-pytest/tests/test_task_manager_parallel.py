@@ -0,0 +1,106 @@
+# test_task_manager_parallel.py - Tests pour la recherche répartie sur plusieurs processus
+import sys
+import os
+import subprocess
+import threading
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.models import Task
+from src.parallel import ParallelSearch, encode_chunk, search_chunk
+
+class TestChunkSearch:
+    """Tests pour l'encodage et la recherche d'une tranche"""
+
+    def test_matches_stay_within_a_field(self, tmp_path):
+        """Test qu'une occurrence à cheval sur deux champs est ignorée et qu'une tâche n'apparaît qu'une fois"""
+        path = tmp_path / "chunk.bin"
+        path.write_bytes(encode_chunk([("Abc", "Déf"), ("xyz", "abc abc"), ("", "cd")]))
+
+        assert search_chunk(0, str(path), "abc".encode("utf-8")) == [0, 1]
+        assert search_chunk(0, str(path), "cd".encode("utf-8")) == [2]
+        assert search_chunk(0, str(path), "déf".encode("utf-8")) == [0]
+
+class TestParallelSearch:
+    """Tests pour les tranches partagées avec le groupe de processus"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.tasks = {task_id: Task(task_id, f"Tâche {task_id}", "projet" if task_id % 3 == 0 else "", "TODO", 0)
+                      for task_id in range(1, 11)}
+        self.search = ParallelSearch(workers=2, chunk_size=3)
+        for task_id in self.tasks:
+            self.search.add(task_id)
+        yield
+        self.search.close()
+
+    def test_results_keep_insertion_order(self):
+        """Test que les résultats des tranches sont fusionnés dans l'ordre d'insertion"""
+        assert self.search.search("PROJET", self.tasks) == [3, 6, 9]
+        assert self.search.search("tâche 1", self.tasks) == [1, 10]
+
+    def test_only_changed_chunks_are_rewritten(self):
+        """Test qu'une mutation ne réécrit que sa tranche et qu'elle est prise en compte"""
+        self.search.search("projet", self.tasks)
+        paths = list(self.search._paths)
+        self.tasks[4].description = "projet"
+        self.search.add(4)
+        self.search.remove(9)
+        del self.tasks[9]
+
+        assert self.search.search("projet", self.tasks) == [3, 4, 6]
+        assert [old == new for old, new in zip(paths, self.search._paths)] == [True, False, False, True]
+
+class TestParallelTaskManager:
+    """Tests pour la recherche parallèle de TaskManager"""
+
+    def test_same_results_as_serial_search(self, tmp_path):
+        """Test que la recherche parallèle suit les mutations et donne les mêmes pages que la recherche séquentielle"""
+        data_file = str(tmp_path / "tasks.json")
+        task_manager = TaskManager(data_file=data_file, parallel_search=True, parallel_threshold=1)
+        for i in range(12):
+            task_manager.create_task(f"Rapport {i}" if i % 2 else f"Note {i}", "client" if i % 3 == 0 else "")
+        task_manager.update_task(2, title="Rapport du client")
+        task_manager.delete_task(4)
+
+        try:
+            parallel = task_manager.search_tasks("rapport", page_size=3, page=2)
+            assert task_manager._parallel._pool is not None
+        finally:
+            task_manager._parallel.close()
+
+        assert parallel == TaskManager(data_file=data_file).search_tasks("rapport", page_size=3, page=2)
+
+    def test_mutation_after_parallel_search(self, tmp_path):
+        """Test que les processus de recherche n'héritent pas du verrou du fichier de données"""
+        task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"), parallel_search=True, parallel_threshold=5)
+        for i in range(6):
+            task_manager.create_task(f"Projet {i}", "")
+
+        try:
+            assert len(task_manager.search_tasks("projet")["tasks"]) == 6
+            created = []
+            writer = threading.Thread(target=lambda: created.append(task_manager.create_task("x")), daemon=True)
+            writer.start()
+            writer.join(timeout=10)
+            assert not writer.is_alive()
+            assert created[0]["title"] == "x"
+        finally:
+            task_manager._parallel.close()
+
+    def test_serial_below_threshold(self, tmp_path):
+        """Test qu'en dessous du seuil la recherche reste séquentielle"""
+        task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"), parallel_search=True, parallel_threshold=100)
+        task_manager.create_task("Rapport", "")
+
+        assert [task["id"] for task in task_manager.search_tasks("rapport")["tasks"]] == [1]
+        assert task_manager._parallel._pool is None
+
+    def test_process_pool_is_imported_on_first_search(self):
+        """Test que l'import de TaskManager ne charge pas multiprocessing"""
+        code = "import sys; import src.task_manager; print('concurrent.futures.process' in sys.modules)"
+        root = os.path.join(os.path.dirname(__file__), '..')
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
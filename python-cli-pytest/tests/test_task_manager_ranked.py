@@ -0,0 +1,124 @@
+# test_task_manager_ranked.py - Tests pour la recherche classée par pertinence
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.indexes import InvertedIndex, fold, tokenize
+
+class TestTokenizer:
+    """Tests pour le découpage en mots"""
+
+    def test_case_and_accents_are_folded(self):
+        """Test que la casse et les accents sont ignorés"""
+        assert fold("Réunion ÉLÈVE Noël") == "reunion eleve noel"
+        assert tokenize("Préparer l'ordre du jour, 2e réunion!") == ["preparer", "l", "ordre", "du", "jour", "2e", "reunion"]
+
+class TestInvertedIndex:
+    """Tests pour l'index mot -> tâches"""
+
+    def test_top_k_keeps_best_scores(self):
+        """Test que seules les meilleures tâches sont retournées avec le nombre total de correspondances"""
+        index = InvertedIndex()
+        for task_id in range(1, 11):
+            index.add(task_id, "rapport" if task_id % 2 else "autre", "rapport " * task_id)
+
+        total, best = index.search("rapport", 3)
+
+        assert total == 10
+        assert [task_id for task_id, _ in best] == [9, 7, 5]
+        assert best[0][1] > best[1][1] > best[2][1]
+
+    def test_ties_are_ordered_by_id(self):
+        """Test qu'à score égal l'ordre suit les IDs"""
+        index = InvertedIndex()
+        for task_id in (3, 1, 2):
+            index.add(task_id, "Facture", "")
+
+        assert [task_id for task_id, _ in index.search("facture", 10)[1]] == [1, 2, 3]
+
+    def test_empty_index(self):
+        """Test qu'un index vide ou vidé ne retourne aucune tâche, dans les deux modes"""
+        index = InvertedIndex()
+        assert index.search("facture", 10, "any") == (0, [])
+
+        index.add(1, "Facture", "")
+        index.remove(1)
+        assert index.search("facture", 10, "any") == (0, [])
+        assert index.search("facture", 10, "all") == (0, [])
+
+    def test_remove_and_reindex(self):
+        """Test que la réindexation et la suppression mettent à jour les occurrences"""
+        index = InvertedIndex()
+        index.add(1, "Facture", "")
+        index.add(1, "Devis", "")
+        index.add(2, "Devis", "")
+        index.remove(2)
+
+        assert index.search("facture", 10) == (0, [])
+        assert [task_id for task_id, _ in index.search("devis", 10)[1]] == [1]
+        assert len(index) == 1
+
+class TestSearchRanked:
+    """Tests pour TaskManager.search_ranked"""
+
+    @pytest.fixture(autouse=True, params=["json", "stream", "sqlite"])
+    def setup(self, request, tmp_path):
+        storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+        self.task_manager = TaskManager(storage=storage)
+        self.task_manager.create_task("Appeler le client", "")
+        self.task_manager.create_task("Réunion d'équipe", "Préparer la facture du client")
+        self.task_manager.create_task("Facture client Dupont", "Envoyer la facture")
+        self.task_manager.create_task("Courses", "")
+
+    def ids(self, result):
+        return [task["id"] for task in result["tasks"]]
+
+    def test_all_words_are_required(self):
+        """Test que le mode all exige tous les mots, quel que soit leur ordre"""
+        result = self.task_manager.search_ranked("FACTURE client")
+
+        assert self.ids(result) == [3, 2]
+        assert result["pagination"]["total_tasks"] == 2
+        assert result["tasks"][0]["score"] > result["tasks"][1]["score"]
+
+    def test_any_word_matches(self):
+        """Test que le mode any retient les tâches contenant au moins un mot"""
+        result = self.task_manager.search_ranked("reunion courses", match="any")
+
+        assert sorted(self.ids(result)) == [2, 4]
+
+    def test_title_is_weighted_higher(self):
+        """Test qu'un mot du titre compte plus qu'un mot de la description"""
+        assert self.ids(self.task_manager.search_ranked("client"))[:2] == [1, 3]
+
+    def test_pagination_and_status(self):
+        """Test que les pages suivent le classement et que le filtre de statut s'applique"""
+        self.task_manager.change_task_status(3, "DONE")
+
+        second_page = self.task_manager.search_ranked("client", page=2, page_size=2)
+        assert self.ids(second_page) == [2]
+        assert second_page["pagination"]["next_cursor"] is None
+        assert self.ids(self.task_manager.search_ranked("client", status="DONE")) == [3]
+
+    def test_index_follows_mutations(self):
+        """Test que l'index suit les modifications et les suppressions"""
+        self.task_manager.search_ranked("client")
+        self.task_manager.update_task(4, title="Courses pour le client")
+        self.task_manager.delete_task(3)
+
+        assert sorted(self.ids(self.task_manager.search_ranked("client"))) == [1, 2, 4]
+
+    def test_no_matching_task(self):
+        """Test qu'aucune tâche retenue (statut vide, tâches supprimées) donne une page vide"""
+        assert self.ids(self.task_manager.search_ranked("facture", status="DONE", match="any")) == []
+
+        self.task_manager.delete_tasks([1, 2, 3, 4])
+        result = self.task_manager.search_ranked("facture", match="any")
+        assert result["tasks"] == [] and result["pagination"]["total_tasks"] == 0
+
+    def test_invalid_match(self):
+        """Test qu'un mode de correspondance inconnu est refusé"""
+        with pytest.raises(ValueError, match="Invalid match mode"):
+            self.task_manager.search_ranked("client", match="some")
@@ -0,0 +1,122 @@
+# test_task_manager_report.py - Tests pour le rapport de synthèse des tâches
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.analytics as analytics_module
+from src.analytics import Columns, summarize
+from src.models import timestamp_of
+from src.task_manager import TaskManager, create_storage
+
+TASKS = [
+    {"id": 1, "title": "A", "description": "", "status": "TODO", "created_at": "2024-01-05T10:00:00"},
+    {"id": 2, "title": "B", "description": "", "status": "DONE", "created_at": "2024-01-05T18:00:00"},
+    {"id": 3, "title": "C", "description": "", "status": "ONGOING", "created_at": "2024-01-08T09:00:00"},
+    {"id": 4, "title": "D", "description": "", "status": "TODO", "created_at": "2024-01-09T13:00:00"},
+    {"id": 5, "title": "E", "description": "", "status": "TODO", "created_at": "pas une date"},
+]
+NOW = "2024-01-10T12:00:00"
+
+class TestColumns:
+    """Tests pour les colonnes tenues à jour"""
+
+    def test_update_and_swap_remove(self):
+        """Test qu'une mise à jour réécrit la ligne et qu'une suppression déplace la dernière ligne"""
+        columns = Columns([1, 2, 3], ["TODO", "TODO", "DONE"], [10, 20, 30])
+        columns.add(2, "DONE", None)
+        columns.remove(1)
+        columns.add(4, "ONGOING", 40)
+
+        assert list(columns.ids) == [3, 2, 4]
+        assert list(columns.statuses) == [2, 2, 1]
+        assert list(columns.created) == [30, analytics_module.MISSING, 40]
+
+class TestSummarize:
+    """Tests pour le calcul des agrégats"""
+
+    @pytest.fixture(params=["default", "array"])
+    def engine(self, request, monkeypatch):
+        if request.param == "array":
+            monkeypatch.setattr(analytics_module, "load_numpy", lambda: None)
+        return request.param
+
+    def summary(self):
+        columns = Columns([task["id"] for task in TASKS], [task["status"] for task in TASKS],
+                          [timestamp_of(task["created_at"]) for task in TASKS])
+        return summarize(columns, timestamp_of(NOW))
+
+    def test_status_counts_and_histograms(self, engine):
+        """Test les comptages par statut et les créations par jour et par semaine ISO, jours vides compris"""
+        summary = self.summary()
+
+        assert summary["total"] == 5
+        assert summary["status_counts"] == {"TODO": 3, "ONGOING": 1, "DONE": 1}
+        assert summary["created_per_day"] == {"2024-01-05": 2, "2024-01-06": 0, "2024-01-07": 0,
+                                              "2024-01-08": 1, "2024-01-09": 1}
+        assert summary["created_per_week"] == {"2024-W01": 2, "2024-W02": 2}
+
+    def test_open_task_ages(self, engine):
+        """Test l'âge des tâches non terminées, sans les dates illisibles"""
+        ages = self.summary()["open_ages"]
+
+        assert ages["count"] == 3
+        assert ages["max_days"] == 5.08
+        assert ages["median_days"] == 2.12
+        assert ages["buckets"] == {"0-1": 1, "1-7": 2, "7-30": 0, "30-90": 0, "90+": 0}
+
+    def test_empty(self, engine):
+        """Test un rapport sans tâches"""
+        summary = summarize(Columns(), timestamp_of(NOW))
+
+        assert summary["total"] == 0
+        assert summary["created_per_day"] == {}
+        assert summary["open_ages"]["count"] == 0
+
+class TestGetReport:
+    """Tests pour TaskManager.get_report"""
+
+    @pytest.fixture(autouse=True, params=["json", "stream", "sqlite"])
+    def setup(self, request, tmp_path):
+        self.kind = request.param
+        self.path = str(tmp_path / f"tasks.{request.param}")
+        storage = create_storage(self.kind, self.path)
+        storage.save(TASKS)
+        self.task_manager = TaskManager(storage=storage)
+
+    def test_report_follows_mutations(self):
+        """Test que le rapport tient compte des mutations suivantes"""
+        assert self.task_manager.get_report(NOW)["status_counts"] == {"TODO": 3, "ONGOING": 1, "DONE": 1}
+        self.task_manager.change_task_status(1, "DONE")
+        self.task_manager.delete_task(3)
+        self.task_manager.create_task("F")
+
+        report = self.task_manager.get_report(NOW)
+        assert report["status_counts"] == {"TODO": 3, "ONGOING": 0, "DONE": 2}
+        assert report["created_per_day"]["2024-01-08"] == 0
+        assert report["seconds"] >= 0
+
+    def test_report_rows_skip_full_tasks(self, monkeypatch):
+        """Test que le rapport ne lit que l'ID, le statut et la date, sans charger les tâches"""
+        assert sorted(self.task_manager.storage.report_rows()) == [
+            (task["id"], task["status"], task["created_at"]) for task in TASKS]
+        monkeypatch.setattr(self.task_manager.storage, "load", None)
+
+        assert self.task_manager.get_report(NOW)["total"] == 5
+
+    def test_report_follows_other_writers_and_transactions(self):
+        """Test que les colonnes lues hors mémoire suivent les écritures d'un autre processus et des transactions"""
+        self.task_manager.get_report(NOW)
+        other = TaskManager(storage=create_storage(self.kind, self.path))
+        other.change_task_status(1, "DONE")
+        assert self.task_manager.get_report(NOW)["status_counts"]["DONE"] == 2
+
+        with self.task_manager.transaction():
+            self.task_manager.delete_task(2)
+            assert self.task_manager.get_report(NOW)["status_counts"]["DONE"] == 1
+        assert self.task_manager.get_report(NOW)["status_counts"]["DONE"] == 1
+
+    def test_invalid_reference_date(self):
+        """Test qu'une date de référence illisible est refusée"""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            self.task_manager.get_report("demain")
@@ -0,0 +1,67 @@
+# test_task_manager_search_index.py - Tests pour l'index de trigrammes de la recherche
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.indexes import TrigramIndex
+
+class TestTrigramSearch:
+    """Tests pour la recherche accélérée par trigrammes"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"), search_index=True)
+        self.plain_manager = TaskManager(data_file=str(tmp_path / "plain.json"))
+        for title, description in [
+            ("Acheter du pain", "Aller à la boulangerie"),
+            ("Projet Python", "Développer une application"),
+            ("Appeler le client", "Discuter du projet"),
+            ("Faire du sport", ""),
+            ("PROJET Web", "Créer un site internet"),
+        ]:
+            self.task_manager.create_task(title, description)
+            self.plain_manager.create_task(title, description)
+
+    @pytest.mark.parametrize("query", ["projet", "PROJET", "pain", "du", "e", "ÉÉÉ", "inexistant", "er un si"])
+    def test_results_match_linear_scan(self, query):
+        """Test que l'index renvoie les mêmes résultats que le parcours complet"""
+        indexed = self.task_manager.search_tasks(query, page_size=2)
+        plain = self.plain_manager.search_tasks(query, page_size=2)
+
+        assert [task["id"] for task in indexed["tasks"]] == [task["id"] for task in plain["tasks"]]
+        assert indexed["pagination"] == plain["pagination"]
+
+    def test_index_follows_updates_and_deletes(self):
+        """Test que l'index est mis à jour par la modification et la suppression"""
+        self.task_manager.update_task(1, title="Acheter des croissants")
+        self.task_manager.delete_task(2)
+
+        assert self.task_manager.search_tasks("pain")["pagination"]["total_tasks"] == 0
+        assert [task["id"] for task in self.task_manager.search_tasks("croissant")["tasks"]] == [1]
+        assert [task["id"] for task in self.task_manager.search_tasks("projet")["tasks"]] == [3, 5]
+
+    def test_updated_task_keeps_insertion_rank(self):
+        """Test qu'une tâche modifiée conserve sa place dans les résultats"""
+        self.task_manager.update_task(2, description="Nouveau projet")
+
+        assert [task["id"] for task in self.task_manager.search_tasks("projet")["tasks"]] == [2, 3, 5]
+
+    def test_assigning_tasks_rebuilds_index(self):
+        """Test que l'affectation de la liste reconstruit l'index"""
+        self.task_manager.tasks = []
+
+        assert self.task_manager.search_tasks("projet")["pagination"]["total_tasks"] == 0
+
+class TestTrigramIndex:
+    """Tests unitaires de TrigramIndex"""
+
+    def test_remove_cleans_postings(self):
+        """Test que la suppression ne laisse pas de trigrammes orphelins"""
+        index = TrigramIndex()
+        index.add(1, "Bonjour", "")
+        index.remove(1)
+
+        assert len(index) == 0
+        assert index.search("bon") == []
@@ -0,0 +1,97 @@
+# test_task_manager_serialization.py - Tests pour les formats de fichier des tâches
+import sys
+import os
+import json
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import serialization
+from src.task_manager import TaskManager, create_storage
+from src.storage import JsonStorage, JsonStreamStorage, StorageError
+
+class TestSerialization:
+    """Tests pour les formats json, compact et binary"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+
+    def create_tasks(self, storage):
+        task_manager = TaskManager(storage=storage)
+        task_manager.create_task("Réunion client", "Préparer l'ordre du jour ✓")
+        task = task_manager.create_task("Facture", "")
+        task_manager.change_task_status(task["id"], "DONE")
+        return task_manager.tasks
+
+    @pytest.mark.parametrize("storage_class", [JsonStorage, JsonStreamStorage])
+    @pytest.mark.parametrize("format", ["json", "compact", "binary"])
+    def test_round_trip(self, storage_class, format):
+        """Test que les tâches relues sont identiques dans chaque format"""
+        tasks = self.create_tasks(storage_class(self.data_file, format=format))
+
+        assert TaskManager(storage=storage_class(self.data_file, format=format)).tasks == tasks
+
+    def test_default_format_is_indented_json(self):
+        """Test que le format par défaut reste le JSON indenté de json.dump"""
+        tasks = self.create_tasks(JsonStorage(self.data_file))
+
+        with open(self.data_file, encoding='utf-8') as f:
+            assert f.read() == json.dumps(tasks, ensure_ascii=False, indent=2)
+
+    def test_compact_format(self):
+        """Test que le format compact est du JSON sans espaces, plus petit"""
+        self.create_tasks(JsonStorage(self.data_file))
+        indented_size = os.path.getsize(self.data_file)
+        tasks = self.create_tasks(JsonStorage(self.data_file + ".compact", format="compact"))
+
+        with open(self.data_file + ".compact", encoding='utf-8') as f:
+            content = f.read()
+        assert json.loads(content) == tasks
+        assert "\n" not in content
+        assert len(content.encode("utf-8")) < indented_size
+
+    @pytest.mark.parametrize("storage_class", [JsonStorage, JsonStreamStorage])
+    def test_format_is_detected_on_load(self, storage_class):
+        """Test qu'un fichier est lu quel que soit le format configuré, puis converti à la sauvegarde"""
+        tasks = self.create_tasks(storage_class(self.data_file, format="binary"))
+
+        task_manager = TaskManager(storage=storage_class(self.data_file, format="json"))
+        assert task_manager.tasks == tasks
+
+        task_manager.create_task("Nouvelle tâche")
+        with open(self.data_file, encoding='utf-8') as f:
+            assert json.load(f)[:2] == tasks
+
+    def test_binary_blocks(self, monkeypatch):
+        """Test qu'un fichier binaire de plusieurs blocs est lu en entier et paginé en flux"""
+        monkeypatch.setattr(serialization, "BINARY_BLOCK_SIZE", 3)
+        task_manager = TaskManager(storage=JsonStorage(self.data_file, format="binary"))
+        task_manager.create_tasks([{"title": f"Tâche {i}"} for i in range(10)])
+
+        assert [task["id"] for task in JsonStorage(self.data_file).load()] == list(range(1, 11))
+        page = TaskManager(storage=JsonStreamStorage(self.data_file)).get_tasks(page=2, page_size=4)
+        assert [task["id"] for task in page["tasks"]] == [5, 6, 7, 8]
+
+    def test_truncated_binary_file(self):
+        """Test qu'un fichier binaire tronqué est signalé comme un fichier JSON corrompu"""
+        self.create_tasks(JsonStorage(self.data_file, format="binary"))
+        with open(self.data_file, 'r+b') as f:
+            f.truncate(os.path.getsize(self.data_file) - 5)
+
+        with pytest.raises(StorageError, match="Corrupted"):
+            JsonStorage(self.data_file).load()
+        with pytest.raises(StorageError, match="Corrupted"):
+            JsonStreamStorage(self.data_file).load()
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test que la bibliothèque standard produit le même JSON que la bibliothèque rapide"""
+        monkeypatch.setattr(serialization, "orjson", None)
+        tasks = self.create_tasks(JsonStorage(self.data_file, format="compact"))
+
+        assert serialization.dumps(tasks) == json.dumps(tasks, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        assert serialization.decode_tasks(serialization.dumps(tasks, indent=True)) == tasks
+
+    def test_invalid_format(self):
+        """Test qu'un format inconnu est refusé"""
+        with pytest.raises(ValueError, match="Invalid format"):
+            create_storage("json", self.data_file, format="yaml")
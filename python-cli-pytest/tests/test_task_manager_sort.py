@@ -0,0 +1,113 @@
+# test_task_manager_sort.py - Tests pour le tri des listes et des recherches
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import src.task_manager as task_manager_module
+from src.task_manager import TaskManager, create_storage
+from src.indexes import SortedView
+
+TASKS = [
+    {"id": 1, "title": "rapport annuel", "description": "", "status": "DONE", "created_at": "2024-03-01T08:00:00"},
+    {"id": 2, "title": "Appeler le client", "description": "rapport", "status": "TODO", "created_at": "2024-01-10T09:00:00"},
+    {"id": 3, "title": "Courses", "description": "", "status": "ONGOING", "created_at": "2024-02-15T18:30:00"},
+    {"id": 4, "title": "Banque", "description": "rapport", "status": "TODO", "created_at": "2024-01-10T09:00:00"},
+    {"id": 5, "title": "courses", "description": "", "status": "DONE", "created_at": "2024-02-01T00:00:00"},
+]
+
+class TestSortedView:
+    """Tests pour la vue triée (clé, ID)"""
+
+    def test_slices_follow_key_then_id(self):
+        """Test que la vue est triée par clé puis par ID"""
+        view = SortedView({3: "b", 1: "b", 2: "a"})
+
+        assert view[:] == [2, 1, 3]
+        assert view[1:] == [1, 3]
+        assert list(reversed(view)) == [3, 1, 2]
+
+    def test_add_moves_and_remove(self):
+        """Test qu'une clé modifiée déplace la tâche et qu'une tâche retirée disparaît"""
+        view = SortedView({1: "a", 2: "b"})
+        view.add(1, "c")
+        view.add(3, "a")
+        view.remove(2)
+
+        assert list(view) == [3, 1]
+        assert view.key(1) == ("c", 1)
+
+class TestSortedTasks:
+    """Tests pour get_tasks et search_tasks triés"""
+
+    @pytest.fixture(autouse=True, params=["json", "stream", "sqlite"])
+    def setup(self, request, tmp_path):
+        storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+        storage.save(TASKS)
+        self.task_manager = TaskManager(storage=storage)
+
+    def ids(self, result):
+        return [task["id"] for task in result["tasks"]]
+
+    @pytest.mark.parametrize("sort, expected", [
+        ("id", [1, 2, 3, 4, 5]),
+        ("title", [2, 4, 3, 5, 1]),
+        ("status", [2, 4, 3, 1, 5]),
+        ("created_at", [2, 4, 5, 3, 1]),
+    ])
+    def test_sort_orders(self, sort, expected):
+        """Test chaque champ de tri, dans les deux sens (à clé égale, ordre des IDs)"""
+        assert self.ids(self.task_manager.get_tasks(sort=sort)) == expected
+        assert self.ids(self.task_manager.get_tasks(sort=sort, order="desc")) == expected[::-1]
+
+    def test_sorted_pages(self):
+        """Test que les pages se suivent dans l'ordre de tri"""
+        pages = [self.ids(self.task_manager.get_tasks(page, 2, sort="title", order="desc")) for page in (1, 2, 3)]
+
+        assert pages == [[1, 5], [3, 4], [2]]
+
+    def test_sort_with_filters(self):
+        """Test que le tri se combine au statut, à la période et à la recherche"""
+        assert self.ids(self.task_manager.get_tasks(status="TODO", sort="title", order="desc")) == [4, 2]
+        assert self.ids(self.task_manager.get_tasks(created_after="2024-02-01", sort="title")) == [3, 5, 1]
+        assert self.ids(self.task_manager.search_tasks("rapport", sort="created_at", order="desc")) == [1, 4, 2]
+
+    def test_views_follow_mutations(self):
+        """Test que les créations, modifications et suppressions sont prises en compte"""
+        self.task_manager.get_tasks(sort="title")
+        self.task_manager.update_task(1, title="Zèbre")
+        self.task_manager.delete_task(3)
+        task = self.task_manager.create_task("Agenda", "")
+
+        assert self.ids(self.task_manager.get_tasks(sort="title")) == [task["id"], 2, 4, 5, 1]
+
+    def test_cursor_requires_id_order(self):
+        """Test que seule la pagination par ID croissant fournit et accepte un curseur"""
+        assert self.task_manager.get_tasks(1, 2, sort="title")["pagination"]["next_cursor"] is None
+        cursor = self.task_manager.get_tasks(1, 2, sort="id")["pagination"]["next_cursor"]
+
+        assert self.ids(self.task_manager.get_tasks(page_size=2, cursor=cursor, sort="id")) == [3, 4]
+        with pytest.raises(ValueError, match="Cursor pagination"):
+            self.task_manager.get_tasks(page_size=2, cursor=cursor, sort="title")
+
+    def test_invalid_sort(self):
+        """Test qu'un champ ou un sens de tri inconnu est refusé"""
+        with pytest.raises(ValueError, match="Invalid sort field"):
+            self.task_manager.get_tasks(sort="description")
+        with pytest.raises(ValueError, match="Invalid sort order"):
+            self.task_manager.search_tasks("rapport", sort="title", order="up")
+
+class TestSortStrategies:
+    """Tests pour le choix entre tri direct et parcours de la vue"""
+
+    @pytest.mark.parametrize("ratio", [1, 1000])
+    def test_subset_strategies_agree(self, tmp_path, monkeypatch, ratio):
+        """Test que trier les résultats ou parcourir la vue donne les mêmes pages"""
+        monkeypatch.setattr(task_manager_module, "SORT_SCAN_RATIO", ratio)
+        task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"))
+        for i in range(30):
+            task_manager.create_task(f"Tâche {(i * 7) % 30:02d}", "paire" if i % 2 == 0 else "")
+
+        result = task_manager.search_tasks("paire", page=2, page_size=5, sort="title", order="desc")
+
+        assert [task["title"] for task in result["tasks"]] == [f"Tâche {n:02d}" for n in (18, 16, 14, 12, 10)]
@@ -0,0 +1,98 @@
+# test_task_manager_status.py - Tests pour l'index par statut
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.indexes import StatusIndex
+
+@pytest.fixture(params=["json", "stream", "sqlite"])
+def task_manager(request, tmp_path):
+    """Gestionnaire sur chacun des moteurs de stockage"""
+    storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+    yield TaskManager(storage=storage)
+    storage.close()
+
+def populate(task_manager):
+    """Crée six tâches : 1, 4 en cours ; 2, 5 terminées ; 3, 6 à faire"""
+    for i in range(1, 7):
+        task_manager.create_task(f"Tâche {i}", "projet" if i % 2 else "")
+    task_manager.change_tasks_status([1, 4], "ONGOING")
+    task_manager.change_tasks_status([2, 5], "DONE")
+
+class TestStatusFilter:
+    """Tests pour le filtre par statut de get_tasks et search_tasks"""
+
+    def test_get_tasks_filters_by_status(self, task_manager):
+        """Test que la liste ne contient que les tâches du statut demandé, dans l'ordre d'insertion"""
+        populate(task_manager)
+
+        result = task_manager.get_tasks(status="ONGOING")
+        assert [task["id"] for task in result["tasks"]] == [1, 4]
+        assert result["pagination"]["total_tasks"] == 2
+
+    def test_filtered_pages(self, task_manager):
+        """Test que la pagination s'applique aux tâches filtrées"""
+        populate(task_manager)
+
+        result = task_manager.get_tasks(page=2, page_size=1, status="DONE")
+        assert [task["id"] for task in result["tasks"]] == [5]
+        assert result["pagination"]["total_pages"] == 2
+
+    def test_search_combines_query_and_status(self, task_manager):
+        """Test que la recherche combine mots-clés et statut"""
+        populate(task_manager)
+
+        result = task_manager.search_tasks("projet", status="TODO")
+        assert [task["id"] for task in result["tasks"]] == [3]
+
+    def test_status_counts_in_pagination(self, task_manager):
+        """Test que la pagination contient le nombre de tâches par statut"""
+        populate(task_manager)
+        task_manager.delete_task(6)
+
+        counts = task_manager.get_tasks(status="DONE")["pagination"]["status_counts"]
+        assert counts == {"TODO": 1, "ONGOING": 2, "DONE": 2}
+
+    def test_invalid_status_filter(self, task_manager):
+        """Test qu'un statut de filtre invalide est refusé"""
+        with pytest.raises(ValueError, match="Invalid status"):
+            task_manager.get_tasks(status="LATER")
+
+class TestStatusIndex:
+    """Tests pour la mise à jour de l'index par statut"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.task_manager = TaskManager(data_file=str(tmp_path / "tasks.json"))
+        populate(self.task_manager)
+
+    def test_status_change_keeps_insertion_order(self):
+        """Test qu'une tâche qui change de statut garde sa place dans la liste filtrée"""
+        self.task_manager.change_task_status(6, "ONGOING")
+        self.task_manager.change_task_status(1, "TODO")
+        self.task_manager.change_task_status(1, "ONGOING")
+
+        result = self.task_manager.get_tasks(status="ONGOING")
+        assert [task["id"] for task in result["tasks"]] == [1, 4, 6]
+
+    def test_rollback_restores_counts(self):
+        """Test que l'annulation d'une transaction restaure les comptages"""
+        with pytest.raises(RuntimeError):
+            with self.task_manager.transaction():
+                self.task_manager.change_tasks_status([3, 6], "DONE")
+                raise RuntimeError("échec")
+
+        assert self.task_manager.get_status_counts() == {"TODO": 2, "ONGOING": 2, "DONE": 2}
+
+    def test_unit_remove(self):
+        """Test que la suppression retire la tâche de son statut"""
+        index = StatusIndex()
+        index.add(1, "TODO")
+        index.add(2, "TODO")
+        index.remove(1)
+
+        assert index.count("TODO") == 1
+        assert index.ids("TODO") == [2]
+        assert index.count("DONE") == 0
@@ -0,0 +1,89 @@
+# test_task_manager_storage.py - Tests pour les moteurs de stockage
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src.storage import JsonStorage, SqliteStorage
+
+class TestSqliteStorage:
+    """Tests pour le moteur SQLite"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.db_file = str(tmp_path / "tasks.db")
+        self.storage = SqliteStorage(self.db_file)
+        self.task_manager = TaskManager(storage=self.storage)
+        yield
+        self.storage.close()
+
+    def test_crud_operations_are_persisted(self):
+        """Test que création, modification, statut et suppression sont persistés en base"""
+        task1 = self.task_manager.create_task("Tâche 1", "Description")
+        task2 = self.task_manager.create_task("Tâche 2")
+        self.task_manager.update_task(task1["id"], title="Tâche 1 modifiée")
+        self.task_manager.change_task_status(task1["id"], "DONE")
+        self.task_manager.delete_task(task2["id"])
+
+        reopened = SqliteStorage(self.db_file)
+        task = TaskManager(storage=reopened).get_task_by_id(task1["id"])
+        reopened.close()
+        assert task["title"] == "Tâche 1 modifiée"
+        assert task["status"] == "DONE"
+        assert task["description"] == "Description"
+
+    def test_pagination_uses_insertion_order(self):
+        """Test que la pagination suit l'ordre d'insertion, même après modification"""
+        for i in range(25):
+            self.task_manager.create_task(f"Tâche {i + 1}")
+        self.task_manager.update_task(1, title="Première tâche")
+
+        result = self.task_manager.get_tasks(page=3, page_size=10)
+        assert [task["id"] for task in result["tasks"]] == [21, 22, 23, 24, 25]
+        assert result["pagination"]["total_pages"] == 3
+        assert result["pagination"]["total_tasks"] == 25
+        assert self.task_manager.get_tasks(page=1, page_size=1)["tasks"][0]["title"] == "Première tâche"
+
+    def test_search_is_case_insensitive(self):
+        """Test que la recherche SQL garde la sémantique insensible à la casse, accents compris"""
+        self.task_manager.create_task("Écrire le rapport")
+        self.task_manager.create_task("Projet Python", "Développer une application")
+        self.task_manager.create_task("PROJET Web")
+
+        assert self.task_manager.search_tasks("écrire")["pagination"]["total_tasks"] == 1
+        result = self.task_manager.search_tasks("projet", page=2, page_size=1)
+        assert [task["title"] for task in result["tasks"]] == ["PROJET Web"]
+        assert result["pagination"]["total_tasks"] == 2
+
+    def test_ids_continue_after_reopen(self):
+        """Test que le compteur d'IDs repart du plus grand ID en base"""
+        self.task_manager.create_task("Tâche 1")
+        self.task_manager.create_task("Tâche 2")
+
+        reopened = SqliteStorage(self.db_file)
+        task = TaskManager(storage=reopened).create_task("Tâche 3")
+        reopened.close()
+        assert task["id"] == 3
+
+    def test_wal_mode_and_indexes(self):
+        """Test que la base est en mode WAL avec les index attendus"""
+        conn = self.storage._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(tasks)")}
+        assert {"idx_tasks_status", "idx_tasks_created_at"} <= indexes
+
+class TestCreateStorage:
+    """Tests pour la fabrique de moteurs de stockage"""
+
+    def test_known_storages(self, tmp_path):
+        """Test que la fabrique crée les moteurs connus"""
+        assert isinstance(create_storage("json", str(tmp_path / "tasks.json")), JsonStorage)
+        storage = create_storage("sqlite", str(tmp_path / "tasks.db"))
+        assert isinstance(storage, SqliteStorage)
+        storage.close()
+
+    def test_unknown_storage_error(self):
+        """Test qu'un moteur inconnu lève une erreur"""
+        with pytest.raises(ValueError, match="Invalid storage"):
+            create_storage("csv")
@@ -0,0 +1,133 @@
+# test_task_manager_stream.py - Tests pour le chargement et la pagination en flux
+import sys
+import os
+import io
+import json
+import tracemalloc
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.storage import JsonStreamStorage, iter_json_array
+
+def make_tasks(count):
+    return [
+        {"id": i, "title": f"Tâche {i}", "description": "Projet client" if i % 10 == 0 else "Routine",
+         "status": "TODO", "created_at": "2025-07-01T13:40:13.251700"}
+        for i in range(1, count + 1)
+    ]
+
+class CountingStreamStorage(JsonStreamStorage):
+    """Stockage en flux qui compte les tâches lues"""
+
+    read = 0
+
+    def iter_tasks(self):
+        for task in super().iter_tasks():
+            self.read += 1
+            yield task
+
+class TestIterJsonArray:
+    """Tests pour l'analyseur de tableau JSON incrémental"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_parses_any_chunk_size(self, chunk_size):
+        """Test que le découpage en blocs ne change pas le résultat"""
+        tasks = make_tasks(5)
+        text = json.dumps(tasks, ensure_ascii=False, indent=2)
+
+        assert list(iter_json_array(io.StringIO(text), chunk_size)) == tasks
+
+    def test_empty_array_and_empty_file(self):
+        """Test qu'un tableau vide ou un fichier vide ne produisent aucune tâche"""
+        assert list(iter_json_array(io.StringIO("[]"))) == []
+        assert list(iter_json_array(io.StringIO(""))) == []
+
+    def test_truncated_array_error(self):
+        """Test qu'un tableau tronqué lève une erreur de décodage"""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO('[{"id": 1}, {"id"'), 4))
+
+class TestStreamStorage:
+    """Tests pour le moteur JSON en flux"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(make_tasks(100), f, ensure_ascii=False, indent=2)
+        self.storage = CountingStreamStorage(self.data_file)
+        self.task_manager = TaskManager(storage=self.storage)
+
+    def test_page_stops_once_filled(self):
+        """Test que la lecture s'arrête une fois la page remplie (comptage en cache)"""
+        self.task_manager.get_tasks(page=1, page_size=10)
+        self.storage.read = 0
+
+        result = self.task_manager.get_tasks(page=2, page_size=10)
+
+        assert [task["id"] for task in result["tasks"]] == list(range(11, 21))
+        assert result["pagination"]["total_tasks"] == 100
+        assert self.storage.read == 20
+
+    def test_search_filters_in_stream(self):
+        """Test que la recherche filtre en flux avec la pagination habituelle"""
+        result = self.task_manager.search_tasks("CLIENT", page=2, page_size=3)
+
+        assert [task["id"] for task in result["tasks"]] == [40, 50, 60]
+        assert result["pagination"]["total_tasks"] == 10
+        assert result["pagination"]["total_pages"] == 4
+
+    def test_mutations_are_streamed_back_to_file(self):
+        """Test que les mutations réécrivent le fichier dans le format habituel"""
+        self.task_manager.update_task(1, title="Première")
+        self.task_manager.delete_task(2)
+        task = self.task_manager.create_task("Nouvelle")
+
+        assert task["id"] == 101
+        with open(self.data_file, encoding='utf-8') as f:
+            content = f.read()
+        tasks = json.loads(content)
+        assert content == json.dumps(tasks, ensure_ascii=False, indent=2)
+        assert [t["id"] for t in tasks[:2]] == [1, 3]
+        assert tasks[0]["title"] == "Première"
+        assert tasks[-1]["title"] == "Nouvelle"
+
+    def test_journal_is_overlaid_while_streaming(self):
+        """Test que le journal est superposé au fichier pendant la lecture"""
+        task_manager = TaskManager(storage=JsonStreamStorage(self.data_file, journal=True))
+        task_manager.change_task_status(5, "DONE")
+        task_manager.delete_task(6)
+        task_manager.create_task("Journalisée")
+
+        result = task_manager.get_tasks(page=1, page_size=6)
+        assert [task["id"] for task in result["tasks"]] == [1, 2, 3, 4, 5, 7]
+        assert result["tasks"][4]["status"] == "DONE"
+        assert task_manager.get_tasks(page=100, page_size=1)["tasks"][0]["title"] == "Journalisée"
+        assert len(TaskManager(data_file=self.data_file).tasks) == 100
+
+    def test_transaction_rollback_discards_pending_changes(self):
+        """Test qu'une transaction annulée n'écrit rien"""
+        with pytest.raises(RuntimeError):
+            with self.task_manager.transaction():
+                self.task_manager.delete_task(1)
+                assert self.task_manager.get_tasks()["pagination"]["total_tasks"] == 99
+                raise RuntimeError("abandon")
+
+        assert self.task_manager.get_task_by_id(1)["id"] == 1
+
+    def test_peak_memory_bounded_by_page(self, tmp_path):
+        """Test que la mémoire de pointe dépend de la page et non du fichier"""
+        big_file = str(tmp_path / "big.json")
+        with open(big_file, 'w', encoding='utf-8') as f:
+            json.dump(make_tasks(5000), f, ensure_ascii=False, indent=2)
+
+        tracemalloc.start()
+        TaskManager(data_file=big_file).get_tasks(page=1, page_size=20)
+        full_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        TaskManager(storage=JsonStreamStorage(big_file)).get_tasks(page=1, page_size=20)
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert stream_peak * 5 < full_peak
@@ -0,0 +1,171 @@
+# test_task_manager_threads.py - Tests pour le mode multi-thread
+import sys
+import os
+import random
+import threading
+import time
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager, create_storage
+from src import locking
+from src.locking import ReadWriteLock
+
+STATUSES = ["TODO", "ONGOING", "DONE"]
+
+def run_threads(targets):
+    """Lance les fonctions dans des threads et retourne les erreurs levées"""
+    errors = []
+
+    def guarded(target):
+        try:
+            target()
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+class TestThreadSafeTaskManager:
+    """Tests de charge avec de nombreux threads lecteurs et rédacteurs"""
+
+    @pytest.fixture(params=["json", "sqlite"])
+    def task_manager(self, request, tmp_path, monkeypatch):
+        # Sans verrou de fichier (comme sous Windows), seul le verrou entre threads protège les tâches
+        monkeypatch.setattr(locking, "fcntl", None)
+        storage = create_storage(request.param, str(tmp_path / f"tasks.{request.param}"))
+        yield TaskManager(storage=storage, thread_safe=True, search_index=True)
+        storage.close()
+
+    def test_stress_keeps_invariants(self, task_manager):
+        """Test que lectures et mutations concurrentes laissent des pages et des index cohérents"""
+        for i in range(20):
+            task_manager.create_task(f"Tâche initiale {i}")
+
+        def writer(seed):
+            def run():
+                rng = random.Random(seed)
+                for i in range(30):
+                    action = rng.random()
+                    task_id = rng.randint(1, 20 + 8 * 30)
+                    try:
+                        if action < 0.4:
+                            task_manager.create_task(f"Tâche {seed}-{i}", "projet" if i % 2 else "")
+                        elif action < 0.6:
+                            task_manager.update_task(task_id, title=f"Modifiée {seed}-{i}")
+                        elif action < 0.85:
+                            task_manager.change_task_status(task_id, rng.choice(STATUSES))
+                        else:
+                            task_manager.delete_task(task_id)
+                    except ValueError as e:
+                        assert str(e) == "Task not found"
+            return run
+
+        def reader(seed):
+            def run():
+                rng = random.Random(seed)
+                for _ in range(40):
+                    result = task_manager.get_tasks(page=rng.randint(1, 3), page_size=10,
+                                                    status=rng.choice(STATUSES + [None]))
+                    ids = [task["id"] for task in result["tasks"]]
+                    assert ids == sorted(set(ids))
+                    if result["pagination"]["total_pages"] >= 1 and rng.random() < 0.5:
+                        unfiltered = task_manager.get_tasks(page_size=10)["pagination"]
+                        assert unfiltered["total_tasks"] == sum(unfiltered["status_counts"].values())
+                    found = task_manager.search_tasks("projet", page_size=50)
+                    assert all("projet" in task["description"] for task in found["tasks"])
+            return run
+
+        errors = run_threads([writer(seed) for seed in range(8)] + [reader(seed) for seed in range(8)])
+
+        assert errors == []
+        tasks = task_manager.tasks
+        assert len({task["id"] for task in tasks}) == len(tasks)
+        counts = task_manager.get_status_counts()
+        assert counts == {status: sum(task["status"] == status for task in tasks) for status in STATUSES}
+        assert task_manager.get_tasks(page_size=1000)["tasks"] == tasks
+
+    def test_concurrent_creates_get_unique_ids(self, task_manager):
+        """Test que des créations concurrentes reçoivent des IDs distincts"""
+        created = []
+
+        def create():
+            for i in range(25):
+                created.append(task_manager.create_task(f"Tâche {i}")["id"])
+
+        assert run_threads([create] * 8) == []
+        assert sorted(created) == list(range(1, 201))
+
+    def test_transaction_of_another_thread_is_not_nested(self, task_manager):
+        """Test qu'une transaction ouverte pendant celle d'un autre thread l'attend et s'annule seule"""
+        first_open = threading.Event()
+        second_started = threading.Event()
+
+        def first():
+            with task_manager.transaction():
+                task_manager.create_task("A1")
+                first_open.set()
+                second_started.wait(5)
+                time.sleep(0.05)
+
+        def second():
+            first_open.wait(5)
+            second_started.set()
+            with pytest.raises(RuntimeError):
+                with task_manager.transaction():
+                    task_manager.create_task("B1")
+                    raise RuntimeError("échec")
+
+        assert run_threads([first, second]) == []
+        assert [task["title"] for task in task_manager.tasks] == ["A1"]
+        assert [task["title"] for task in task_manager.storage.load()] == ["A1"]
+
+class TestReadWriteLock:
+    """Tests unitaires de ReadWriteLock"""
+
+    def test_readers_run_in_parallel(self):
+        """Test que plusieurs lecteurs tiennent le verrou en même temps"""
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.read():
+                barrier.wait()
+
+        assert run_threads([read] * 3) == []
+
+    def test_writer_excludes_readers(self):
+        """Test qu'un rédacteur n'est jamais actif en même temps qu'un autre thread"""
+        lock = ReadWriteLock()
+        active = {"readers": 0, "writers": 0}
+        violations = []
+        guard = threading.Lock()
+
+        def enter(kind):
+            with guard:
+                active[kind] += 1
+                if active["writers"] > 1 or (active["writers"] and active["readers"]):
+                    violations.append(dict(active))
+
+        def leave(kind):
+            with guard:
+                active[kind] -= 1
+
+        def read():
+            for _ in range(200):
+                with lock.read():
+                    enter("readers")
+                    leave("readers")
+
+        def write():
+            for _ in range(200):
+                with lock.write():
+                    enter("writers")
+                    leave("writers")
+
+        assert run_threads([read, read, write, write]) == []
+        assert violations == []
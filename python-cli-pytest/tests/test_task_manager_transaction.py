@@ -0,0 +1,114 @@
+# test_task_manager_transaction.py - Tests pour les transactions (sauvegarde différée)
+import sys
+import os
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.task_manager import TaskManager
+from src.storage import JsonStorage, SqliteStorage
+
+class CountingStorage(JsonStorage):
+    """Stockage JSON qui compte les écritures"""
+
+    def __init__(self, path, journal=False):
+        super().__init__(path, journal)
+        self.writes = 0
+
+    def save(self, tasks):
+        self.writes += 1
+        super().save(tasks)
+
+    def apply(self, changes, snapshot):
+        if self.journal:
+            self.writes += 1
+        super().apply(changes, snapshot)
+
+class TestTransaction:
+    """Tests pour le gestionnaire de contexte transaction()"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.data_file = str(tmp_path / "tasks.json")
+        self.storage = CountingStorage(self.data_file)
+        self.task_manager = TaskManager(storage=self.storage)
+        self.task = self.task_manager.create_task("Tâche", "Description")
+        self.storage.writes = 0
+
+    def test_mutations_are_saved_once(self):
+        """Test que plusieurs modifications dans une transaction ne coûtent qu'une écriture"""
+        with self.task_manager.transaction():
+            self.task_manager.update_task(self.task["id"], title="Nouveau titre")
+            self.task_manager.change_task_status(self.task["id"], "ONGOING")
+            self.task_manager.create_task("Autre tâche")
+            assert self.storage.writes == 0
+
+        assert self.storage.writes == 1
+        reloaded = TaskManager(data_file=self.data_file)
+        assert reloaded.get_task_by_id(self.task["id"])["title"] == "Nouveau titre"
+        assert reloaded.get_task_by_id(self.task["id"])["status"] == "ONGOING"
+        assert len(reloaded.tasks) == 2
+
+    def test_exception_rolls_back_all_mutations(self):
+        """Test qu'une exception annule toutes les modifications du bloc"""
+        other = self.task_manager.create_task("Autre tâche")
+        self.storage.writes = 0
+
+        with pytest.raises(ValueError, match="Invalid status"):
+            with self.task_manager.transaction():
+                self.task_manager.update_task(self.task["id"], title="Titre provisoire")
+                self.task_manager.delete_task(other["id"])
+                self.task_manager.create_task("Tâche provisoire")
+                self.task_manager.change_task_status(self.task["id"], "INVALID")
+
+        assert self.storage.writes == 0
+        assert [task["title"] for task in self.task_manager.tasks] == ["Tâche", "Autre tâche"]
+        assert self.task["title"] == "Tâche"
+        assert self.task_manager.create_task("Suivante")["id"] == 3
+
+    def test_nested_transactions_join_outer(self):
+        """Test qu'une transaction imbriquée n'écrit qu'à la fin de la transaction englobante"""
+        with self.task_manager.transaction():
+            with self.task_manager.transaction():
+                self.task_manager.create_task("Imbriquée")
+            assert self.storage.writes == 0
+
+        assert self.storage.writes == 1
+
+    def test_journal_receives_one_record_per_task(self):
+        """Test qu'en mode journalisé les mutations d'une tâche sont fusionnées"""
+        storage = CountingStorage(self.data_file, journal=True)
+        task_manager = TaskManager(storage=storage)
+
+        with task_manager.transaction():
+            task_manager.update_task(self.task["id"], title="Titre 1")
+            task_manager.update_task(self.task["id"], title="Titre 2")
+
+        with open(storage.journal_file, encoding='utf-8') as f:
+            assert len(f.readlines()) == 1
+        assert storage.writes == 1
+
+class TestSqliteTransaction:
+    """Tests pour les transactions avec le moteur SQLite"""
+
+    def test_rollback_and_commit(self, tmp_path):
+        """Test que la transaction SQLite est validée ou annulée d'un bloc"""
+        storage = SqliteStorage(str(tmp_path / "tasks.db"))
+        task_manager = TaskManager(storage=storage)
+        task = task_manager.create_task("Tâche")
+
+        with pytest.raises(RuntimeError):
+            with task_manager.transaction():
+                task_manager.update_task(task["id"], title="Provisoire")
+                assert task_manager.get_task_by_id(task["id"])["title"] == "Provisoire"
+                raise RuntimeError("abandon")
+        assert task_manager.get_task_by_id(task["id"])["title"] == "Tâche"
+
+        with task_manager.transaction():
+            task_manager.update_task(task["id"], title="Définitif")
+            task_manager.change_task_status(task["id"], "DONE")
+        storage.close()
+
+        reopened = SqliteStorage(str(tmp_path / "tasks.db"))
+        task = TaskManager(storage=reopened).get_task_by_id(task["id"])
+        reopened.close()
+        assert (task["title"], task["status"]) == ("Définitif", "DONE")